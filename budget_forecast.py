@@ -264,81 +264,81 @@ async def run_forecast(month: str = None, pdf: bool = False, use_local_budget: b
 
     # Login
     console.print("[dim]Logging in to Monarch Money...[/dim]")
-    client = MonarchClient()
-    await client.login(use_saved_session=True)
-    console.print("[green]✓[/green] Login successful")
-
-    # Get starting cash balance (aggregate snapshot for start of month)
-    console.print("[dim]Fetching starting cash balance...[/dim]")
-    snapshots = await client.get_aggregate_snapshots(
-        start_date=start_date,
-        end_date=start_date,
-        account_type='depository'
-    )
+    async with MonarchClient() as client:
+        await client.login(use_saved_session=True)
+        console.print("[green]✓[/green] Login successful")
 
-    snapshot_list = snapshots.get('aggregateSnapshots', [])
-    if snapshot_list:
-        starting_cash = snapshot_list[0].get('balance', 0)
-    else:
-        # Try to get from previous day if no snapshot for start
-        from datetime import timedelta
-        prev_day = start_date - timedelta(days=1)
+        # Get starting cash balance (aggregate snapshot for start of month)
+        console.print("[dim]Fetching starting cash balance...[/dim]")
         snapshots = await client.get_aggregate_snapshots(
-            start_date=prev_day,
-            end_date=prev_day,
+            start_date=start_date,
+            end_date=start_date,
             account_type='depository'
         )
-        snapshot_list = snapshots.get('aggregateSnapshots', [])
-        starting_cash = snapshot_list[0].get('balance', 0) if snapshot_list else 0
-
-    console.print(f"[green]✓[/green] Starting cash: {format_currency(starting_cash)}")
 
-    # Get budget data - either from API or local file
-    if use_local_budget:
-        # Try month-specific budget first, then fall back to custom_budget.json
-        month_budget = load_month_budget(month_key)
-        if month_budget:
-            console.print(f"[dim]Loading budget from budgets/{month_key}.json...[/dim]")
-            budget = convert_custom_budget(month_budget)
-            console.print(f"[green]✓[/green] Loaded month budget: {len(budget['income_categories'])} income, "
-                          f"{len(budget['expense_categories'])} expense categories")
+        snapshot_list = snapshots.get('aggregateSnapshots', [])
+        if snapshot_list:
+            starting_cash = snapshot_list[0].get('balance', 0)
         else:
-            console.print("[dim]Loading custom budget from custom_budget.json...[/dim]")
-            try:
-                custom_budget = load_custom_budget()
-                budget = convert_custom_budget(custom_budget)
-                console.print(f"[green]✓[/green] Loaded custom budget: {len(budget['income_categories'])} income, "
-                              f"{len(budget['expense_categories'])} expense categories")
-            except FileNotFoundError:
-                console.print("[red]Error: No budget found![/red]")
-                console.print(f"[dim]Create budgets/{month_key}.json or custom_budget.json[/dim]")
-                return
-    else:
-        console.print("[dim]Fetching budget data...[/dim]")
-        budget_data = await client.get_budget_data(month_key)
-        budget = parse_budget_data(budget_data)
-        console.print(f"[green]✓[/green] Found {len(budget['income_categories'])} income, "
-                      f"{len(budget['expense_categories'])} expense categories")
-    console.print()
-
-    # Display forecast
-    display_forecast(console, budget, starting_cash, month_str)
-
-    # Generate PDF if requested
-    if pdf:
-        from pathlib import Path
-        output_dir = Path("output")
-        output_dir.mkdir(exist_ok=True)
+            # Try to get from previous day if no snapshot for start
+            from datetime import timedelta
+            prev_day = start_date - timedelta(days=1)
+            snapshots = await client.get_aggregate_snapshots(
+                start_date=prev_day,
+                end_date=prev_day,
+                account_type='depository'
+            )
+            snapshot_list = snapshots.get('aggregateSnapshots', [])
+            starting_cash = snapshot_list[0].get('balance', 0) if snapshot_list else 0
+
+        console.print(f"[green]✓[/green] Starting cash: {format_currency(starting_cash)}")
+
+        # Get budget data - either from API or local file
         if use_local_budget:
-            pdf_filename = f"budget_forecast_custom_{month_key}.pdf"
+            # Try month-specific budget first, then fall back to custom_budget.json
+            month_budget = load_month_budget(month_key)
+            if month_budget:
+                console.print(f"[dim]Loading budget from budgets/{month_key}.json...[/dim]")
+                budget = convert_custom_budget(month_budget)
+                console.print(f"[green]✓[/green] Loaded month budget: {len(budget['income_categories'])} income, "
+                              f"{len(budget['expense_categories'])} expense categories")
+            else:
+                console.print("[dim]Loading custom budget from custom_budget.json...[/dim]")
+                try:
+                    custom_budget = load_custom_budget()
+                    budget = convert_custom_budget(custom_budget)
+                    console.print(f"[green]✓[/green] Loaded custom budget: {len(budget['income_categories'])} income, "
+                                  f"{len(budget['expense_categories'])} expense categories")
+                except FileNotFoundError:
+                    console.print("[red]Error: No budget found![/red]")
+                    console.print(f"[dim]Create budgets/{month_key}.json or custom_budget.json[/dim]")
+                    return
         else:
-            pdf_filename = f"budget_forecast_{month_key}.pdf"
-        pdf_filepath = output_dir / pdf_filename
-
+            console.print("[dim]Fetching budget data...[/dim]")
+            budget_data = await client.get_budget_data(month_key)
+            budget = parse_budget_data(budget_data)
+            console.print(f"[green]✓[/green] Found {len(budget['income_categories'])} income, "
+                          f"{len(budget['expense_categories'])} expense categories")
         console.print()
-        console.print("[dim]Generating PDF report...[/dim]")
-        generate_forecast_pdf(str(pdf_filepath), budget, starting_cash, month_str)
-        console.print(f"[green]✓[/green] PDF saved to: {pdf_filepath}")
+
+        # Display forecast
+        display_forecast(console, budget, starting_cash, month_str)
+
+        # Generate PDF if requested
+        if pdf:
+            from pathlib import Path
+            output_dir = Path("output")
+            output_dir.mkdir(exist_ok=True)
+            if use_local_budget:
+                pdf_filename = f"budget_forecast_custom_{month_key}.pdf"
+            else:
+                pdf_filename = f"budget_forecast_{month_key}.pdf"
+            pdf_filepath = output_dir / pdf_filename
+
+            console.print()
+            console.print("[dim]Generating PDF report...[/dim]")
+            generate_forecast_pdf(str(pdf_filepath), budget, starting_cash, month_str)
+            console.print(f"[green]✓[/green] PDF saved to: {pdf_filepath}")
 
 
 def main():
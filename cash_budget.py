@@ -26,12 +26,6 @@ from monarch_budgeting.budget_pdf import BudgetPDFReport
 from monarch_budgeting.utils import parse_month, get_previous_month_range
 
 
-async def fetch_categories(client: MonarchClient) -> dict:
-    """Fetch and parse categories from API."""
-    raw_categories = await client.get_transaction_categories()
-    return parse_categories(raw_categories)
-
-
 def parse_cash_balances(snapshots: dict, start_date: datetime, end_date: datetime) -> dict:
     """
     Parse cash balance snapshots to get month start and end balances.
@@ -95,120 +89,111 @@ async def run_cash_budget(month: str = None, save: bool = False, pdf: bool = Fal
 
     # Login
     console.print("[dim]Logging in to Monarch Money...[/dim]")
-    client = MonarchClient()
-    await client.login(use_saved_session=True)
-    console.print("[green]✓[/green] Login successful")
-
-    # Fetch accounts
-    console.print("[dim]Fetching accounts...[/dim]")
-    accounts = await client.get_accounts()
-    console.print(f"[green]✓[/green] Found {len(accounts)} accounts")
-
-    # Show cash accounts for debugging
-    cash_account_types = ('cash', 'checking', 'savings', 'depository')
-    cash_accounts = [acc for acc in accounts if acc.get('type', {}).get('name') in cash_account_types]
-    console.print(f"[dim]Cash accounts ({len(cash_accounts)}):[/dim]")
-    for acc in cash_accounts:
-        acc_type = acc.get('type', {}).get('name', 'unknown')
-        balance = acc.get('currentBalance', 0)
-        console.print(f"[dim]  - {acc.get('displayName')}: ${balance:,.2f} ({acc_type})[/dim]")
-
-    # Fetch categories
-    console.print("[dim]Fetching categories...[/dim]")
-    categories = await fetch_categories(client)
-    console.print(f"[green]✓[/green] Found {len(categories)} categories")
-
-    # Fetch transactions
-    console.print(f"[dim]Fetching transactions for {month_str}...[/dim]")
-    transactions = await client.get_transactions(
-        start_date=start_date,
-        end_date=end_date,
-        limit=2000
-    )
-    console.print(f"[green]✓[/green] Found {len(transactions)} transactions")
-    console.print()
+    async with MonarchClient() as client:
+        await client.login(use_saved_session=True)
+        console.print("[green]✓[/green] Login successful")
+
+        # Accounts, categories, transactions and cash balance snapshots
+        # (cash/checking/savings accounts) are independent; fetch them together
+        console.print(f"[dim]Fetching accounts, categories, transactions and balances for {month_str}...[/dim]")
+        (accounts, raw_categories, transactions), snapshots = await asyncio.gather(
+            client.fetch_report_inputs(start_date, end_date, minimal=True),
+            client.get_aggregate_snapshots(
+                start_date=start_date,
+                end_date=end_date,
+                account_type='depository'
+            )
+        )
+        categories = parse_categories(raw_categories)
+        console.print(f"[green]✓[/green] Found {len(accounts)} accounts")
 
-    # Fetch cash balance snapshots for the month
-    console.print(f"[dim]Fetching cash balance snapshots...[/dim]")
-    snapshots = await client.get_aggregate_snapshots(
-        start_date=start_date,
-        end_date=end_date,
-        account_type='depository'  # Cash/checking/savings accounts
-    )
-    cash_balances = parse_cash_balances(snapshots, start_date, end_date)
-    console.print(f"[green]✓[/green] Got balance snapshots")
-    console.print()
+        # Show cash accounts for debugging
+        cash_account_types = ('cash', 'checking', 'savings', 'depository')
+        cash_accounts = [acc for acc in accounts if acc.get('type', {}).get('name') in cash_account_types]
+        console.print(f"[dim]Cash accounts ({len(cash_accounts)}):[/dim]")
+        for acc in cash_accounts:
+            acc_type = acc.get('type', {}).get('name', 'unknown')
+            balance = acc.get('currentBalance', 0)
+            console.print(f"[dim]  - {acc.get('displayName')}: ${balance:,.2f} ({acc_type})[/dim]")
 
-    # Analyze
-    analyzer = CashBudgetAnalyzer(transactions, accounts, categories)
-    metrics = analyzer.calculate_top_level_metrics()
-    income = analyzer.get_income_breakdown()
-    expenses = analyzer.get_expense_breakdown()
-
-    # Display
-    display.display_full_budget(metrics, income, expenses, cash_balances, month=month_str)
-
-    # Save text file if requested
-    if save:
-        output_dir = Path("output")
-        output_dir.mkdir(exist_ok=True)
-        filename = f"cash_budget_{start_date.strftime('%Y%m')}.txt"
-        filepath = output_dir / filename
-
-        # Export to file using rich's export
-        with open(filepath, 'w') as f:
-            from rich.console import Console
-            file_console = Console(file=f, force_terminal=True, width=100)
-            file_display = BudgetDisplay()
-            file_display.console = file_console
-            file_display.display_full_budget(metrics, income, expenses, cash_balances, month=month_str)
-
-        console.print(f"[green]✓[/green] Saved to: {filepath}")
-
-    # Generate PDF if requested
-    if pdf:
+        console.print(f"[green]✓[/green] Found {len(categories)} categories")
+        console.print(f"[green]✓[/green] Found {len(transactions)} transactions")
         console.print()
-        console.print("[dim]Fetching account histories for chart...[/dim]")
 
-        # Fetch history for each cash account
-        account_histories = {}
-        for acc in cash_accounts:
-            acc_id = acc.get('id')
-            acc_name = acc.get('displayName', f'Account {acc_id}')
-            try:
-                history = await client.get_account_history(acc_id)
-                account_histories[acc_name] = history
-            except Exception as e:
-                console.print(f"[yellow]Warning: Could not fetch history for {acc_name}: {e}[/yellow]")
-
-        console.print(f"[green]✓[/green] Fetched history for {len(account_histories)} accounts")
-
-        # Get transfer transactions (excluded from expense metrics)
-        transfers = analyzer.get_transfer_transactions(start_date, end_date)
-        if not transfers.empty:
-            console.print(f"[dim]Found {len(transfers)} transfer transactions (${transfers['amount'].sum():,.2f})[/dim]")
-
-        # Generate PDF
-        output_dir = Path("output")
-        output_dir.mkdir(exist_ok=True)
-        pdf_filename = f"cash_budget_{start_date.strftime('%Y%m')}.pdf"
-        pdf_filepath = output_dir / pdf_filename
-
-        console.print("[dim]Generating PDF report...[/dim]")
-        pdf_report = BudgetPDFReport()
-        pdf_report.generate_report(
-            filepath=str(pdf_filepath),
-            metrics=metrics,
-            income_df=income,
-            expense_df=expenses,
-            cash_balances=cash_balances,
-            account_histories=account_histories,
-            start_date=start_date,
-            end_date=end_date,
-            month=month_str,
-            transfers_df=transfers
-        )
-        console.print(f"[green]✓[/green] PDF saved to: {pdf_filepath}")
+        cash_balances = parse_cash_balances(snapshots, start_date, end_date)
+        console.print(f"[green]✓[/green] Got balance snapshots")
+        console.print()
+
+        # Analyze
+        analyzer = CashBudgetAnalyzer(transactions, accounts, categories)
+        metrics = analyzer.calculate_top_level_metrics()
+        income = analyzer.get_income_breakdown()
+        expenses = analyzer.get_expense_breakdown()
+
+        # Display
+        display.display_full_budget(metrics, income, expenses, cash_balances, month=month_str)
+
+        # Save text file if requested
+        if save:
+            output_dir = Path("output")
+            output_dir.mkdir(exist_ok=True)
+            filename = f"cash_budget_{start_date.strftime('%Y%m')}.txt"
+            filepath = output_dir / filename
+
+            # Export to file using rich's export
+            with open(filepath, 'w') as f:
+                from rich.console import Console
+                file_console = Console(file=f, force_terminal=True, width=100)
+                file_display = BudgetDisplay()
+                file_display.console = file_console
+                file_display.display_full_budget(metrics, income, expenses, cash_balances, month=month_str)
+
+            console.print(f"[green]✓[/green] Saved to: {filepath}")
+
+        # Generate PDF if requested
+        if pdf:
+            console.print()
+            console.print("[dim]Fetching account histories for chart...[/dim]")
+
+            # Fetch history for each cash account
+            account_histories = {}
+            for acc in cash_accounts:
+                acc_id = acc.get('id')
+                acc_name = acc.get('displayName', f'Account {acc_id}')
+                try:
+                    history = await client.get_account_history(acc_id)
+                    account_histories[acc_name] = history
+                except Exception as e:
+                    console.print(f"[yellow]Warning: Could not fetch history for {acc_name}: {e}[/yellow]")
+
+            console.print(f"[green]✓[/green] Fetched history for {len(account_histories)} accounts")
+
+            # Get transfer transactions (excluded from expense metrics)
+            transfers = analyzer.get_transfer_transactions(start_date, end_date)
+            if not transfers.empty:
+                console.print(f"[dim]Found {len(transfers)} transfer transactions (${transfers['amount'].sum():,.2f})[/dim]")
+
+            # Generate PDF
+            output_dir = Path("output")
+            output_dir.mkdir(exist_ok=True)
+            pdf_filename = f"cash_budget_{start_date.strftime('%Y%m')}.pdf"
+            pdf_filepath = output_dir / pdf_filename
+
+            console.print("[dim]Generating PDF report...[/dim]")
+            pdf_report = BudgetPDFReport()
+            pdf_report.generate_report(
+                filepath=str(pdf_filepath),
+                metrics=metrics,
+                income_df=income,
+                expense_df=expenses,
+                cash_balances=cash_balances,
+                account_histories=account_histories,
+                start_date=start_date,
+                end_date=end_date,
+                month=month_str,
+                transfers_df=transfers
+            )
+            console.print(f"[green]✓[/green] PDF saved to: {pdf_filepath}")
 
 
 def main():
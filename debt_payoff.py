@@ -590,107 +590,107 @@ async def run_combined_debt_payoff(month: str, use_local_budget: bool, console:
 
     # Login
     console.print("[dim]Logging in to Monarch Money...[/dim]")
-    client = MonarchClient()
-    await client.login(use_saved_session=True)
-    console.print("[green]✓[/green] Login successful")
-
-    # Get all accounts
-    console.print("[dim]Fetching accounts...[/dim]")
-    accounts = await client.get_accounts()
-
-    # Get CC debt
-    cc_accounts = [
-        acc for acc in accounts
-        if acc.get('type', {}).get('name') == 'credit'
-        and (acc.get('currentBalance', 0) or 0) < 0
-        and acc.get('includeBalanceInNetWorth', False)
-    ]
-    cc_debt = sum(abs(acc.get('currentBalance', 0) or 0) for acc in cc_accounts)
-
-    # Get Loan debt
-    loan_accounts = [
-        acc for acc in accounts
-        if acc.get('type', {}).get('name') == 'loan'
-        and (acc.get('currentBalance', 0) or 0) < 0
-        and acc.get('includeBalanceInNetWorth', False)
-    ]
-    loan_debt = sum(abs(acc.get('currentBalance', 0) or 0) for acc in loan_accounts)
-
-    total_debt = cc_debt + loan_debt
-
-    console.print(f"[green]✓[/green] Found {len(cc_accounts)} credit cards with debt: {format_currency(cc_debt)}")
-    console.print(f"[green]✓[/green] Found {len(loan_accounts)} loans with debt: {format_currency(loan_debt)}")
-    console.print(f"[bold]Total Debt: {format_currency(total_debt)}[/bold]")
-    console.print()
-
-    # Get starting cash balance
-    console.print("[dim]Fetching starting cash balance...[/dim]")
-    starting_cash = await get_starting_cash(client, start_date)
-    console.print(f"[green]✓[/green] Starting cash: {format_currency(starting_cash)}")
-
-    # Get budget data
-    if use_local_budget:
-        custom_budget = load_month_budget(month_key)
-        if custom_budget:
-            console.print(f"[dim]Loading budget from budgets/{month_key}.json...[/dim]")
-            expected_income = custom_budget.get('total_income', 0)
-            expected_expenses = custom_budget.get('total_expenses', 0)
-            loan_base_payment = get_custom_budget_category_amount(custom_budget, loan_budget_category)
-        else:
-            try:
-                custom_budget = load_custom_budget()
+    async with MonarchClient() as client:
+        await client.login(use_saved_session=True)
+        console.print("[green]✓[/green] Login successful")
+
+        # Get all accounts
+        console.print("[dim]Fetching accounts...[/dim]")
+        accounts = await client.get_accounts()
+
+        # Get CC debt
+        cc_accounts = [
+            acc for acc in accounts
+            if acc.get('type', {}).get('name') == 'credit'
+            and (acc.get('currentBalance', 0) or 0) < 0
+            and acc.get('includeBalanceInNetWorth', False)
+        ]
+        cc_debt = sum(abs(acc.get('currentBalance', 0) or 0) for acc in cc_accounts)
+
+        # Get Loan debt
+        loan_accounts = [
+            acc for acc in accounts
+            if acc.get('type', {}).get('name') == 'loan'
+            and (acc.get('currentBalance', 0) or 0) < 0
+            and acc.get('includeBalanceInNetWorth', False)
+        ]
+        loan_debt = sum(abs(acc.get('currentBalance', 0) or 0) for acc in loan_accounts)
+
+        total_debt = cc_debt + loan_debt
+
+        console.print(f"[green]✓[/green] Found {len(cc_accounts)} credit cards with debt: {format_currency(cc_debt)}")
+        console.print(f"[green]✓[/green] Found {len(loan_accounts)} loans with debt: {format_currency(loan_debt)}")
+        console.print(f"[bold]Total Debt: {format_currency(total_debt)}[/bold]")
+        console.print()
+
+        # Get starting cash balance
+        console.print("[dim]Fetching starting cash balance...[/dim]")
+        starting_cash = await get_starting_cash(client, start_date)
+        console.print(f"[green]✓[/green] Starting cash: {format_currency(starting_cash)}")
+
+        # Get budget data
+        if use_local_budget:
+            custom_budget = load_month_budget(month_key)
+            if custom_budget:
+                console.print(f"[dim]Loading budget from budgets/{month_key}.json...[/dim]")
                 expected_income = custom_budget.get('total_income', 0)
                 expected_expenses = custom_budget.get('total_expenses', 0)
                 loan_base_payment = get_custom_budget_category_amount(custom_budget, loan_budget_category)
-            except FileNotFoundError:
-                console.print("[red]Error: No budget found![/red]")
-                return
-    else:
-        console.print("[dim]Fetching budget data...[/dim]")
-        budget_data = await client.get_budget_data(month_key)
-        budget = parse_budget_totals(budget_data)
-        expected_income = budget['total_income']
-        expected_expenses = budget['total_expenses']
-        loan_base_payment = get_budget_category_amount(budget_data, loan_budget_category)
-
-    monthly_surplus = starting_cash + expected_income - expected_expenses
-
-    console.print(f"[green]✓[/green] Expected income: {format_currency(expected_income)}")
-    console.print(f"[green]✓[/green] Expected expenses: {format_currency(expected_expenses)}")
-    console.print(f"[green]✓[/green] Loan base payment: {format_currency(loan_base_payment)}/month")
-    console.print(f"[bold]Monthly Surplus: {format_currency(monthly_surplus)}[/bold]")
-    console.print()
-
-    if monthly_surplus <= 0:
-        console.print("[red]Warning: No surplus available for additional debt payoff![/red]")
-        return
-
-    if total_debt <= 0:
-        console.print("[green]No debt to pay off![/green]")
-        return
-
-    # Display summary
-    display_combined_summary(
-        console, cc_debt, loan_debt, monthly_surplus, loan_base_payment,
-        start_date, cc_rate, loan_rate
-    )
-
-    # Generate plot
-    output_dir = Path("output")
-    output_dir.mkdir(exist_ok=True)
-    if use_local_budget:
-        plot_filename = f"combined_payoff_custom_{month_key}.png"
-    else:
-        plot_filename = f"combined_payoff_{month_key}.png"
-    plot_filepath = output_dir / plot_filename
+            else:
+                try:
+                    custom_budget = load_custom_budget()
+                    expected_income = custom_budget.get('total_income', 0)
+                    expected_expenses = custom_budget.get('total_expenses', 0)
+                    loan_base_payment = get_custom_budget_category_amount(custom_budget, loan_budget_category)
+                except FileNotFoundError:
+                    console.print("[red]Error: No budget found![/red]")
+                    return
+        else:
+            console.print("[dim]Fetching budget data...[/dim]")
+            budget_data = await client.get_budget_data(month_key)
+            budget = parse_budget_totals(budget_data)
+            expected_income = budget['total_income']
+            expected_expenses = budget['total_expenses']
+            loan_base_payment = get_budget_category_amount(budget_data, loan_budget_category)
+
+        monthly_surplus = starting_cash + expected_income - expected_expenses
+
+        console.print(f"[green]✓[/green] Expected income: {format_currency(expected_income)}")
+        console.print(f"[green]✓[/green] Expected expenses: {format_currency(expected_expenses)}")
+        console.print(f"[green]✓[/green] Loan base payment: {format_currency(loan_base_payment)}/month")
+        console.print(f"[bold]Monthly Surplus: {format_currency(monthly_surplus)}[/bold]")
+        console.print()
+
+        if monthly_surplus <= 0:
+            console.print("[red]Warning: No surplus available for additional debt payoff![/red]")
+            return
+
+        if total_debt <= 0:
+            console.print("[green]No debt to pay off![/green]")
+            return
+
+        # Display summary
+        display_combined_summary(
+            console, cc_debt, loan_debt, monthly_surplus, loan_base_payment,
+            start_date, cc_rate, loan_rate
+        )
 
-    console.print()
-    console.print("[dim]Generating combined payoff projection plot...[/dim]")
-    generate_combined_payoff_plot(
-        str(plot_filepath), cc_debt, loan_debt, monthly_surplus, loan_base_payment,
-        start_date, cc_rate, loan_rate
-    )
-    console.print(f"[green]✓[/green] Plot saved to: {plot_filepath}")
+        # Generate plot
+        output_dir = Path("output")
+        output_dir.mkdir(exist_ok=True)
+        if use_local_budget:
+            plot_filename = f"combined_payoff_custom_{month_key}.png"
+        else:
+            plot_filename = f"combined_payoff_{month_key}.png"
+        plot_filepath = output_dir / plot_filename
+
+        console.print()
+        console.print("[dim]Generating combined payoff projection plot...[/dim]")
+        generate_combined_payoff_plot(
+            str(plot_filepath), cc_debt, loan_debt, monthly_surplus, loan_base_payment,
+            start_date, cc_rate, loan_rate
+        )
+        console.print(f"[green]✓[/green] Plot saved to: {plot_filepath}")
 
 
 async def run_debt_payoff(month: str = None, debt_type: str = 'cc', use_local_budget: bool = False):
@@ -737,113 +737,113 @@ async def run_debt_payoff(month: str = None, debt_type: str = 'cc', use_local_bu
 
     # Login
     console.print("[dim]Logging in to Monarch Money...[/dim]")
-    client = MonarchClient()
-    await client.login(use_saved_session=True)
-    console.print("[green]✓[/green] Login successful")
-
-    # Get accounts and balances for the debt type
-    console.print(f"[dim]Fetching {type_name.lower()} accounts...[/dim]")
-    accounts = await client.get_accounts()
-    debt_accounts = [acc for acc in accounts if acc.get('type', {}).get('name') == account_type]
-
-    # Filter to accounts included in net worth with actual debt (negative balance)
-    debt_accounts_with_balance = [
-        acc for acc in debt_accounts
-        if (acc.get('currentBalance', 0) or 0) < 0
-        and acc.get('includeBalanceInNetWorth', False)
-    ]
-
-    total_debt = sum(
-        abs(acc.get('currentBalance', 0) or 0)
-        for acc in debt_accounts_with_balance
-    )
+    async with MonarchClient() as client:
+        await client.login(use_saved_session=True)
+        console.print("[green]✓[/green] Login successful")
+
+        # Get accounts and balances for the debt type
+        console.print(f"[dim]Fetching {type_name.lower()} accounts...[/dim]")
+        accounts = await client.get_accounts()
+        debt_accounts = [acc for acc in accounts if acc.get('type', {}).get('name') == account_type]
+
+        # Filter to accounts included in net worth with actual debt (negative balance)
+        debt_accounts_with_balance = [
+            acc for acc in debt_accounts
+            if (acc.get('currentBalance', 0) or 0) < 0
+            and acc.get('includeBalanceInNetWorth', False)
+        ]
+
+        total_debt = sum(
+            abs(acc.get('currentBalance', 0) or 0)
+            for acc in debt_accounts_with_balance
+        )
 
-    console.print(f"[green]✓[/green] Found {len(debt_accounts_with_balance)} {type_name.lower()} accounts with debt")
-    for acc in debt_accounts_with_balance:
-        balance = acc.get('currentBalance', 0) or 0
-        console.print(f"[dim]  - {acc.get('displayName')}: {format_currency(abs(balance))}[/dim]")
-    console.print(f"[bold]Total {type_name} Debt: {format_currency(total_debt)}[/bold]")
-    console.print()
+        console.print(f"[green]✓[/green] Found {len(debt_accounts_with_balance)} {type_name.lower()} accounts with debt")
+        for acc in debt_accounts_with_balance:
+            balance = acc.get('currentBalance', 0) or 0
+            console.print(f"[dim]  - {acc.get('displayName')}: {format_currency(abs(balance))}[/dim]")
+        console.print(f"[bold]Total {type_name} Debt: {format_currency(total_debt)}[/bold]")
+        console.print()
 
-    # Get starting cash balance
-    console.print("[dim]Fetching starting cash balance...[/dim]")
-    starting_cash = await get_starting_cash(client, start_date)
-    console.print(f"[green]✓[/green] Starting cash: {format_currency(starting_cash)}")
+        # Get starting cash balance
+        console.print("[dim]Fetching starting cash balance...[/dim]")
+        starting_cash = await get_starting_cash(client, start_date)
+        console.print(f"[green]✓[/green] Starting cash: {format_currency(starting_cash)}")
 
-    # Get budget data - either from API or local file
-    if use_local_budget:
-        # Try month-specific budget first, then fall back to custom_budget.json
-        custom_budget = load_month_budget(month_key)
-        if custom_budget:
-            console.print(f"[dim]Loading budget from budgets/{month_key}.json...[/dim]")
-            expected_income = custom_budget.get('total_income', 0)
-            expected_expenses = custom_budget.get('total_expenses', 0)
-            console.print(f"[green]✓[/green] Loaded month budget")
-        else:
-            console.print("[dim]Loading custom budget from custom_budget.json...[/dim]")
-            try:
-                custom_budget = load_custom_budget()
+        # Get budget data - either from API or local file
+        if use_local_budget:
+            # Try month-specific budget first, then fall back to custom_budget.json
+            custom_budget = load_month_budget(month_key)
+            if custom_budget:
+                console.print(f"[dim]Loading budget from budgets/{month_key}.json...[/dim]")
                 expected_income = custom_budget.get('total_income', 0)
                 expected_expenses = custom_budget.get('total_expenses', 0)
-                console.print(f"[green]✓[/green] Loaded custom budget")
-            except FileNotFoundError:
-                console.print("[red]Error: No budget found![/red]")
-                console.print(f"[dim]Create budgets/{month_key}.json or custom_budget.json[/dim]")
-                return
-    else:
-        console.print("[dim]Fetching budget data...[/dim]")
-        budget_data = await client.get_budget_data(month_key)
-        budget = parse_budget_totals(budget_data)
-        expected_income = budget['total_income']
-        expected_expenses = budget['total_expenses']
-
-    monthly_surplus = starting_cash + expected_income - expected_expenses
-
-    console.print(f"[green]✓[/green] Expected income: {format_currency(expected_income)}")
-    console.print(f"[green]✓[/green] Expected expenses: {format_currency(expected_expenses)}")
-    console.print(f"[bold]Monthly Surplus: {format_currency(monthly_surplus)}[/bold]")
-
-    # For loans, get the base payment from budget
-    base_payment = 0
-    if debt_type == 'loan':
-        if use_local_budget:
-            base_payment = get_custom_budget_category_amount(custom_budget, loan_budget_category)
+                console.print(f"[green]✓[/green] Loaded month budget")
+            else:
+                console.print("[dim]Loading custom budget from custom_budget.json...[/dim]")
+                try:
+                    custom_budget = load_custom_budget()
+                    expected_income = custom_budget.get('total_income', 0)
+                    expected_expenses = custom_budget.get('total_expenses', 0)
+                    console.print(f"[green]✓[/green] Loaded custom budget")
+                except FileNotFoundError:
+                    console.print("[red]Error: No budget found![/red]")
+                    console.print(f"[dim]Create budgets/{month_key}.json or custom_budget.json[/dim]")
+                    return
         else:
-            base_payment = get_budget_category_amount(budget_data, loan_budget_category)
-        console.print(f"[green]✓[/green] {loan_budget_category} budget: {format_currency(base_payment)}/month")
+            console.print("[dim]Fetching budget data...[/dim]")
+            budget_data = await client.get_budget_data(month_key)
+            budget = parse_budget_totals(budget_data)
+            expected_income = budget['total_income']
+            expected_expenses = budget['total_expenses']
+
+        monthly_surplus = starting_cash + expected_income - expected_expenses
+
+        console.print(f"[green]✓[/green] Expected income: {format_currency(expected_income)}")
+        console.print(f"[green]✓[/green] Expected expenses: {format_currency(expected_expenses)}")
+        console.print(f"[bold]Monthly Surplus: {format_currency(monthly_surplus)}[/bold]")
+
+        # For loans, get the base payment from budget
+        base_payment = 0
+        if debt_type == 'loan':
+            if use_local_budget:
+                base_payment = get_custom_budget_category_amount(custom_budget, loan_budget_category)
+            else:
+                base_payment = get_budget_category_amount(budget_data, loan_budget_category)
+            console.print(f"[green]✓[/green] {loan_budget_category} budget: {format_currency(base_payment)}/month")
 
-    console.print()
+        console.print()
 
-    if monthly_surplus <= 0:
-        console.print("[red]Warning: No surplus available for additional debt payoff![/red]")
-        if base_payment > 0:
-            console.print(f"[dim]You can still pay the base amount of {format_currency(base_payment)}/month.[/dim]")
-        else:
-            console.print("[dim]Consider reducing expenses or increasing income.[/dim]")
-        return
-
-    if total_debt <= 0:
-        console.print(f"[green]No {type_name.lower()} debt to pay off![/green]")
-        return
+        if monthly_surplus <= 0:
+            console.print("[red]Warning: No surplus available for additional debt payoff![/red]")
+            if base_payment > 0:
+                console.print(f"[dim]You can still pay the base amount of {format_currency(base_payment)}/month.[/dim]")
+            else:
+                console.print("[dim]Consider reducing expenses or increasing income.[/dim]")
+            return
 
-    # Display summary
-    display_summary(console, total_debt, monthly_surplus, base_payment, start_date, debt_type,
-                    annual_rate, payoff_percentages)
+        if total_debt <= 0:
+            console.print(f"[green]No {type_name.lower()} debt to pay off![/green]")
+            return
 
-    # Generate plot
-    output_dir = Path("output")
-    output_dir.mkdir(exist_ok=True)
-    if use_local_budget:
-        plot_filename = f"{debt_type}_payoff_custom_{month_key}.png"
-    else:
-        plot_filename = f"{debt_type}_payoff_{month_key}.png"
-    plot_filepath = output_dir / plot_filename
+        # Display summary
+        display_summary(console, total_debt, monthly_surplus, base_payment, start_date, debt_type,
+                        annual_rate, payoff_percentages)
 
-    console.print()
-    console.print("[dim]Generating payoff projection plot...[/dim]")
-    generate_payoff_plot(str(plot_filepath), total_debt, monthly_surplus, base_payment, start_date, debt_type,
-                         annual_rate, payoff_percentages)
-    console.print(f"[green]✓[/green] Plot saved to: {plot_filepath}")
+        # Generate plot
+        output_dir = Path("output")
+        output_dir.mkdir(exist_ok=True)
+        if use_local_budget:
+            plot_filename = f"{debt_type}_payoff_custom_{month_key}.png"
+        else:
+            plot_filename = f"{debt_type}_payoff_{month_key}.png"
+        plot_filepath = output_dir / plot_filename
+
+        console.print()
+        console.print("[dim]Generating payoff projection plot...[/dim]")
+        generate_payoff_plot(str(plot_filepath), total_debt, monthly_surplus, base_payment, start_date, debt_type,
+                             annual_rate, payoff_percentages)
+        console.print(f"[green]✓[/green] Plot saved to: {plot_filepath}")
 
 
 def main():
@@ -5,12 +5,122 @@ This module provides analysis functionality for credit card debt payoff
 and custom budgeting insights.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 from datetime import datetime
+from functools import cached_property
 import pandas as pd
 import numpy as np
 
 
+class _CardAccount(NamedTuple):
+    """The credit card account fields used by CreditCardAnalyzer."""
+    id: str
+    name: Optional[str]
+    balance: Optional[float]
+
+
+def _signed_totals_by_code(codes: np.ndarray, amounts: np.ndarray,
+                           n_groups: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sum positive and negative amounts per integer group code.
+
+    Args:
+        codes: Group index (0..n_groups-1) for each amount
+        amounts: Signed amounts
+        n_groups: Number of groups
+
+    Returns:
+        Tuple of (positive totals, absolute negative totals), one entry per group
+    """
+    positive = np.bincount(codes, weights=np.maximum(amounts, 0), minlength=n_groups)
+    negative = np.bincount(codes, weights=np.maximum(-amounts, 0), minlength=n_groups)
+    # bincount yields integer zeros for empty input; keep totals float
+    return positive.astype(np.float64, copy=False), negative.astype(np.float64, copy=False)
+
+
+def _floor_month(dates: pd.Series) -> pd.Series:
+    """
+    Floor naive datetimes to the first day of their month.
+
+    Casts through NumPy's datetime64[M] unit instead of building a Period per
+    row with dt.to_period('M').dt.to_timestamp().
+
+    Args:
+        dates: Series of naive datetimes
+
+    Returns:
+        Series of month-start timestamps with the same index and dtype
+    """
+    months = dates.to_numpy().astype('datetime64[M]').astype(dates.dtype)
+    return pd.Series(months, index=dates.index)
+
+
+def _date_order(dates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sort transaction dates once for binary-search range filtering.
+
+    Args:
+        dates: datetime64 array, one entry per transaction (NaT allowed)
+
+    Returns:
+        Tuple of (row positions in date order, dates in that order), both
+        excluding NaT since missing dates never fall inside a range
+    """
+    order = np.argsort(dates, kind='stable')
+    n_dated = len(dates) - int(np.isnat(dates).sum())
+    order = order[:n_dated]
+    return order, dates[order]
+
+
+def _date_window(order: np.ndarray, sorted_dates: np.ndarray,
+                 start_date: Optional[datetime] = None,
+                 end_date: Optional[datetime] = None) -> np.ndarray:
+    """
+    Row positions dated within [start_date, end_date] (inclusive).
+
+    Args:
+        order: Row positions in date order, from _date_order
+        sorted_dates: Dates in that order, from _date_order
+        start_date: Lower bound (optional)
+        end_date: Upper bound (optional)
+
+    Returns:
+        Matching row positions in their original order
+    """
+    lo, hi = 0, len(sorted_dates)
+    if start_date:
+        lo = np.searchsorted(sorted_dates, pd.Timestamp(start_date).to_datetime64(), side='left')
+    if end_date:
+        hi = np.searchsorted(sorted_dates, pd.Timestamp(end_date).to_datetime64(), side='right')
+    return np.sort(order[lo:hi])
+
+
+def _period_end_labels(dates: np.ndarray, frequency: str) -> Optional[np.ndarray]:
+    """
+    Label each date with the end of its period, matching pd.Grouper's bins.
+
+    Args:
+        dates: datetime64 array (NaT allowed)
+        frequency: Pandas frequency string
+
+    Returns:
+        Array of period labels in the dtype of dates, or None if the
+        frequency is not one of 'D', 'W' (weeks ending Sunday) or 'ME'
+    """
+    days = dates.astype('datetime64[D]')
+    if frequency == 'D':
+        labels = days
+    elif frequency == 'W':
+        # 1970-01-01 was a Thursday, so (days + 3) % 7 is the weekday (Monday=0)
+        weekday = (days.astype(np.int64) + 3) % 7
+        labels = days + (6 - weekday)
+    elif frequency == 'ME':
+        labels = (dates.astype('datetime64[M]') + 1).astype('datetime64[D]') - 1
+    else:
+        return None
+    return labels.astype(dates.dtype)
+
+
 class CreditCardAnalyzer:
     """Analyzer for credit card debt and spending patterns."""
 
@@ -28,6 +138,31 @@ class CreditCardAnalyzer:
             acc for acc in accounts
             if acc.get('type', {}).get('name') == 'credit'
         ]
+        # The only card fields the analysis reads, projected once; a missing
+        # or null balance counts as zero so reports can always format it
+        self._card_accounts = tuple(
+            _CardAccount(acc['id'], acc.get('displayName'), acc.get('currentBalance') or 0)
+            for acc in self.credit_card_accounts
+        )
+        # Card ids in account order, extracted once and reused by every method
+        self._cc_account_id_list = [card.id for card in self._card_accounts]
+        # Built once for O(1) membership checks in the transaction filters
+        self._cc_account_ids = frozenset(self._cc_account_id_list)
+        # Unique card ids in account order; a transaction's position here is its card slot
+        self._cc_cards = pd.Index(pd.unique(pd.Series(self._cc_account_id_list, dtype=object)))
+
+    def _summary_rows(self) -> List[Dict[str, Any]]:
+        """Build one summary dict per credit card account."""
+        return [
+            {
+                'account_id': account.get('id'),
+                'account_name': account.get('displayName'),
+                'current_balance': account.get('currentBalance', 0),
+                'display_balance': account.get('displayBalance', 0),
+                'is_asset': account.get('isAsset', False),
+            }
+            for account in self.credit_card_accounts
+        ]
 
     def get_credit_card_summary(self) -> pd.DataFrame:
         """
@@ -36,60 +171,143 @@ class CreditCardAnalyzer:
         Returns:
             DataFrame with credit card account information
         """
-        summary_data = []
-
-        for account in self.credit_card_accounts:
-            summary_data.append({
-                'account_id': account.get('id'),
-                'account_name': account.get('displayName'),
-                'current_balance': account.get('currentBalance', 0),
-                'display_balance': account.get('displayBalance', 0),
-                'is_asset': account.get('isAsset', False),
-            })
-
-        return pd.DataFrame(summary_data)
+        return pd.DataFrame(self._summary_rows())
 
     def categorize_transactions(self) -> Dict[str, pd.DataFrame]:
         """
         Categorize credit card transactions as new purchases vs. payments.
 
+        The split is computed once per analyzer; each call returns copies of
+        it, so callers may modify the DataFrames freely.
+
         Returns:
             Dictionary with 'purchases' and 'payments' DataFrames
         """
-        if not self.transactions:
-            return {'purchases': pd.DataFrame(), 'payments': pd.DataFrame()}
+        return {key: frame.copy() for key, frame in self._categorized.items()}
 
-        df = pd.DataFrame(self.transactions)
+    @cached_property
+    def _tx_df(self) -> pd.DataFrame:
+        """All transactions as a DataFrame with a flat account_id column (built once)."""
+        df = pd.DataFrame.from_records(self.transactions)
 
-        # Extract account IDs from nested account data
-        # Handle both dict and direct access patterns
-        if 'account' in df.columns:
-            df['account_id'] = df['account'].apply(
-                lambda x: x.get('id') if isinstance(x, dict) else None
-            )
-        else:
-            # If no account column, return empty DataFrames
-            return {'purchases': pd.DataFrame(), 'payments': pd.DataFrame()}
+        # Extract account IDs from nested account data in one pass over the
+        # raw records rather than a per-row Series.apply
+        accounts = (txn.get('account') for txn in self.transactions)
+        df['account_id'] = [acc.get('id') if isinstance(acc, dict) else None for acc in accounts]
+
+        # Pin amounts to a contiguous float64 buffer so masks and sums never
+        # fall back to object-dtype arithmetic (e.g. when some amounts are None)
+        if 'amount' in df.columns:
+            df['amount'] = df['amount'].astype(np.float64)
 
-        # Filter for credit card transactions
-        cc_account_ids = [acc['id'] for acc in self.credit_card_accounts]
-        cc_transactions = df[df['account_id'].isin(cc_account_ids)]
+        return df
+
+    @cached_property
+    def _cc_codes(self) -> np.ndarray:
+        """Card slot in _cc_cards for every transaction (-1 if not on a credit card)."""
+        return self._cc_cards.get_indexer(self._tx_df['account_id'])
+
+    @cached_property
+    def _is_cc(self) -> np.ndarray:
+        """Boolean mask of transactions on credit card accounts (built once)."""
+        return self._cc_codes >= 0
+
+    @cached_property
+    def _cc_transactions(self) -> pd.DataFrame:
+        """Transactions on credit card accounts (built once)."""
+        if not self.transactions or not self.credit_card_accounts:
+            return pd.DataFrame(columns=['account_id', 'amount'])
+
+        return self._tx_df[self._is_cc]
+
+    @cached_property
+    def _amounts(self) -> np.ndarray:
+        """
+        Transaction amounts as one contiguous float64 array (built once).
+
+        Missing amounts are stored as zero, matching how pandas sums skip them.
+        """
+        if not self.transactions:
+            return np.empty(0)
+        return np.nan_to_num(self._tx_df['amount'].to_numpy(dtype=np.float64))
+
+    @cached_property
+    def _cc_amounts(self) -> np.ndarray:
+        """Amounts of the transactions on credit card accounts (built once)."""
+        if not self.transactions or not self.credit_card_accounts:
+            return np.empty(0)
+        return self._amounts[self._is_cc]
+
+    @cached_property
+    def _categorized(self) -> Dict[str, pd.DataFrame]:
+        """Purchases/payments split backing categorize_transactions (built once)."""
+        cc_transactions = self._cc_transactions
+        if cc_transactions.empty:
+            return {'purchases': pd.DataFrame(), 'payments': pd.DataFrame()}
 
         # Positive amounts are payments, negative are purchases
-        # (This may need adjustment based on actual Monarch data format)
-        purchases = cc_transactions[cc_transactions['amount'] < 0].copy()
-        payments = cc_transactions[cc_transactions['amount'] > 0].copy()
+        # (This may need adjustment based on actual Monarch data format).
+        # Compare on the raw array once; boolean indexing already returns
+        # new frames, so no extra copies are needed.
+        amounts = cc_transactions['amount'].to_numpy()
+        purchases = cc_transactions[amounts < 0]
+        payments = cc_transactions[amounts > 0]
 
         return {
             'purchases': purchases,
             'payments': payments
         }
 
+    @cached_property
+    def _tx_dates(self) -> pd.Series:
+        """Parsed transaction dates aligned with _tx_df (parsed once)."""
+        return pd.to_datetime(self._tx_df['date'])
+
+    @cached_property
+    def _tx_date_order(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Transaction positions and dates in date order (sorted once)."""
+        return _date_order(self._tx_dates.to_numpy())
+
+    def _aggregate(self, start_date: Optional[datetime] = None,
+                   end_date: Optional[datetime] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Total payments and purchases per card slot in _cc_cards.
+
+        Reads the flat amount and card-code arrays of the full transactions
+        frame directly, so the card filter, date filter, sign split and
+        per-card sums happen in one pass without intermediate DataFrames.
+
+        Args:
+            start_date: Only include transactions on or after this date (optional)
+            end_date: Only include transactions on or before this date (optional)
+
+        Returns:
+            Tuple of (payments, purchases) arrays indexed by card slot
+        """
+        n_cards = len(self._cc_cards)
+        if not self.transactions or not n_cards:
+            return np.zeros(n_cards), np.zeros(n_cards)
+
+        codes = self._cc_codes
+        amounts = self._amounts
+        if start_date or end_date:
+            # Bounds become datetime64 scalars for a binary search over the
+            # pre-sorted dates; no Timestamp broadcast over the whole column
+            rows = _date_window(*self._tx_date_order, start_date, end_date)
+            codes = codes[rows]
+            amounts = amounts[rows]
+
+        on_card = codes >= 0
+        return _signed_totals_by_code(codes[on_card], amounts[on_card], n_cards)
+
     def calculate_debt_payoff_progress(self, start_date: datetime,
                                       end_date: datetime) -> pd.DataFrame:
         """
         Calculate debt payoff progress over a time period.
 
+        Payments and purchases only count transactions dated within
+        [start_date, end_date] (inclusive).
+
         Args:
             start_date: Start date for analysis
             end_date: End date for analysis
@@ -97,39 +315,21 @@ class CreditCardAnalyzer:
         Returns:
             DataFrame with debt payoff progress by account
         """
-        categorized = self.categorize_transactions()
-        payments = categorized['payments']
-        purchases = categorized['purchases']
+        account_ids = self._cc_account_id_list
 
-        progress_data = []
+        payments, purchases = self._aggregate(start_date, end_date)
+        slots = self._cc_cards.get_indexer(account_ids)
 
-        for account in self.credit_card_accounts:
-            account_id = account['id']
-            account_name = account['displayName']
+        progress = pd.DataFrame({
+            'account_id': account_ids,
+            'account_name': [card.name for card in self._card_accounts],
+            'total_payments': payments[slots],
+            'total_new_purchases': purchases[slots],
+        })
+        progress['net_debt_reduction'] = progress['total_payments'] - progress['total_new_purchases']
+        progress['current_balance'] = [card.balance for card in self._card_accounts]
 
-            # Filter transactions for this account using the account_id column
-            account_payments = payments[
-                payments['account_id'] == account_id
-            ] if 'account_id' in payments.columns else pd.DataFrame()
-
-            account_purchases = purchases[
-                purchases['account_id'] == account_id
-            ] if 'account_id' in purchases.columns else pd.DataFrame()
-
-            total_payments = account_payments['amount'].sum() if len(account_payments) > 0 else 0
-            total_purchases = abs(account_purchases['amount'].sum()) if len(account_purchases) > 0 else 0
-            net_payoff = total_payments - total_purchases
-
-            progress_data.append({
-                'account_id': account_id,
-                'account_name': account_name,
-                'total_payments': total_payments,
-                'total_new_purchases': total_purchases,
-                'net_debt_reduction': net_payoff,
-                'current_balance': account.get('currentBalance', 0),
-            })
-
-        return pd.DataFrame(progress_data)
+        return progress
 
     def generate_report(self) -> str:
         """
@@ -138,39 +338,50 @@ class CreditCardAnalyzer:
         Returns:
             Formatted text report
         """
-        summary = self.get_credit_card_summary()
-        categorized = self.categorize_transactions()
-
         report = []
         report.append("=" * 60)
         report.append("CREDIT CARD DEBT ANALYSIS REPORT")
         report.append("=" * 60)
         report.append("")
 
+        # Nothing to analyze - skip building any transaction frames
+        if not self.credit_card_accounts:
+            report.append("No credit card accounts found.")
+            report.append("=" * 60)
+            return "\n".join(report)
+
         report.append("Account Summary:")
         report.append("-" * 60)
-        for _, row in summary.iterrows():
-            report.append(f"  {row['account_name']}: ${row['current_balance']:,.2f}")
+        names = [card.name for card in self._card_accounts]
+        balances = [card.balance for card in self._card_accounts]
+        # Bind the line template once and map it over the columns
+        account_line = "  {}: ${:,.2f}".format
+        report.extend(map(account_line, names, balances))
         report.append("")
 
-        total_balance = summary['current_balance'].sum()
+        total_balance = sum(balances)
         report.append(f"Total Credit Card Debt: ${total_balance:,.2f}")
         report.append("")
 
         report.append("Transaction Summary:")
         report.append("-" * 60)
-        purchases_count = len(categorized['purchases'])
-        payments_count = len(categorized['payments'])
+        # Counts and totals only need the card amounts, not the split DataFrames
+        cc_amounts = self._cc_amounts
+        is_purchase = cc_amounts < 0
+        is_payment = cc_amounts > 0
+        purchases_count = int(np.count_nonzero(is_purchase))
+        payments_count = int(np.count_nonzero(is_payment))
         report.append(f"  New Purchases: {purchases_count} transactions")
         report.append(f"  Payments: {payments_count} transactions")
         report.append("")
 
         if purchases_count > 0:
-            total_purchases = abs(categorized['purchases']['amount'].sum())
+            # Purchases are all negative, so negating the sum avoids an abs pass
+            total_purchases = -cc_amounts[is_purchase].sum()
             report.append(f"  Total New Purchases: ${total_purchases:,.2f}")
 
         if payments_count > 0:
-            total_payments = categorized['payments']['amount'].sum()
+            total_payments = cc_amounts[is_payment].sum()
             report.append(f"  Total Payments: ${total_payments:,.2f}")
 
         report.append("=" * 60)
@@ -197,53 +408,53 @@ class CreditCardAnalyzer:
         if not self.transactions:
             return pd.DataFrame(columns=['date', 'income', 'total_expenses', 'cc_expenses', 'cash_balance'])
 
-        # Create DataFrame from transactions
-        df = pd.DataFrame(self.transactions)
-
-        # Parse dates
-        df['date'] = pd.to_datetime(df['date'])
-
-        # Filter by date range if provided
-        if start_date:
-            df = df[df['date'] >= pd.to_datetime(start_date)]
-        if end_date:
-            df = df[df['date'] <= pd.to_datetime(end_date)]
-
-        # Get credit card account IDs
-        cc_account_ids = [acc['id'] for acc in self.credit_card_accounts]
-
-        # Add account_id column
-        if 'account' in df.columns:
-            df['account_id'] = df['account'].apply(
-                lambda x: x.get('id') if isinstance(x, dict) else None
-            )
-        else:
-            df['account_id'] = None
+        # Work on the cached column arrays directly; selecting rows from them
+        # never copies or mutates the shared transactions frame
+        rows = slice(None)
+        if start_date or end_date:
+            rows = _date_window(*self._tx_date_order, start_date, end_date)
+        dates = self._tx_dates.to_numpy()[rows]
 
         # Mark if transaction is from CC
-        df['is_cc'] = df['account_id'].isin(cc_account_ids)
+        is_cc = self._is_cc[rows]
 
         # In Monarch Money:
         # - Positive amounts = income/payments/credits
         # - Negative amounts = expenses/purchases/debits
 
-        # Calculate components
-        df['income'] = df['amount'].apply(lambda x: x if x > 0 else 0)
-        df['expense'] = df['amount'].apply(lambda x: -x if x < 0 else 0)
-        df['cc_expense'] = df.apply(
-            lambda row: -row['amount'] if row['amount'] < 0 and row['is_cc'] else 0,
-            axis=1
-        )
-
-        # Group by time period
-        grouped = df.groupby(pd.Grouper(key='date', freq=frequency)).agg({
-            'income': 'sum',
-            'expense': 'sum',
-            'cc_expense': 'sum'
-        }).reset_index()
-
-        # Rename columns
-        grouped.columns = ['date', 'income', 'total_expenses', 'cc_expenses']
+        # Calculate components with NumPy ufuncs on the raw amount buffer,
+        # reading it once per column instead of row-wise apply
+        amount = self._amounts[rows]
+        income = np.maximum(amount, 0.0)
+        expense = np.maximum(-amount, 0.0)
+        cc_expense = np.where(is_cc, expense, 0.0)
+
+        # Group by time period: common frequencies map each date straight to
+        # its period label and sum with bincount; anything else uses pandas
+        labels = _period_end_labels(dates, frequency)
+        if labels is not None:
+            dated = ~np.isnat(labels)
+            periods, bucket = np.unique(labels[dated], return_inverse=True)
+            grouped = pd.DataFrame({
+                'date': periods,
+                'income': np.bincount(bucket, weights=income[dated], minlength=len(periods)),
+                'total_expenses': np.bincount(bucket, weights=expense[dated], minlength=len(periods)),
+                'cc_expenses': np.bincount(bucket, weights=cc_expense[dated], minlength=len(periods)),
+            })
+        else:
+            grouped = pd.DataFrame({
+                'date': dates,
+                'income': income,
+                'expense': expense,
+                'cc_expense': cc_expense
+            }).groupby(pd.Grouper(key='date', freq=frequency), observed=True).agg({
+                'income': 'sum',
+                'expense': 'sum',
+                'cc_expense': 'sum'
+            }).reset_index()
+
+            # Rename columns
+            grouped.columns = ['date', 'income', 'total_expenses', 'cc_expenses']
 
         # Calculate cash balance = income - (total_expenses - cc_expenses)
         # This represents cash flow from non-CC expenses
@@ -263,7 +474,7 @@ class CreditCardAnalyzer:
         Returns:
             List of credit card account IDs
         """
-        return [acc['id'] for acc in self.credit_card_accounts]
+        return list(self._cc_account_id_list)
 
     def calculate_monthly_cc_activity(self) -> pd.DataFrame:
         """
@@ -272,50 +483,13 @@ class CreditCardAnalyzer:
         Returns:
             DataFrame with columns: month, total_payments, total_purchases, net_change
         """
-        categorized = self.categorize_transactions()
-        payments = categorized['payments']
-        purchases = categorized['purchases']
-
-        if payments.empty and purchases.empty:
-            return pd.DataFrame(columns=['month', 'total_payments', 'total_purchases', 'net_change'])
-
-        # Process payments
-        if not payments.empty:
-            payments = payments.copy()
-            payments['date'] = pd.to_datetime(payments['date'])
-            payments['month'] = payments['date'].dt.to_period('M').dt.to_timestamp()
-            monthly_payments = payments.groupby('month')['amount'].sum().reset_index()
-            monthly_payments.columns = ['month', 'total_payments']
-        else:
-            monthly_payments = pd.DataFrame(columns=['month', 'total_payments'])
-
-        # Process purchases
-        if not purchases.empty:
-            purchases = purchases.copy()
-            purchases['date'] = pd.to_datetime(purchases['date'])
-            purchases['month'] = purchases['date'].dt.to_period('M').dt.to_timestamp()
-            monthly_purchases = purchases.groupby('month')['amount'].sum().abs().reset_index()
-            monthly_purchases.columns = ['month', 'total_purchases']
-        else:
-            monthly_purchases = pd.DataFrame(columns=['month', 'total_purchases'])
-
-        # Merge
-        if not monthly_payments.empty and not monthly_purchases.empty:
-            result = pd.merge(monthly_payments, monthly_purchases, on='month', how='outer')
-        elif not monthly_payments.empty:
-            result = monthly_payments
-            result['total_purchases'] = 0
-        elif not monthly_purchases.empty:
-            result = monthly_purchases
-            result['total_payments'] = 0
-        else:
+        monthly = self._monthly_cc_totals(['month'])
+        if monthly.empty:
             return pd.DataFrame(columns=['month', 'total_payments', 'total_purchases', 'net_change'])
 
-        result = result.fillna(0)
-        result['net_change'] = result['total_payments'] - result['total_purchases']
-        result = result.sort_values('month')
+        monthly['net_change'] = monthly['total_payments'] - monthly['total_purchases']
 
-        return result
+        return monthly
 
     def calculate_monthly_cc_by_account(self) -> pd.DataFrame:
         """
@@ -324,67 +498,47 @@ class CreditCardAnalyzer:
         Returns:
             DataFrame with columns: month, account_name, total_payments, total_purchases, net_change
         """
-        categorized = self.categorize_transactions()
-        payments = categorized['payments']
-        purchases = categorized['purchases']
-
-        if payments.empty and purchases.empty:
+        monthly = self._monthly_cc_totals(['month', 'account_id'])
+        if monthly.empty:
             return pd.DataFrame(columns=['month', 'account_name', 'total_payments', 'total_purchases', 'net_change'])
 
-        # Create account ID to name mapping
-        account_map = {acc['id']: acc['displayName'] for acc in self.credit_card_accounts}
-
-        results = []
+        # Map account IDs to names
+        account_map = {card.id: card.name for card in self._card_accounts}
+        monthly['account_name'] = monthly.pop('account_id').map(account_map)
+        monthly['net_change'] = monthly['total_payments'] - monthly['total_purchases']
+        monthly = monthly.sort_values(['month', 'account_name'])
 
-        for account_id, account_name in account_map.items():
-            # Filter transactions for this account
-            acc_payments = payments[payments['account_id'] == account_id] if not payments.empty and 'account_id' in payments.columns else pd.DataFrame()
-            acc_purchases = purchases[purchases['account_id'] == account_id] if not purchases.empty and 'account_id' in purchases.columns else pd.DataFrame()
+        return monthly
 
-            # Monthly payments
-            if not acc_payments.empty:
-                acc_payments = acc_payments.copy()
-                acc_payments['date'] = pd.to_datetime(acc_payments['date'])
-                acc_payments['month'] = acc_payments['date'].dt.to_period('M').dt.to_timestamp()
-                monthly_pay = acc_payments.groupby('month')['amount'].sum().reset_index()
-                monthly_pay.columns = ['month', 'total_payments']
-            else:
-                monthly_pay = pd.DataFrame(columns=['month', 'total_payments'])
-
-            # Monthly purchases
-            if not acc_purchases.empty:
-                acc_purchases = acc_purchases.copy()
-                acc_purchases['date'] = pd.to_datetime(acc_purchases['date'])
-                acc_purchases['month'] = acc_purchases['date'].dt.to_period('M').dt.to_timestamp()
-                monthly_purch = acc_purchases.groupby('month')['amount'].sum().abs().reset_index()
-                monthly_purch.columns = ['month', 'total_purchases']
-            else:
-                monthly_purch = pd.DataFrame(columns=['month', 'total_purchases'])
-
-            # Merge for this account
-            if not monthly_pay.empty and not monthly_purch.empty:
-                merged = pd.merge(monthly_pay, monthly_purch, on='month', how='outer')
-            elif not monthly_pay.empty:
-                merged = monthly_pay
-                merged['total_purchases'] = 0
-            elif not monthly_purch.empty:
-                merged = monthly_purch
-                merged['total_payments'] = 0
-            else:
-                continue
+    def _monthly_cc_totals(self, keys: List[str]) -> pd.DataFrame:
+        """
+        Sum credit card payments and purchases per month in a single groupby.
 
-            merged = merged.fillna(0)
-            merged['account_name'] = account_name
-            merged['net_change'] = merged['total_payments'] - merged['total_purchases']
-            results.append(merged)
+        Args:
+            keys: Grouping columns; 'month' plus optionally 'account_id'
 
-        if not results:
-            return pd.DataFrame(columns=['month', 'account_name', 'total_payments', 'total_purchases', 'net_change'])
+        Returns:
+            DataFrame with the key columns, total_payments and total_purchases
+            (purchases as positive values), or an empty DataFrame if there is
+            no credit card activity
+        """
+        cc_transactions = self._cc_transactions
+        if cc_transactions.empty:
+            return pd.DataFrame()
 
-        result = pd.concat(results, ignore_index=True)
-        result = result.sort_values(['month', 'account_name'])
+        # Only payments (positive) and purchases (negative) count toward a month
+        amounts = cc_transactions['amount']
+        cc_transactions = cc_transactions[(amounts > 0) | (amounts < 0)]
+        if cc_transactions.empty:
+            return pd.DataFrame()
 
-        return result
+        amounts = cc_transactions['amount']
+        dates = self._tx_dates.loc[cc_transactions.index]
+        return cc_transactions.assign(
+            month=_floor_month(dates),
+            total_payments=amounts.clip(lower=0),
+            total_purchases=(-amounts).clip(lower=0)
+        ).groupby(keys, observed=True)[['total_payments', 'total_purchases']].sum().reset_index()
 
     def calculate_monthly_summary(
         self,
@@ -401,9 +555,23 @@ class CreditCardAnalyzer:
         Returns:
             Dictionary with summary statistics
         """
-        cash_flow = self.calculate_cash_flow_over_time(start_date, end_date, frequency='ME')
-
-        if cash_flow.empty:
+        # Totals come straight from the amount arrays in one sweep; the
+        # monthly averages only need the number of active months, so the
+        # per-month cash flow frame is never built
+        n_months = 0
+        if self.transactions:
+            rows = slice(None)
+            if start_date or end_date:
+                rows = _date_window(*self._tx_date_order, start_date, end_date)
+            months = self._tx_dates.to_numpy()[rows].astype('datetime64[M]')
+            amount = self._amounts[rows]
+
+            # Same rows the monthly cash flow keeps: dated and non-zero
+            active = ~np.isnat(months) & (amount != 0)
+            amount = amount[active]
+            n_months = np.unique(months[active]).size
+
+        if not n_months:
             return {
                 'total_income': 0,
                 'total_expenses': 0,
@@ -415,18 +583,27 @@ class CreditCardAnalyzer:
                 'net_cash_flow': 0
             }
 
+        is_cc = self._is_cc[rows][active]
+        total_income = np.maximum(amount, 0.0).sum()
+        total_expenses = np.maximum(-amount, 0.0).sum()
+        total_cc_expenses = np.maximum(-amount[is_cc], 0.0).sum()
+
         return {
-            'total_income': cash_flow['income'].sum(),
-            'total_expenses': cash_flow['total_expenses'].sum(),
-            'total_cc_expenses': cash_flow['cc_expenses'].sum(),
-            'avg_monthly_income': cash_flow['income'].mean(),
-            'avg_monthly_expenses': cash_flow['total_expenses'].mean(),
-            'avg_monthly_cc_expenses': cash_flow['cc_expenses'].mean(),
-            'avg_cash_balance': cash_flow['cash_balance'].mean(),
-            'net_cash_flow': cash_flow['income'].sum() - cash_flow['total_expenses'].sum()
+            'total_income': total_income,
+            'total_expenses': total_expenses,
+            'total_cc_expenses': total_cc_expenses,
+            'avg_monthly_income': total_income / n_months,
+            'avg_monthly_expenses': total_expenses / n_months,
+            'avg_monthly_cc_expenses': total_cc_expenses / n_months,
+            'avg_cash_balance': (total_income - (total_expenses - total_cc_expenses)) / n_months,
+            'net_cash_flow': total_income - total_expenses
         }
 
 
+# Transaction buckets for the single-pass top-level metric sums
+_INCOME, _CASH_EXPENSE, _CC_EXPENSE, _CC_PAYMENT, _OTHER = range(5)
+
+
 class CashBudgetAnalyzer:
     """
     Analyzer for cash-based budgeting that separates CC spending from cash flow.
@@ -474,6 +651,11 @@ class CashBudgetAnalyzer:
                 self.cc_payment_category_id = cat_id
                 break
 
+        # Transfer-type categories, resolved once for the per-transaction flags
+        self._transfer_category_ids = frozenset(
+            cat_id for cat_id, cat in categories.items() if cat.is_transfer
+        )
+
     def get_cash_available(self) -> float:
         """Get total current balance from all cash accounts."""
         return sum(
@@ -481,38 +663,115 @@ class CashBudgetAnalyzer:
             for acc in self.cash_accounts
         )
 
+    @cached_property
+    def _columns(self) -> Dict[str, np.ndarray]:
+        """
+        Flat per-transaction columns, extracted in a single pass (built once).
+
+        Returns:
+            Dict of parallel arrays: date (datetime64), amount (float64),
+            account_id, category_id, category_name and the boolean flags
+            is_cc_account, is_cc_payment, is_excluded and is_transfer
+        """
+        dates = []
+        amounts = []
+        account_ids = []
+        category_ids = []
+        category_names = []
+        for txn in self.transactions:
+            dates.append(txn.get('date'))
+            amounts.append(txn.get('amount'))
+            account = txn.get('account')
+            account_ids.append(account.get('id') if isinstance(account, dict) else None)
+            category = txn.get('category')
+            if isinstance(category, dict):
+                category_ids.append(category.get('id'))
+                category_names.append(category.get('name', 'Uncategorized'))
+            else:
+                category_ids.append(None)
+                category_names.append('Uncategorized')
+
+        account_ids = pd.Index(account_ids, dtype=object)
+        category_ids = pd.Index(category_ids, dtype=object)
+        category_names = pd.Index(category_names, dtype=object)
+
+        # Flags are hashed isin lookups against sets resolved once, rather
+        # than a Python membership test per transaction
+        if self.cc_payment_category_id is None:
+            is_cc_payment = np.zeros(len(category_ids), dtype=bool)
+        else:
+            is_cc_payment = category_ids.isin([self.cc_payment_category_id])
+
+        return {
+            # Parse every date string once, up front, for all methods
+            'date': pd.to_datetime(pd.Series(dates, dtype=object)).to_numpy(),
+            'amount': np.array(amounts, dtype=np.float64),
+            'account_id': account_ids.to_numpy(),
+            'category_id': category_ids.to_numpy(),
+            'category_name': category_names.to_numpy(),
+            # Flag CC transactions
+            'is_cc_account': account_ids.isin(self.cc_account_ids),
+            # Flag CC payment transactions (a missing category ID never matches)
+            'is_cc_payment': is_cc_payment,
+            # Income categories left out of the metrics
+            'is_excluded': category_names.isin(self.EXCLUDED_CATEGORIES),
+            # Transfer-type categories are not counted as expenses
+            'is_transfer': category_ids.isin(self._transfer_category_ids),
+        }
+
     def _prepare_dataframe(self) -> pd.DataFrame:
-        """Convert transactions to DataFrame with necessary computed columns."""
+        """
+        Convert transactions to DataFrame with necessary computed columns.
+
+        The frame is built once per analyzer and shared by every method, so
+        callers must filter into new frames rather than modify it in place.
+        """
+        return self._prepared_df
+
+    @cached_property
+    def _prepared_df(self) -> pd.DataFrame:
+        """Prepared transactions frame backing _prepare_dataframe (built once)."""
         if not self.transactions:
             return pd.DataFrame()
 
-        df = pd.DataFrame(self.transactions)
+        # Flat columns come from one pass over the records; the remaining raw
+        # fields (description, merchant, ...) ride along for display methods
+        return pd.DataFrame(self.transactions).assign(**self._columns)
 
-        # Extract nested fields
-        df['account_id'] = df['account'].apply(
-            lambda x: x.get('id') if isinstance(x, dict) else None
-        )
-        df['category_id'] = df['category'].apply(
-            lambda x: x.get('id') if isinstance(x, dict) else None
-        )
-        df['category_name'] = df['category'].apply(
-            lambda x: x.get('name', 'Uncategorized') if isinstance(x, dict) else 'Uncategorized'
-        )
+    @cached_property
+    def _row_date_order(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Transaction positions and dates in date order (sorted once)."""
+        return _date_order(self._columns['date'])
 
-        # Parse dates
-        df['date'] = pd.to_datetime(df['date'])
-
-        # Flag CC transactions
-        df['is_cc_account'] = df['account_id'].isin(self.cc_account_ids)
+    def _filter_dates(self,
+                      df: pd.DataFrame,
+                      start_date: Optional[datetime] = None,
+                      end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """
+        Restrict the prepared DataFrame to an inclusive date range.
 
-        # Flag CC payment transactions
-        df['is_cc_payment'] = df['category_id'] == self.cc_payment_category_id
+        Uses binary search over the pre-sorted dates instead of comparing
+        every row against each bound.
 
-        return df
+        Args:
+            df: The full DataFrame from _prepare_dataframe
+            start_date: Start date (optional)
+            end_date: End date (optional)
 
-    def _is_excluded_category(self, category_name: str) -> bool:
-        """Check if a category should be excluded from calculations."""
-        return category_name in self.EXCLUDED_CATEGORIES
+        Returns:
+            Rows dated within the range, in their original order
+        """
+        if not start_date and not end_date:
+            return df
+        return df.iloc[self._date_rows(start_date, end_date)]
+
+    def _date_rows(self,
+                   start_date: Optional[datetime] = None,
+                   end_date: Optional[datetime] = None):
+        """Row selector (slice or positions) into the flat columns for a date range."""
+        if not start_date and not end_date:
+            return slice(None)
+        return _date_window(*self._row_date_order, start_date, end_date)
 
     def calculate_top_level_metrics(self,
                                     start_date: Optional[datetime] = None,
@@ -529,9 +788,7 @@ class CashBudgetAnalyzer:
         - true_cash_remaining: Income - Cash Expenses - CC Payments
         - total_new_cc_spending: Same as cc_expenses
         """
-        df = self._prepare_dataframe()
-
-        if df.empty:
+        if not self.transactions:
             return {
                 'total_income': 0,
                 'total_expenses': 0,
@@ -542,49 +799,51 @@ class CashBudgetAnalyzer:
                 'total_new_cc_spending': 0
             }
 
-        # Filter by date range if provided
-        if start_date:
-            df = df[df['date'] >= pd.to_datetime(start_date)]
-        if end_date:
-            df = df[df['date'] <= pd.to_datetime(end_date)]
-
-        # Helper to safely sum amounts from potentially empty DataFrame
-        def safe_sum(filtered_df: pd.DataFrame) -> float:
-            if filtered_df.empty or 'amount' not in filtered_df.columns:
-                return 0.0
-            return filtered_df['amount'].sum()
+        # Plain NumPy masks and sums over the flat columns; no DataFrame needed
+        cols = self._columns
+        rows = self._date_rows(start_date, end_date)
+        amount = cols['amount'][rows]
+        is_cc_account = cols['is_cc_account'][rows]
+        is_cc_payment = cols['is_cc_payment'][rows]
+        # Shared sub-masks are computed once and combined in place to keep
+        # boolean temporaries to a minimum
+        is_outflow = amount < 0
+        not_cc_payment = ~is_cc_payment
 
         # Income: positive amounts (excluding CC payments and excluded categories)
-        income_df = df[(df['amount'] > 0) & (~df['is_cc_payment'])]
-        if not income_df.empty:
-            income_df = income_df[~income_df['category_name'].apply(self._is_excluded_category)]
-        total_income = safe_sum(income_df)
+        is_income = amount > 0
+        is_income &= not_cc_payment
+        is_income &= ~cols['is_excluded'][rows]
 
         # All expenses: negative amounts (excluding CC payments and transfers)
-        expense_df = df[(df['amount'] < 0) & (~df['is_cc_payment'])]
-        # Filter out transfer-type categories
-        if not expense_df.empty:
-            expense_df = expense_df[expense_df['category_id'].apply(
-                lambda cid: self.categories.get(cid) is None or
-                           self.categories.get(cid).category_type.value != 'transfer'
-            )]
-        total_expenses = abs(safe_sum(expense_df))
+        is_expense = is_outflow & not_cc_payment
+        is_expense &= ~cols['is_transfer'][rows]
+
+        # CC Payments: transactions in the CC payment category
+        # These show as negative from checking (paying) and positive on CC (receiving)
+        # We want the outflow from non-CC accounts
+        is_cc_outflow = is_cc_payment & ~is_cc_account
+        is_cc_outflow &= is_outflow
+
+        # The buckets are disjoint, so one weighted bincount produces every
+        # sum in a single pass over the amounts
+        bucket = np.full(len(amount), _OTHER, dtype=np.intp)
+        bucket[is_income] = _INCOME
+        bucket[is_expense] = _CASH_EXPENSE
+        bucket[is_expense & is_cc_account] = _CC_EXPENSE
+        bucket[is_cc_outflow] = _CC_PAYMENT
+        sums = np.bincount(bucket, weights=amount, minlength=_OTHER + 1)
+
+        total_income = sums[_INCOME]
+        total_expenses = abs(sums[_CASH_EXPENSE] + sums[_CC_EXPENSE])
 
         # CC expenses: negative amounts on CC accounts
-        if not expense_df.empty and 'is_cc_account' in expense_df.columns:
-            cc_expense_df = expense_df[expense_df['is_cc_account']]
-            cc_expenses = abs(safe_sum(cc_expense_df))
-        else:
-            cc_expenses = 0.0
+        cc_expenses = abs(sums[_CC_EXPENSE])
 
         # Cash expenses: negative amounts NOT on CC accounts
         cash_expenses = total_expenses - cc_expenses
 
-        # CC Payments: transactions in the CC payment category
-        # These show as negative from checking (paying) and positive on CC (receiving)
-        # We want the outflow from non-CC accounts
-        cc_payment_df = df[df['is_cc_payment'] & ~df['is_cc_account'] & (df['amount'] < 0)]
-        cc_payments = abs(safe_sum(cc_payment_df))
+        cc_payments = abs(sums[_CC_PAYMENT])
 
         # True Cash Remaining = Income - Cash Expenses - CC Payments
         true_cash_remaining = total_income - cash_expenses - cc_payments
@@ -599,6 +858,17 @@ class CashBudgetAnalyzer:
             'total_new_cc_spending': cc_expenses
         }
 
+    @cached_property
+    def _category_meta(self) -> pd.DataFrame:
+        """Category name, group, type and expense flag indexed by category ID (built once)."""
+        return pd.DataFrame(
+            [
+                (cat_id, cat.name, cat.group_name, cat.category_type.value, cat.is_expense)
+                for cat_id, cat in self.categories.items()
+            ],
+            columns=['category_id', 'category_name', 'group_name', 'category_type', 'is_expense']
+        ).set_index('category_id')
+
     def calculate_category_breakdown(self,
                                      start_date: Optional[datetime] = None,
                                      end_date: Optional[datetime] = None) -> pd.DataFrame:
@@ -611,58 +881,40 @@ class CashBudgetAnalyzer:
         - cc_amount: Amount spent on credit cards
         - cash_amount: Amount spent with cash/debit
         """
-        df = self._prepare_dataframe()
-
-        if df.empty:
+        if not self.transactions:
             return pd.DataFrame(columns=[
                 'category_id', 'category_name', 'group_name', 'category_type',
                 'actual_amount', 'cc_amount', 'cash_amount'
             ])
 
         # Filter by date range
-        if start_date:
-            df = df[df['date'] >= pd.to_datetime(start_date)]
-        if end_date:
-            df = df[df['date'] <= pd.to_datetime(end_date)]
-
-        # Exclude CC payment transfers from breakdown
-        df = df[~df['is_cc_payment']]
-
-        results = []
-
-        for cat_id, group in df.groupby('category_id'):
-            if cat_id is None:
-                continue
-
-            cat = self.categories.get(cat_id)
-            if not cat:
-                continue
-
-            # Calculate amounts
-            total = group['amount'].sum()
-            cc_total = group[group['is_cc_account']]['amount'].sum()
-
-            # For expenses (negative), we want absolute values
-            if cat.is_expense:
-                actual = abs(total)
-                cc_amt = abs(cc_total)
-            else:
-                actual = total
-                cc_amt = cc_total
-
-            cash_amt = actual - cc_amt if cat.is_expense else 0
-
-            results.append({
-                'category_id': cat_id,
-                'category_name': cat.name,
-                'group_name': cat.group_name,
-                'category_type': cat.category_type.value,
-                'actual_amount': actual,
-                'cc_amount': cc_amt if cat.is_expense else 0,
-                'cash_amount': cash_amt
-            })
-
-        result_df = pd.DataFrame(results)
+        df = self._filter_dates(self._prepare_dataframe(), start_date, end_date)
+
+        # Exclude CC payment transfers and transactions without a known category
+        df = df[~df['is_cc_payment'] & df['category_id'].isin(self.categories.keys())]
+
+        # One groupby for both the total and the credit card share
+        totals = df.assign(
+            cc_amount=df['amount'].where(df['is_cc_account'], 0.0)
+        ).groupby('category_id', observed=True)[['amount', 'cc_amount']].sum()
+        meta = self._category_meta.loc[totals.index]
+
+        # For expenses (negative), we want absolute values
+        is_expense = meta['is_expense'].to_numpy(dtype=bool)
+        total = totals['amount'].to_numpy()
+        cc_total = totals['cc_amount'].to_numpy()
+        actual = np.where(is_expense, np.abs(total), total)
+        cc_amt = np.where(is_expense, np.abs(cc_total), 0)
+
+        result_df = pd.DataFrame({
+            'category_id': totals.index.to_numpy(),
+            'category_name': meta['category_name'].to_numpy(),
+            'group_name': meta['group_name'].to_numpy(),
+            'category_type': meta['category_type'].to_numpy(),
+            'actual_amount': actual,
+            'cc_amount': cc_amt,
+            'cash_amount': np.where(is_expense, actual - cc_amt, 0)
+        })
 
         # Sort by category type (income first) then by actual amount
         if not result_df.empty:
@@ -693,30 +945,29 @@ class CashBudgetAnalyzer:
         breakdown = self.calculate_category_breakdown(start_date, end_date)
         expenses = breakdown[breakdown['category_type'] == 'expense']
 
-        if include_cc_payments:
-            # Calculate CC payments to add as a row
-            df = self._prepare_dataframe()
-            if not df.empty:
-                if start_date:
-                    df = df[df['date'] >= pd.to_datetime(start_date)]
-                if end_date:
-                    df = df[df['date'] <= pd.to_datetime(end_date)]
-
-                # CC Payments: outflows from non-CC accounts in CC payment category
-                cc_payment_df = df[df['is_cc_payment'] & ~df['is_cc_account'] & (df['amount'] < 0)]
-                cc_payments = abs(cc_payment_df['amount'].sum()) if not cc_payment_df.empty else 0.0
-
-                if cc_payments > 0:
-                    cc_payment_row = pd.DataFrame([{
-                        'category_id': 'cc_payments',
-                        'category_name': 'Credit Card Payments',
-                        'group_name': 'Transfers',
-                        'category_type': 'expense',
-                        'actual_amount': cc_payments,
-                        'cc_amount': 0,
-                        'cash_amount': cc_payments
-                    }])
-                    expenses = pd.concat([expenses, cc_payment_row], ignore_index=True)
+        if include_cc_payments and self.transactions:
+            # Calculate CC payments to add as a row, straight from the flat
+            # columns rather than building a filtered DataFrame
+            cols = self._columns
+            rows = self._date_rows(start_date, end_date)
+            amount = cols['amount'][rows]
+
+            # CC Payments: outflows from non-CC accounts in CC payment category
+            is_cc_payment = cols['is_cc_payment'][rows] & ~cols['is_cc_account'][rows]
+            is_cc_payment &= amount < 0
+            cc_payments = abs(amount[is_cc_payment].sum())
+
+            if cc_payments > 0:
+                cc_payment_row = pd.DataFrame([{
+                    'category_id': 'cc_payments',
+                    'category_name': 'Credit Card Payments',
+                    'group_name': 'Transfers',
+                    'category_type': 'expense',
+                    'actual_amount': cc_payments,
+                    'cc_amount': 0,
+                    'cash_amount': cc_payments
+                }])
+                expenses = pd.concat([expenses, cc_payment_row], ignore_index=True)
 
         return expenses
 
@@ -732,43 +983,40 @@ class CashBudgetAnalyzer:
         Returns DataFrame with columns:
         - date, description, amount, account_name, category_name, is_cc
         """
-        df = self._prepare_dataframe()
-
-        if df.empty:
+        if not self.transactions:
             return pd.DataFrame(columns=[
                 'date', 'description', 'amount', 'account_name', 'category_name', 'is_cc'
             ])
 
         # Filter by date range
-        if start_date:
-            df = df[df['date'] >= pd.to_datetime(start_date)]
-        if end_date:
-            df = df[df['date'] <= pd.to_datetime(end_date)]
+        df = self._filter_dates(self._prepare_dataframe(), start_date, end_date)
 
         # Only negative amounts (outflows), excluding CC payments
         df = df[(df['amount'] < 0) & (~df['is_cc_payment'])]
 
         # Find transfer-type transactions
-        transfers = []
-        for _, row in df.iterrows():
-            cat_id = row.get('category_id')
-            cat = self.categories.get(cat_id) if cat_id else None
-
-            # Include if category is transfer type
-            if cat and cat.category_type.value == 'transfer':
-                account = row.get('account', {})
-                account_name = account.get('displayName', 'Unknown') if isinstance(account, dict) else 'Unknown'
-
-                transfers.append({
-                    'date': row['date'].strftime('%Y-%m-%d') if hasattr(row['date'], 'strftime') else str(row['date']),
-                    'description': row.get('name', row.get('originalName', 'Unknown')),
-                    'amount': abs(row['amount']),  # Show as positive
-                    'account_name': account_name,
-                    'category_name': cat.name,
-                    'is_cc': row.get('is_cc_account', False)
-                })
-
-        result_df = pd.DataFrame(transfers)
+        df = df[df['is_transfer']]
+
+        # Build each output column in one pass instead of iterrows
+        if 'name' in df.columns:
+            descriptions = df['name']
+        elif 'originalName' in df.columns:
+            descriptions = df['originalName']
+        else:
+            descriptions = 'Unknown'
+        accounts = df['account'] if 'account' in df.columns else [None] * len(df)
+
+        result_df = pd.DataFrame({
+            'date': df['date'].dt.strftime('%Y-%m-%d'),
+            'description': descriptions,
+            'amount': df['amount'].abs(),  # Show as positive
+            'account_name': [
+                acc.get('displayName', 'Unknown') if isinstance(acc, dict) else 'Unknown'
+                for acc in accounts
+            ],
+            'category_name': df['category_id'].map(self._category_meta['category_name']),
+            'is_cc': df['is_cc_account']
+        })
 
         # Sort by amount descending
         if not result_df.empty:
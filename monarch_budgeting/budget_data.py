@@ -5,9 +5,16 @@ This module defines the data classes used for parsing and working with
 Monarch Money budget and category information.
 """
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Per-instance __dict__ is dropped where dataclasses support it (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 class CategoryType(Enum):
@@ -17,7 +24,11 @@ class CategoryType(Enum):
     TRANSFER = 'transfer'
 
 
-@dataclass
+# Lowercase type string -> CategoryType; unknown types fall back to EXPENSE
+_TYPE_MAP = {t.value: t for t in CategoryType}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Category:
     """Represents a transaction category from Monarch Money."""
     id: str
@@ -46,7 +57,7 @@ class Category:
         return self.system_category == 'credit_card_payment'
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class CategoryBreakdown:
     """Breakdown of spending for a single category."""
     category_id: str
@@ -65,7 +76,7 @@ class CategoryBreakdown:
         return (self.cc_amount / self.actual_amount) * 100
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class TopLevelMetrics:
     """Top-level budget metrics for display."""
     total_income: float
@@ -96,6 +107,116 @@ class TopLevelMetrics:
             total_new_cc_spending=cc_expenses
         )
 
+    @classmethod
+    def calculate_batch(cls,
+                        total_income: Sequence[float],
+                        total_expenses: Sequence[float],
+                        cc_expenses: Sequence[float],
+                        cc_payments: Sequence[float]) -> pd.DataFrame:
+        """
+        Calculate metrics for many periods (e.g. months) at once.
+
+        Array counterpart of calculate(): each argument is a sequence with one
+        value per period, and the derived fields are computed column-wise
+        instead of building one TopLevelMetrics per period.
+
+        Args:
+            total_income: Income per period
+            total_expenses: All expenses (CC + cash) per period
+            cc_expenses: Expenses charged to credit cards per period
+            cc_payments: Payments made to credit cards per period
+
+        Returns:
+            DataFrame with one row per period and one column per metric field
+        """
+        total_income = np.asarray(total_income, dtype=np.float64)
+        total_expenses = np.asarray(total_expenses, dtype=np.float64)
+        cc_expenses = np.asarray(cc_expenses, dtype=np.float64)
+        cc_payments = np.asarray(cc_payments, dtype=np.float64)
+
+        cash_expenses = total_expenses - cc_expenses
+        true_cash_remaining = total_income - cash_expenses - cc_payments
+
+        return pd.DataFrame({
+            'total_income': total_income,
+            'total_expenses': total_expenses,
+            'cc_expenses': cc_expenses,
+            'cash_expenses': cash_expenses,
+            'cc_payments': cc_payments,
+            'true_cash_remaining': true_cash_remaining,
+            'total_new_cc_spending': cc_expenses
+        })
+
+
+class CategoryMap(dict):
+    """
+    Dictionary of Category objects keyed by ID, with an O(1) name lookup.
+
+    The lowercase name index and the by-type grouping are built on first use
+    and dropped whenever the mapping changes, so they never go stale.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._name_index: Optional[Dict[str, Category]] = None
+        self._type_index: Optional[Dict[CategoryType, List[Category]]] = None
+
+    def get_by_name(self, name: str) -> Optional[Category]:
+        """Find a category by name (case-insensitive)."""
+        if self._name_index is None:
+            index: Dict[str, Category] = {}
+            for cat in self.values():
+                # Keep the first match, as a linear scan would
+                index.setdefault(cat.name.lower(), cat)
+            self._name_index = index
+        return self._name_index.get(name.lower())
+
+    def get_by_type(self, cat_type: CategoryType) -> List[Category]:
+        """Get all categories of a specific type."""
+        if self._type_index is None:
+            self._type_index = group_by_type(self)
+        # Copy so callers can't alter the cached grouping
+        return list(self._type_index[cat_type])
+
+    def _invalidate(self) -> None:
+        self._name_index = None
+        self._type_index = None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._invalidate()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._invalidate()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._invalidate()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._invalidate()
+        return value
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._invalidate()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._invalidate()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._invalidate()
+
 
 def parse_categories(raw_categories: Dict[str, Any]) -> Dict[str, Category]:
     """
@@ -106,9 +227,9 @@ def parse_categories(raw_categories: Dict[str, Any]) -> Dict[str, Category]:
                        Expected format: {'categories': [...]}
 
     Returns:
-        Dictionary of Category objects keyed by category ID
+        Dictionary (a CategoryMap) of Category objects keyed by category ID
     """
-    categories = {}
+    categories = CategoryMap()
 
     raw_list = raw_categories.get('categories', [])
 
@@ -120,10 +241,7 @@ def parse_categories(raw_categories: Dict[str, Any]) -> Dict[str, Category]:
         group = raw.get('group', {})
         type_str = group.get('type', 'expense').lower()
 
-        try:
-            cat_type = CategoryType(type_str)
-        except ValueError:
-            cat_type = CategoryType.EXPENSE
+        cat_type = _TYPE_MAP.get(type_str, CategoryType.EXPENSE)
 
         category = Category(
             id=cat_id,
@@ -142,6 +260,9 @@ def parse_categories(raw_categories: Dict[str, Any]) -> Dict[str, Category]:
 
 def get_category_by_name(categories: Dict[str, Category], name: str) -> Optional[Category]:
     """Find a category by name (case-insensitive)."""
+    if isinstance(categories, CategoryMap):
+        return categories.get_by_name(name)
+
     name_lower = name.lower()
     for cat in categories.values():
         if cat.name.lower() == name_lower:
@@ -149,9 +270,19 @@ def get_category_by_name(categories: Dict[str, Category], name: str) -> Optional
     return None
 
 
+def group_by_type(categories: Dict[str, Category]) -> Dict[CategoryType, List[Category]]:
+    """Group categories by type in a single pass (every type is present)."""
+    grouped: Dict[CategoryType, List[Category]] = {t: [] for t in CategoryType}
+    for cat in categories.values():
+        grouped[cat.category_type].append(cat)
+    return grouped
+
+
 def get_categories_by_type(categories: Dict[str, Category],
                            cat_type: CategoryType) -> List[Category]:
     """Get all categories of a specific type."""
+    if isinstance(categories, CategoryMap):
+        return categories.get_by_type(cat_type)
     return [c for c in categories.values() if c.category_type == cat_type]
 
 
@@ -5,19 +5,19 @@ This module provides beautiful terminal output using the `rich` library
 to display budget metrics and category breakdowns.
 """
 
-from typing import Dict, Any, Optional
-import pandas as pd
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
+from typing import Dict, Any, Optional, TYPE_CHECKING
+
+# rich is imported where it is used and pandas only for annotations, so
+# importing this module (e.g. just for BudgetDisplay) stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class BudgetDisplay:
     """Display budget information using rich terminal formatting."""
 
     def __init__(self):
+        from rich.console import Console
         self.console = Console()
 
     def _format_currency(self, amount: float, show_sign: bool = False) -> str:
@@ -42,6 +42,9 @@ class BudgetDisplay:
                     total_new_cc_spending
             month: Optional month string for title
         """
+        from rich.panel import Panel
+        from rich.text import Text
+
         title = f"Cash Budget Summary - {month}" if month else "Cash Budget Summary"
 
         # Build the metrics text
@@ -85,7 +88,7 @@ class BudgetDisplay:
         self.console.print(panel)
         self.console.print()
 
-    def display_income_table(self, income_df: pd.DataFrame):
+    def display_income_table(self, income_df: 'pd.DataFrame'):
         """
         Display income categories table.
 
@@ -96,6 +99,9 @@ class BudgetDisplay:
             self.console.print("[dim]No income data[/dim]")
             return
 
+        from rich import box
+        from rich.table import Table
+
         table = Table(
             title="Income",
             box=box.ROUNDED,
@@ -106,12 +112,13 @@ class BudgetDisplay:
         table.add_column("Category", style="cyan", no_wrap=True)
         table.add_column("Actual", justify="right", style="green")
 
-        total = 0
-        for _, row in income_df.iterrows():
-            amount = row['actual_amount']
-            total += amount
+        amounts = income_df['actual_amount'].to_numpy()
+        total = amounts.sum()
+
+        # zip over the raw columns avoids building a Series per row
+        for name, amount in zip(income_df['category_name'].to_numpy(), amounts):
             table.add_row(
-                row['category_name'],
+                name,
                 self._format_currency(amount)
             )
 
@@ -125,7 +132,7 @@ class BudgetDisplay:
         self.console.print(table)
         self.console.print()
 
-    def display_expense_table(self, expense_df: pd.DataFrame):
+    def display_expense_table(self, expense_df: 'pd.DataFrame'):
         """
         Display expenses table with Credit Card column.
 
@@ -137,6 +144,9 @@ class BudgetDisplay:
             self.console.print("[dim]No expense data[/dim]")
             return
 
+        from rich import box
+        from rich.table import Table
+
         table = Table(
             title="Expenses",
             box=box.ROUNDED,
@@ -149,25 +159,18 @@ class BudgetDisplay:
         table.add_column("Credit Card", justify="right", style="yellow")
         table.add_column("Cash", justify="right")
 
-        total_actual = 0
-        total_cc = 0
-        total_cash = 0
-
-        for _, row in expense_df.iterrows():
-            actual = row['actual_amount']
-            cc = row['cc_amount']
-            cash = row['cash_amount']
-
-            total_actual += actual
-            total_cc += cc
-            total_cash += cash
+        # All three totals in one vectorized column sum
+        amounts = expense_df[['actual_amount', 'cc_amount', 'cash_amount']].to_numpy(dtype=float)
+        total_actual, total_cc, total_cash = amounts.sum(axis=0)
 
+        # zip over the raw columns avoids building a Series per row
+        for name, (actual, cc, cash) in zip(expense_df['category_name'].to_numpy(), amounts):
             # Highlight rows with significant CC spending
             cc_str = self._format_currency(cc) if cc > 0 else "-"
             cash_str = self._format_currency(cash) if cash > 0 else "-"
 
             table.add_row(
-                row['category_name'],
+                name,
                 self._format_currency(actual),
                 cc_str,
                 cash_str
@@ -198,6 +201,9 @@ class BudgetDisplay:
         if start_bal is None and end_bal is None:
             return
 
+        from rich import box
+        from rich.table import Table
+
         table = Table(
             title="Cash Account Balances",
             box=box.ROUNDED,
@@ -230,8 +236,8 @@ class BudgetDisplay:
 
     def display_full_budget(self,
                            metrics: Dict[str, float],
-                           income_df: pd.DataFrame,
-                           expense_df: pd.DataFrame,
+                           income_df: 'pd.DataFrame',
+                           expense_df: 'pd.DataFrame',
                            cash_balances: Optional[Dict[str, Any]] = None,
                            month: str = ""):
         """
@@ -6,18 +6,37 @@ Generates a PDF report with budget tables and cash balance charts.
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+import matplotlib.style
 from matplotlib.backends.backend_pdf import PdfPages
 import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.ticker import StrMethodFormatter
+
+
+# Balance charts with more plotted points than this rasterize their lines
+_RASTERIZE_MIN_POINTS = 20_000
+
+# Whole-dollar y-axis tick labels, applied by str.format without a Python callback
+_CURRENCY_TICK_FORMAT = '${x:,.0f}'
 
 
 class BudgetPDFReport:
     """Generate PDF reports for budget analysis."""
 
+    # matplotlib styles are process-wide, so only the first instance applies it
+    _style_applied = False
+
     def __init__(self):
         # Set up matplotlib style
-        plt.style.use('seaborn-v0_8-whitegrid')
+        if not BudgetPDFReport._style_applied:
+            matplotlib.style.use('seaborn-v0_8-whitegrid')
+            BudgetPDFReport._style_applied = True
 
     def _format_currency(self, amount: float) -> str:
         """Format a number as currency."""
@@ -25,13 +44,28 @@ class BudgetPDFReport:
             return f"-${abs(amount):,.2f}"
         return f"${amount:,.2f}"
 
-    def _create_summary_page(self, fig, metrics: Dict[str, float], month: str):
-        """Create a summary metrics page."""
-        ax = fig.add_subplot(111)
+    def _format_currency_column(self, values) -> List[str]:
+        """
+        Format a whole column of numbers as currency.
+
+        Converts the column to float64 once and formats the plain Python
+        floats, giving the same strings as _format_currency per value.
+
+        Args:
+            values: Series, array or sequence of numbers
+
+        Returns:
+            List of formatted currency strings
+        """
+        return [f"-${-amount:,.2f}" if amount < 0 else f"${amount:,.2f}"
+                for amount in np.asarray(values, dtype=np.float64).tolist()]
+
+    def _create_summary_page(self, ax, metrics: Dict[str, float], month: str):
+        """Create a summary metrics page on the page's axes."""
         ax.axis('off')
 
         # Title
-        fig.suptitle(f'Cash Budget Summary - {month}', fontsize=16, fontweight='bold', y=0.95)
+        ax.figure.suptitle(f'Cash Budget Summary - {month}', fontsize=16, fontweight='bold', y=0.95)
 
         # Summary text
         true_cash = metrics['true_cash_remaining']
@@ -57,10 +91,9 @@ CC Payments:         {self._format_currency(metrics['cc_payments'])}
                 fontfamily='monospace',
                 bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.3))
 
-    def _create_table_page(self, fig, df: pd.DataFrame, title: str, columns: List[str],
+    def _create_table_page(self, ax, df: pd.DataFrame, title: str, columns: List[str],
                            show_total: bool = True):
-        """Create a page with a table."""
-        ax = fig.add_subplot(111)
+        """Create a page with a table on the page's axes."""
         ax.axis('off')
         ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
 
@@ -68,26 +101,32 @@ CC Payments:         {self._format_currency(metrics['cc_payments'])}
             ax.text(0.5, 0.5, 'No data', ha='center', va='center', fontsize=12)
             return
 
-        # Prepare table data
-        table_data = []
-        for _, row in df.iterrows():
-            row_data = []
-            for col in columns:
-                val = row.get(col, '')
-                if isinstance(val, (int, float)) and col != 'category_name':
-                    row_data.append(self._format_currency(val))
-                else:
-                    row_data.append(str(val))
-            table_data.append(row_data)
+        # Prepare table data one column at a time. Each column is classified
+        # once by dtype: numeric columns are formatted as currency in a single
+        # pass, everything else as text, and columns missing from the frame
+        # render as blank cells
+        cell_columns = []
+        for col in columns:
+            if col not in df.columns:
+                cell_columns.append([''] * len(df))
+            elif col != 'category_name' and pd.api.types.is_numeric_dtype(df[col]):
+                cell_columns.append(self._format_currency_column(df[col]))
+            else:
+                cell_columns.append([str(val) for val in df[col].tolist()])
+        # matplotlib only indexes cellText, so the zipped row tuples are used as-is
+        table_data = list(zip(*cell_columns))
 
         # Add total row if requested
         if show_total and not df.empty:
+            # Sum every numeric column in one reduction, then look totals up
+            present = list(dict.fromkeys(col for col in columns if col in df.columns))
+            totals = df[present].select_dtypes('number').sum()
             total_row = []
             for col in columns:
                 if col == 'category_name':
                     total_row.append('TOTAL')
-                elif col in df.columns and df[col].dtype in ['float64', 'int64', 'float', 'int']:
-                    total_row.append(self._format_currency(df[col].sum()))
+                elif col in totals.index:
+                    total_row.append(self._format_currency(totals[col]))
                 else:
                     total_row.append('')
             table_data.append(total_row)
@@ -115,9 +154,8 @@ CC Payments:         {self._format_currency(metrics['cc_payments'])}
             for i in range(len(columns)):
                 table[(last_row, i)].set_text_props(fontweight='bold')
 
-    def _create_transfers_page(self, fig, df: pd.DataFrame, title: str):
-        """Create a page showing transfer transactions."""
-        ax = fig.add_subplot(111)
+    def _create_transfers_page(self, ax, df: pd.DataFrame, title: str):
+        """Create a page showing transfer transactions on the page's axes."""
         ax.axis('off')
         ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
 
@@ -129,13 +167,19 @@ CC Payments:         {self._format_currency(metrics['cc_payments'])}
         col_labels = ['Date', 'Description', 'Amount', 'Account', 'Category']
         table_data = []
 
-        for _, row in df.iterrows():
+        # Plain row tuples in display order; absent columns use their defaults.
+        # Amounts are formatted as currency for the whole column at once
+        defaults = {'date': '', 'description': '', 'account_name': '', 'category_name': ''}
+        rows = df.assign(**{col: val for col, val in defaults.items() if col not in df.columns})
+        rows = rows[list(defaults)].itertuples(index=False, name=None)
+        amounts = self._format_currency_column(df['amount'] if 'amount' in df.columns else [0] * len(df))
+        for (date, description, account_name, category_name), amount in zip(rows, amounts):
             table_data.append([
-                str(row.get('date', '')),
-                str(row.get('description', ''))[:35],  # Truncate long descriptions
-                self._format_currency(row.get('amount', 0)),
-                str(row.get('account_name', ''))[:15],  # Truncate long account names
-                str(row.get('category_name', ''))[:15]  # Show category
+                str(date),
+                str(description)[:35],  # Truncate long descriptions
+                amount,
+                str(account_name)[:15],  # Truncate long account names
+                str(category_name)[:15]  # Show category
             ])
 
         # Add total row
@@ -167,14 +211,16 @@ CC Payments:         {self._format_currency(metrics['cc_payments'])}
         for row_idx in range(len(table_data) + 1):
             table[(row_idx, 1)].set_text_props(ha='left')
 
-    def _create_balance_chart(self, fig, account_histories: Dict[str, List[Dict]],
+    def _create_balance_chart(self, ax, account_histories: Dict[str, List[Dict]],
                               start_date: datetime, end_date: datetime, month: str):
-        """Create a line chart of cash balances over time."""
-        ax = fig.add_subplot(111)
+        """Create a line chart of cash balances over time on the page's axes."""
+
+        # Month bounds as datetime64 scalars, converted once for all accounts
+        lower = np.datetime64(start_date)
+        upper = np.datetime64(end_date)
 
         # Parse and plot each account
-        all_dates = set()
-        account_data = {}
+        account_series = {}
 
         for account_name, history in account_histories.items():
             # Handle both dict with 'accountSnapshotHistory' key and direct list
@@ -188,43 +234,63 @@ CC Payments:         {self._format_currency(metrics['cc_payments'])}
             if not snapshots:
                 continue
 
-            dates = []
-            balances = []
-
-            for snap in snapshots:
-                date_str = snap.get('date')
-                if date_str:
-                    date = datetime.strptime(date_str, '%Y-%m-%d')
-                    # Filter to the requested month
-                    if start_date <= date <= end_date:
-                        dates.append(date)
-                        balances.append(snap.get('signedBalance', 0))
-                        all_dates.add(date)
-
-            if dates:
-                account_data[account_name] = {'dates': dates, 'balances': balances}
-                ax.plot(dates, balances, marker='.', markersize=3,
-                       label=account_name, alpha=0.7, linewidth=1.5)
+            # Parse all snapshot dates in one call (missing dates become NaT)
+            # and filter to the requested month with a single mask
+            dates = pd.to_datetime([snap.get('date') for snap in snapshots],
+                                   format='%Y-%m-%d', errors='coerce', cache=True)
+            balances = np.array([snap.get('signedBalance', 0) for snap in snapshots],
+                                dtype=np.float64)
+            # NaT compares False, so missing dates drop out of the mask too
+            values = dates.to_numpy()
+            in_range = (values >= lower) & (values <= upper)
+
+            if in_range.any():
+                account_series[account_name] = pd.Series(balances[in_range], index=dates[in_range])
+
+        # Draw every account as one LineCollection (plus one scatter for the
+        # point markers) instead of a Line2D artist per account; colors follow
+        # the axes color cycle and the legend uses proxy handles
+        legend_handles = []
+        rasterize = False
+        if account_series:
+            cycle = to_rgba_array(matplotlib.rcParams['axes.prop_cycle'].by_key()['color'])
+            colors = cycle[np.arange(len(account_series)) % len(cycle)]
+            segments = [np.column_stack([mdates.date2num(series.index.to_pydatetime()), series.to_numpy()])
+                        for series in account_series.values()]
+
+            # Very dense histories are embedded as one raster image (axes,
+            # ticks and text stay vector); below the threshold vector paths
+            # are both smaller and quicker to save
+            points = np.concatenate(segments)
+            rasterize = len(points) > _RASTERIZE_MIN_POINTS
+
+            ax.xaxis_date()
+            ax.add_collection(LineCollection(segments, colors=colors, linewidths=1.5, alpha=0.7,
+                                             rasterized=rasterize))
+            point_colors = np.repeat(colors, [len(segment) for segment in segments], axis=0)
+            ax.scatter(points[:, 0], points[:, 1], c=point_colors, marker='.', s=9, alpha=0.7,
+                       rasterized=rasterize)
+            ax.autoscale_view()
+
+            legend_handles = [
+                Line2D([], [], color=color, marker='.', markersize=3, alpha=0.7,
+                       linewidth=1.5, label=account_name)
+                for account_name, color in zip(account_series, colors)
+            ]
 
         # Calculate and plot total
-        if account_data:
-            # Get all unique dates sorted
-            all_dates_sorted = sorted(all_dates)
-
-            # Calculate total for each date
-            totals = []
-            for date in all_dates_sorted:
-                total = 0
-                for acc_name, data in account_data.items():
-                    # Find balance for this date
-                    for i, d in enumerate(data['dates']):
-                        if d == date:
-                            total += data['balances'][i]
-                            break
-                totals.append(total)
-
-            ax.plot(all_dates_sorted, totals, marker='o', markersize=4,
-                   label='TOTAL', linewidth=2.5, color='black')
+        if account_series:
+            # Align accounts on date and sum across them in one pass; an
+            # account contributes its first snapshot on any given date
+            totals = pd.concat(
+                [series[~series.index.duplicated()] for series in account_series.values()],
+                axis=1
+            ).sort_index().sum(axis=1, min_count=1)
+
+            total_line, = ax.plot(totals.index.to_pydatetime(), totals.to_numpy(), marker='o',
+                                  markersize=4, label='TOTAL', linewidth=2.5, color='black',
+                                  rasterized=rasterize)
+            legend_handles.append(total_line)
 
         ax.set_title(f'Cash Account Balances - {month}', fontsize=14, fontweight='bold')
         ax.set_xlabel('Date')
@@ -233,18 +299,20 @@ CC Payments:         {self._format_currency(metrics['cc_payments'])}
         # Format x-axis
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
         ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=1))
-        plt.xticks(rotation=45, ha='right')
+        for label in ax.get_xticklabels():
+            label.set_rotation(45)
+            label.set_ha('right')
 
         # Format y-axis as currency
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+        ax.yaxis.set_major_formatter(StrMethodFormatter(_CURRENCY_TICK_FORMAT))
 
         # Legend
-        ax.legend(loc='upper left', fontsize=8)
+        ax.legend(handles=legend_handles, loc='upper left', fontsize=8)
 
         # Grid
         ax.grid(True, alpha=0.3)
 
-        plt.tight_layout()
+        ax.figure.tight_layout()
 
     def generate_report(self,
                        filepath: str,
@@ -271,54 +339,63 @@ CC Payments:         {self._format_currency(metrics['cc_payments'])}
             end_date: End date of the report period
             month: Month string for title
         """
+        # One figure is cleared and reused for every page. It is built with
+        # the object-oriented API, so pyplot's global state (backend
+        # selection, figure manager, current figure) is never involved and
+        # PdfPages renders it directly
+        fig = Figure(figsize=(8.5, 11))
         with PdfPages(filepath) as pdf:
             # Page 1: Summary metrics
-            fig = plt.figure(figsize=(8.5, 11))
-            self._create_summary_page(fig, metrics, month)
+            ax = fig.subplots()
+            self._create_summary_page(ax, metrics, month)
 
             # Add cash balance info
-            ax = fig.axes[0]
             if cash_balances.get('start_balance') is not None:
+                # Change is computed once and all three amounts formatted together
+                start_balance = cash_balances['start_balance']
+                end_balance = cash_balances['end_balance']
+                start_text, end_text, change_text = self._format_currency_column(
+                    [start_balance, end_balance, end_balance - start_balance])
                 balance_text = f"""
 Cash Account Balances:
-  Start ({cash_balances.get('start_date', '')}): {self._format_currency(cash_balances['start_balance'])}
-  End ({cash_balances.get('end_date', '')}): {self._format_currency(cash_balances['end_balance'])}
-  Change: {self._format_currency(cash_balances['end_balance'] - cash_balances['start_balance'])}
+  Start ({cash_balances.get('start_date', '')}): {start_text}
+  End ({cash_balances.get('end_date', '')}): {end_text}
+  Change: {change_text}
 """
                 ax.text(0.5, 0.25, balance_text, transform=ax.transAxes,
                        fontsize=11, verticalalignment='center', horizontalalignment='center',
                        fontfamily='monospace')
 
             pdf.savefig(fig, bbox_inches='tight')
-            plt.close(fig)
 
             # Page 2: Income table
-            fig = plt.figure(figsize=(8.5, 11))
+            fig.clf()
+            ax = fig.subplots()
             income_cols = ['category_name', 'actual_amount']
-            self._create_table_page(fig, income_df, 'Income', income_cols)
+            self._create_table_page(ax, income_df, 'Income', income_cols)
             pdf.savefig(fig, bbox_inches='tight')
-            plt.close(fig)
 
             # Page 3: Expenses table
-            fig = plt.figure(figsize=(8.5, 11))
+            fig.clf()
+            ax = fig.subplots()
             expense_cols = ['category_name', 'actual_amount', 'cc_amount', 'cash_amount']
-            self._create_table_page(fig, expense_df, 'Expenses', expense_cols)
+            self._create_table_page(ax, expense_df, 'Expenses', expense_cols)
             pdf.savefig(fig, bbox_inches='tight')
-            plt.close(fig)
 
             # Page 4: Transfer transactions (excluded from expense metrics)
             if transfers_df is not None and not transfers_df.empty:
-                fig = plt.figure(figsize=(8.5, 11))
+                fig.clf()
                 self._create_transfers_page(
-                    fig, transfers_df,
+                    fig.subplots(), transfers_df,
                     'Transfers (Excluded from Expense Metrics)'
                 )
                 pdf.savefig(fig, bbox_inches='tight')
-                plt.close(fig)
 
             # Page 5: Cash balance chart
             if account_histories:
-                fig = plt.figure(figsize=(11, 8.5))  # Landscape for chart
-                self._create_balance_chart(fig, account_histories, start_date, end_date, month)
-                pdf.savefig(fig, bbox_inches='tight')
-                plt.close(fig)
+                fig.clf()
+                fig.set_size_inches(11, 8.5)  # Landscape for chart
+                self._create_balance_chart(fig.subplots(), account_histories, start_date, end_date,
+                                           month)
+                # Resolution of the rasterized chart lines
+                pdf.savefig(fig, bbox_inches='tight', dpi=150)
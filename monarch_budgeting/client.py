@@ -5,9 +5,17 @@ This module provides a convenient interface to the Monarch Money API
 using the monarchmoney library.
 """
 
+import asyncio
+import functools
 import os
-from typing import Optional, List, Dict, Any
+import pickle
+import random
+import re
+import time
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator, Awaitable, Callable
 from datetime import datetime, timedelta
+import aiohttp
+from gql import gql
 from monarchmoney import MonarchMoney
 from monarchmoney.monarchmoney import RequireMFAException, MonarchMoneyEndpoints
 
@@ -15,22 +23,197 @@ from monarchmoney.monarchmoney import RequireMFAException, MonarchMoneyEndpoints
 MonarchMoney.BASE_URL = "https://api.monarch.com"
 MonarchMoneyEndpoints.BASE_URL = "https://api.monarch.com"
 
+try:
+    import orjson
+except ImportError:  # optional: faster decoding of large API responses
+    orjson = None
+
+
+async def _close_borrowed_session(transport) -> None:
+    """Close a transport's session while leaving its shared connector open."""
+    if transport.session is not None:
+        await transport.session.close()
+    transport.session = None
+
+
+def _pooled_graphql_client(mm: MonarchMoney,
+                           connection_pool: Callable[[], aiohttp.TCPConnector]):
+    """
+    The library's GraphQL client for mm, tuned to use a shared connection pool.
+
+    Installed on each MonarchClient's own library client by _new_monarch(),
+    so other MonarchMoney instances keep the library's behaviour.
+    """
+    client = MonarchMoney._get_graphql_client(mm)
+    transport = client.transport
+
+    # Decode responses with orjson when available; large transaction
+    # listings parse several times faster than with stdlib json
+    if orjson is not None:
+        transport.json_deserialize = orjson.loads
+
+    # Compression needs no setup: aiohttp already sends Accept-Encoding
+    # (gzip, deflate, plus br when Brotli is installed) and decodes replies
+
+    # The library opens a new aiohttp session (and TCP + TLS connection) for
+    # every request; borrow the keep-alive connector instead so requests
+    # reuse pooled connections
+    transport.client_session_args = {'connector': connection_pool(), 'connector_owner': False}
+    transport.close = functools.partial(_close_borrowed_session, transport)
+
+    return client
+
+
 # Browser-like User-Agent to avoid Cloudflare blocks on new endpoint
 _BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
+# Seconds that responses are reused before refetching: accounts and budgets
+# follow _CACHE_TTL, the category list changes even more rarely
+_CACHE_TTL = 60.0
+_CATEGORIES_TTL = 300.0
+
+
+# Transient failures (429, 5xx, timeouts, dropped connections) are retried
+# this many times, sleeping _RETRY_BASE_DELAY * 2**attempt seconds (capped at
+# _RETRY_MAX_DELAY, with jitter) between attempts
+_MAX_RETRIES = 3
+_RETRY_BASE_DELAY = 0.1
+_RETRY_MAX_DELAY = 5.0
+
+# After this many consecutive calls fail, calls fail fast for the cooldown
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 30.0
+
+_NETWORK_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+# The library's GetTransactionsList with only the fields the analyzers read;
+# the full query also returns attachments, tags, notes, merchant statistics
+# and review state for every transaction
+_MINIMAL_TRANSACTIONS_QUERY = gql("""
+  query GetTransactionsMinimal($offset: Int, $limit: Int, $filters: TransactionFilterInput, $orderBy: TransactionOrdering) {
+    allTransactions(filters: $filters) {
+      totalCount
+      results(offset: $offset, limit: $limit, orderBy: $orderBy) {
+        id
+        amount
+        date
+        category {
+          id
+          name
+        }
+        account {
+          id
+          displayName
+        }
+      }
+    }
+  }
+""")
+
+
+def _status_of(error: Exception) -> Optional[int]:
+    """HTTP status of a failed request, if the error carries one."""
+    code = getattr(error, 'code', None)
+    if isinstance(code, int):
+        return code
+    match = re.search(r'\b([45]\d\d)\b', str(error))
+    return int(match.group(1)) if match else None
+
+
+def _retry_delay(attempt: int) -> float:
+    """Seconds to wait before retry number attempt (0-based), with jitter."""
+    return min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt) * (0.5 + random.random())
+
+
+def _credit_cards_of(accounts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Select the credit card accounts (type.name is 'credit') from a list."""
+    return [acc for acc in accounts if acc.get('type', {}).get('name') == 'credit']
+
 
 class MonarchClient:
     """Wrapper for Monarch Money API client."""
 
     def __init__(self):
         """Initialize the Monarch Money client."""
-        self.mm = MonarchMoney()
-        # Patch User-Agent to avoid Cloudflare blocks on new API endpoint
-        self.mm._headers["User-Agent"] = _BROWSER_USER_AGENT
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self.mm = self._new_monarch()
         self._authenticated = False
         self._email = None
         self._password = None
         self._mfa_secret = None
+        # Cache key -> (monotonic start time, task for the response)
+        self._cache: Dict[Any, Tuple[float, asyncio.Future]] = {}
+        # (accounts list, its credit card subset) for the cached accounts
+        self._credit_cards: Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = None
+        # Circuit breaker state for _api_call_with_retry
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0
+        # Serializes re-authentication; the epoch counts completed re-auths
+        # so callers whose request failed before the latest one just retry
+        self._auth_lock = asyncio.Lock()
+        self._auth_epoch = 0
+
+    async def _cached(self, key: Any, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the response for key, calling fetch at most once per ttl seconds.
+
+        The request itself is cached as a task, so concurrent callers with
+        the same key await one shared request, even with ttl=0 (which only
+        coalesces requests still in flight). Failed requests are dropped
+        from the cache so the next call retries.
+
+        Args:
+            key: Cache key (method name plus any arguments)
+            ttl: Seconds to reuse the response once it has arrived
+            fetch: Zero-argument coroutine function performing the request
+
+        Returns:
+            The (shared) response
+        """
+        entry = self._cache.get(key)
+        if entry is None or (entry[1].done() and time.monotonic() - entry[0] >= ttl):
+            entry = (time.monotonic(), asyncio.ensure_future(fetch()))
+            self._cache[key] = entry
+
+        try:
+            # Shield so one cancelled caller doesn't cancel the shared request
+            result = await asyncio.shield(entry[1])
+        except Exception:
+            if self._cache.get(key) is entry:
+                del self._cache[key]
+            raise
+
+        # Without a ttl there is nothing to reuse once the request is done
+        if ttl <= 0 and self._cache.get(key) is entry:
+            del self._cache[key]
+        return result
+
+    async def __aenter__(self) -> 'MonarchClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled API connections."""
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+
+    def _new_monarch(self) -> MonarchMoney:
+        """Create a library client wired to this client's connection pool."""
+        mm = MonarchMoney()
+        # Patch User-Agent to avoid Cloudflare blocks on new API endpoint
+        mm._headers["User-Agent"] = _BROWSER_USER_AGENT
+        mm._get_graphql_client = functools.partial(
+            _pooled_graphql_client, mm, self._connection_pool)
+        return mm
+
+    def _connection_pool(self) -> aiohttp.TCPConnector:
+        """Keep-alive connector shared by all GraphQL requests (created on first use)."""
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=60)
+        return self._connector
 
     async def _do_login(self, email: str, password: str,
                         use_saved_session: bool, mfa_secret_key: Optional[str],
@@ -41,6 +224,7 @@ class MonarchClient:
                 email=email,
                 password=password,
                 use_saved_session=use_saved_session,
+                save_session=False,
                 mfa_secret_key=mfa_secret_key
             )
         except RequireMFAException:
@@ -49,10 +233,31 @@ class MonarchClient:
             if not email or not password:
                 raise ValueError("Email and password required for MFA. Set MONARCH_EMAIL and MONARCH_PASSWORD env vars.")
 
-            # Prompt user for MFA code
-            mfa_code = input("Enter MFA code: ").strip()
+            # Prompt user for MFA code in a worker thread, so other tasks on
+            # the event loop keep running while we wait for the user
+            loop = asyncio.get_running_loop()
+            mfa_code = (await loop.run_in_executor(None, input, "Enter MFA code: ")).strip()
             await self.mm.multi_factor_authenticate(email, password, mfa_code)
 
+        self._save_session()
+
+    def _save_session(self) -> None:
+        """
+        Save the auth token to the library's session file.
+
+        Replaces the library's own save, which is skipped after MFA logins
+        (so every run had to repeat MFA) and writes the file in place. The
+        token is written to a private temporary file and moved over the
+        session file, so a crash never leaves a truncated session behind.
+        """
+        path = os.path.abspath(self.mm._session_file)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as fh:
+            pickle.dump({'token': self.mm._token}, fh)
+        os.replace(tmp_path, path)
+
     async def login(self, email: Optional[str] = None, password: Optional[str] = None,
                    use_saved_session: bool = True, mfa_secret_key: Optional[str] = None,
                    prompt_for_mfa: bool = True) -> bool:
@@ -96,38 +301,109 @@ class MonarchClient:
         """Re-authenticate if session has expired (called on 401 errors)."""
         if self._email and self._password:
             print("Session expired, re-authenticating...")
-            # Create new client to clear stale session
-            self.mm = MonarchMoney()
-            self.mm._headers["User-Agent"] = _BROWSER_USER_AGENT
+            # Create new client to clear stale session; the connection pool
+            # carries over, so no new TCP/TLS handshakes are needed
+            self.mm = self._new_monarch()
             await self._do_login(self._email, self._password,
                                use_saved_session=False, mfa_secret_key=self._mfa_secret,
                                prompt_for_mfa=True)
             self._authenticated = True
 
     async def _api_call_with_retry(self, api_func, *args, **kwargs):
-        """Make an API call, retrying with re-auth on 401."""
+        """
+        Make an API call, retrying transient failures with backoff.
+
+        A 401/403 triggers one re-authentication before retrying; when several
+        concurrent calls hit an expired session together, only the first
+        logs in again and the rest retry on its new session. Rate limits
+        (429), server errors (5xx), timeouts and dropped connections are
+        retried up to _MAX_RETRIES times with jittered exponential backoff;
+        any other error is raised straight away. Once _BREAKER_THRESHOLD
+        calls in a row have failed, calls fail fast for _BREAKER_COOLDOWN
+        seconds rather than adding load to a struggling API.
+        """
         from gql.transport.exceptions import TransportServerError
-        try:
-            return await api_func(*args, **kwargs)
-        except TransportServerError as e:
-            if '401' in str(e):
-                await self._ensure_authenticated()
-                return await api_func(*args, **kwargs)
-            raise
 
-    async def get_accounts(self) -> List[Dict[str, Any]]:
-        """Get all accounts."""
+        if time.monotonic() < self._breaker_open_until:
+            raise RuntimeError("Monarch API is failing repeatedly; try again shortly")
+
+        reauthenticated = False
+        attempt = 0
+        while True:
+            epoch_before = self._auth_epoch
+            stale_mm = self.mm
+            try:
+                result = await api_func(*args, **kwargs)
+            except (TransportServerError, *_NETWORK_ERRORS) as e:
+                status = _status_of(e)
+                if status in (401, 403) and not reauthenticated:
+                    reauthenticated = True
+                    async with self._auth_lock:
+                        # Skip if another call re-authenticated since ours failed
+                        if self._auth_epoch == epoch_before:
+                            await self._ensure_authenticated()
+                            self._auth_epoch += 1
+                    # Re-auth replaces self.mm; call the method on the new client
+                    if getattr(api_func, '__self__', None) is stale_mm:
+                        api_func = getattr(self.mm, api_func.__name__)
+                    continue
+
+                transient = (isinstance(e, _NETWORK_ERRORS) or status == 429
+                             or (status is not None and status >= 500))
+                if not transient:
+                    raise
+                if attempt >= _MAX_RETRIES:
+                    self._consecutive_failures += 1
+                    if self._consecutive_failures >= _BREAKER_THRESHOLD:
+                        self._consecutive_failures = 0
+                        self._breaker_open_until = time.monotonic() + _BREAKER_COOLDOWN
+                    raise
+
+                await asyncio.sleep(_retry_delay(attempt))
+                attempt += 1
+                continue
+
+            self._consecutive_failures = 0
+            return result
+
+    async def _cached_accounts(self) -> List[Dict[str, Any]]:
+        """The cached accounts list, refetched once it is older than _CACHE_TTL."""
         if not self._authenticated:
             raise RuntimeError("Must login first")
-        result = await self._api_call_with_retry(self.mm.get_accounts)
-        # API returns {'accounts': [...], 'householdPreferences': ...}
-        return result.get('accounts', [])
 
-    async def get_credit_card_accounts(self) -> List[Dict[str, Any]]:
-        """Get only credit card accounts."""
-        accounts = await self.get_accounts()
-        # type.name is 'credit' for credit cards
-        return [acc for acc in accounts if acc.get('type', {}).get('name') == 'credit']
+        async def fetch():
+            result = await self._api_call_with_retry(self.mm.get_accounts)
+            # API returns {'accounts': [...], 'householdPreferences': ...}
+            return result.get('accounts', [])
+
+        return await self._cached('accounts', _CACHE_TTL, fetch)
+
+    async def get_accounts(self) -> List[Dict[str, Any]]:
+        """Get all accounts (reused for _CACHE_TTL seconds after a fetch)."""
+        # Copy so callers can't alter the cached list
+        return list(await self._cached_accounts())
+
+    async def get_credit_card_accounts(
+        self, accounts: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get only credit card accounts.
+
+        Args:
+            accounts: Already-fetched accounts to filter (optional); when
+                omitted, the client's cached accounts are used
+
+        Returns:
+            List of credit card account dictionaries
+        """
+        if accounts is not None:
+            return _credit_cards_of(accounts)
+
+        accounts = await self._cached_accounts()
+        # Filter once per accounts fetch
+        if self._credit_cards is None or self._credit_cards[0] is not accounts:
+            self._credit_cards = (accounts, _credit_cards_of(accounts))
+        return list(self._credit_cards[1])
 
     async def get_transactions(self, start_date: Optional[datetime] = None,
                               end_date: Optional[datetime] = None,
@@ -148,26 +424,161 @@ class MonarchClient:
         if not self._authenticated:
             raise RuntimeError("Must login first")
 
+        result = await self._fetch_transactions(start_date, end_date, account_ids, limit)
+        return result.get('results', [])
+
+    async def get_transactions_minimal(self, start_date: Optional[datetime] = None,
+                                       end_date: Optional[datetime] = None,
+                                       account_ids: Optional[List[str]] = None,
+                                       limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get transactions with only the fields the analyzers use.
+
+        Takes the same filters as get_transactions(), but each transaction
+        carries just id, amount, date, category (id, name) and account
+        (id, displayName), so large pulls transfer and parse far less data.
+
+        Args:
+            start_date: Start date for transactions
+            end_date: End date for transactions
+            account_ids: List of account IDs to filter by
+            limit: Maximum number of transactions to return
+
+        Returns:
+            List of transaction dictionaries
+        """
+        if not self._authenticated:
+            raise RuntimeError("Must login first")
+
+        result = await self._fetch_transactions(start_date, end_date, account_ids, limit,
+                                                minimal=True)
+        return result.get('results', [])
+
+    async def iter_transactions(self, start_date: Optional[datetime] = None,
+                                end_date: Optional[datetime] = None,
+                                account_ids: Optional[List[str]] = None,
+                                page_size: int = 500,
+                                minimal: bool = False) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Get all matching transactions page by page.
+
+        The request for the next page is started before the current page is
+        handed to the caller, so network time overlaps with processing.
+        get_all_transactions() collects every page into one list.
+
+        Args:
+            start_date: Start date for transactions
+            end_date: End date for transactions
+            account_ids: List of account IDs to filter by
+            page_size: Number of transactions to request per page
+            minimal: Request only the fields get_transactions_minimal() returns
+
+        Yields:
+            Lists of transaction dictionaries, one per non-empty page
+        """
+        if not self._authenticated:
+            raise RuntimeError("Must login first")
+
+        def fetch_page(offset: int) -> asyncio.Future:
+            return asyncio.ensure_future(self._fetch_transactions(
+                start_date, end_date, account_ids, page_size, offset, minimal=minimal))
+
+        offset = 0
+        pending = fetch_page(offset)
+        try:
+            while pending is not None:
+                result = await pending
+                page = result.get('results', [])
+                total = result.get('totalCount')
+                offset += len(page)
+
+                # A short page (or reaching totalCount) means there is nothing left
+                pending = None
+                if len(page) == page_size and (total is None or offset < total):
+                    pending = fetch_page(offset)
+
+                if page:
+                    yield page
+        finally:
+            # Don't leave a prefetch running if the caller stops early
+            if pending is not None:
+                pending.cancel()
+
+    async def get_all_transactions(self, start_date: Optional[datetime] = None,
+                                   end_date: Optional[datetime] = None,
+                                   account_ids: Optional[List[str]] = None,
+                                   page_size: int = 500,
+                                   minimal: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get every matching transaction, however many pages that takes.
+
+        Args:
+            start_date: Start date for transactions
+            end_date: End date for transactions
+            account_ids: List of account IDs to filter by
+            page_size: Number of transactions to request per page
+            minimal: Request only the fields get_transactions_minimal() returns
+
+        Returns:
+            List of transaction dictionaries
+        """
+        return [txn async for page in self.iter_transactions(start_date, end_date, account_ids,
+                                                             page_size, minimal)
+                for txn in page]
+
+    async def _fetch_transactions(self, start_date: Optional[datetime],
+                                  end_date: Optional[datetime],
+                                  account_ids: Optional[List[str]],
+                                  limit: int, offset: int = 0,
+                                  minimal: bool = False) -> Dict[str, Any]:
+        """
+        Request one page of transactions; returns the allTransactions payload.
+
+        With minimal=True, _MINIMAL_TRANSACTIONS_QUERY is sent instead of the
+        library's full transaction query.
+        """
         # Default to last 30 days if no dates provided
         if not start_date:
             start_date = datetime.now() - timedelta(days=30)
         if not end_date:
             end_date = datetime.now()
 
-        result = await self._api_call_with_retry(
-            self.mm.get_transactions,
-            start_date=start_date.strftime('%Y-%m-%d'),
-            end_date=end_date.strftime('%Y-%m-%d'),
-            account_ids=account_ids,
-            limit=limit
-        )
+        if minimal:
+            # Same variables as the library's get_transactions builds
+            result = await self._api_call_with_retry(
+                self.mm.gql_call,
+                operation='GetTransactionsMinimal',
+                graphql_query=_MINIMAL_TRANSACTIONS_QUERY,
+                variables={
+                    'offset': offset,
+                    'limit': limit,
+                    'orderBy': 'date',
+                    'filters': {
+                        'search': '',
+                        'categories': [],
+                        'accounts': account_ids or [],
+                        'tags': [],
+                        'startDate': start_date.strftime('%Y-%m-%d'),
+                        'endDate': end_date.strftime('%Y-%m-%d'),
+                    },
+                }
+            )
+        else:
+            result = await self._api_call_with_retry(
+                self.mm.get_transactions,
+                start_date=start_date.strftime('%Y-%m-%d'),
+                end_date=end_date.strftime('%Y-%m-%d'),
+                account_ids=account_ids,
+                limit=limit,
+                offset=offset
+            )
         # API returns {'allTransactions': {'totalCount': N, 'results': [...]}, ...}
-        return result.get('allTransactions', {}).get('results', [])
+        return result.get('allTransactions', {})
 
     async def get_budgets(self, start_date: Optional[str] = None,
                          end_date: Optional[str] = None) -> Dict[str, Any]:
         """
-        Get budget data.
+        Get budget data (reused for _CACHE_TTL seconds per date range).
 
         Args:
             start_date: Start date in YYYY-MM-DD format
@@ -179,15 +590,51 @@ class MonarchClient:
         if not self._authenticated:
             raise RuntimeError("Must login first")
 
-        return await self._api_call_with_retry(
-            self.mm.get_budgets, start_date=start_date, end_date=end_date
+        return await self._cached(
+            ('budgets', start_date, end_date), _CACHE_TTL,
+            lambda: self._api_call_with_retry(
+                self.mm.get_budgets, start_date=start_date, end_date=end_date
+            )
         )
 
     async def get_transaction_categories(self) -> List[Dict[str, Any]]:
-        """Get all transaction categories."""
+        """Get all transaction categories (reused for _CATEGORIES_TTL seconds after a fetch)."""
         if not self._authenticated:
             raise RuntimeError("Must login first")
-        return await self._api_call_with_retry(self.mm.get_transaction_categories)
+        return await self._cached(
+            'categories', _CATEGORIES_TTL,
+            lambda: self._api_call_with_retry(self.mm.get_transaction_categories)
+        )
+
+    async def fetch_report_inputs(
+        self, start_date: datetime, end_date: datetime, minimal: bool = False
+    ) -> Tuple[List[Dict[str, Any]], Any, List[Dict[str, Any]]]:
+        """
+        Fetch the accounts, categories and transactions of a period concurrently.
+
+        The three requests are independent, so they are issued together with
+        asyncio.gather and the total wait is the slowest round-trip rather
+        than the sum. Transactions are paged through get_all_transactions(),
+        so the whole period is returned. If any request fails, its error is
+        raised.
+
+        Args:
+            start_date: Start date of the report period
+            end_date: End date of the report period
+            minimal: Request only the fields get_transactions_minimal() returns
+
+        Returns:
+            Tuple of (accounts, categories, transactions)
+        """
+        if not self._authenticated:
+            raise RuntimeError("Must login first")
+
+        accounts, categories, transactions = await asyncio.gather(
+            self.get_accounts(),
+            self.get_transaction_categories(),
+            self.get_all_transactions(start_date, end_date, minimal=minimal)
+        )
+        return accounts, categories, transactions
 
     async def get_aggregate_snapshots(self,
                                       start_date: Optional[datetime] = None,
@@ -207,11 +654,17 @@ class MonarchClient:
         if not self._authenticated:
             raise RuntimeError("Must login first")
 
-        return await self._api_call_with_retry(
-            self.mm.get_aggregate_snapshots,
-            start_date=start_date.strftime('%Y-%m-%d') if start_date else None,
-            end_date=end_date.strftime('%Y-%m-%d') if end_date else None,
-            account_type=account_type
+        start = start_date.strftime('%Y-%m-%d') if start_date else None
+        end = end_date.strftime('%Y-%m-%d') if end_date else None
+        # Concurrent identical requests share one round trip
+        return await self._cached(
+            ('aggregate_snapshots', start, end, account_type), 0,
+            lambda: self._api_call_with_retry(
+                self.mm.get_aggregate_snapshots,
+                start_date=start,
+                end_date=end,
+                account_type=account_type
+            )
         )
 
     async def get_account_history(self, account_id: str) -> Dict[str, Any]:
@@ -227,9 +680,13 @@ class MonarchClient:
         if not self._authenticated:
             raise RuntimeError("Must login first")
 
-        return await self._api_call_with_retry(
-            self.mm.get_account_history,
-            account_id=int(account_id)
+        # Concurrent requests for the same account share one round trip
+        return await self._cached(
+            ('account_history', int(account_id)), 0,
+            lambda: self._api_call_with_retry(
+                self.mm.get_account_history,
+                account_id=int(account_id)
+            )
         )
 
     async def get_budget_data(self, month: str) -> Dict[str, Any]:
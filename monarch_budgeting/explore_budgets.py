@@ -11,12 +11,45 @@ Usage:
 """
 
 import asyncio
+import io
 import json
 import os
-from datetime import datetime, timedelta
+import sys
 from pathlib import Path
 
 from .client import MonarchClient
+from .utils import get_current_month_range
+
+try:
+    import orjson
+except ImportError:  # optional: faster serialization of large payloads
+    orjson = None
+
+
+def _write_json(data, f=None) -> None:
+    """
+    Write data as indented JSON to a binary file, or to stdout by default.
+
+    With orjson the document is serialized in one fast pass straight to
+    bytes; otherwise json.dump streams it out chunk by chunk instead of
+    building the whole string first.
+
+    Args:
+        data: JSON-compatible data (other values are written via str())
+        f: Binary file object to write to (defaults to stdout)
+    """
+    if f is None:
+        sys.stdout.flush()
+        f = sys.stdout.buffer
+    if orjson is not None:
+        f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        text = io.TextIOWrapper(f, encoding='utf-8')
+        json.dump(data, text, indent=2, default=str)
+        text.detach()  # flushes, leaving f open
+    if f is sys.stdout.buffer:
+        f.write(b'\n')
+        f.flush()
 
 
 async def explore_budget_data():
@@ -26,62 +59,59 @@ async def explore_budget_data():
     print("=" * 60)
     print()
 
-    # Initialize client
-    client = MonarchClient()
+    # Initialize client; leaving the block closes its pooled connections
+    async with MonarchClient() as client:
+        # Login using env vars
+        print("Logging in...")
+        email = os.getenv('MONARCH_EMAIL')
+        password = os.getenv('MONARCH_PASSWORD')
+        await client.login(email=email, password=password, use_saved_session=True)
+        print("✓ Login successful")
+        print()
 
-    # Login using env vars
-    print("Logging in...")
-    email = os.getenv('MONARCH_EMAIL')
-    password = os.getenv('MONARCH_PASSWORD')
-    await client.login(email=email, password=password, use_saved_session=True)
-    print("✓ Login successful")
-    print()
+        # Calculate current month date range
+        start_of_month, end_of_month = get_current_month_range()
 
-    # Calculate current month date range
-    today = datetime.now()
-    start_of_month = today.replace(day=1)
-    # Get last day of month
-    if today.month == 12:
-        end_of_month = today.replace(year=today.year + 1, month=1, day=1) - timedelta(days=1)
-    else:
-        end_of_month = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
+        start_date = start_of_month.strftime('%Y-%m-%d')
+        end_date = end_of_month.strftime('%Y-%m-%d')
 
-    start_date = start_of_month.strftime('%Y-%m-%d')
-    end_date = end_of_month.strftime('%Y-%m-%d')
+        print(f"Fetching data for: {start_date} to {end_date}")
+        print()
 
-    print(f"Fetching data for: {start_date} to {end_date}")
-    print()
+        # The three requests are independent: issue them together and report
+        # each one's outcome, so one failure doesn't hide the others
+        print("Fetching budgets, transaction categories and sample transactions...")
+        budgets, categories, transactions = await asyncio.gather(
+            client.get_budgets(start_date=start_date, end_date=end_date),
+            client.get_transaction_categories(),
+            client.get_transactions(start_date=start_of_month, end_date=end_of_month, limit=5),
+            return_exceptions=True
+        )
 
-    # Fetch budgets
-    print("Fetching budgets...")
-    try:
-        budgets = await client.get_budgets(start_date=start_date, end_date=end_date)
+    if isinstance(budgets, Exception):
+        print(f"✗ Error fetching budgets: {budgets}")
+        budgets = None
+    else:
         print(f"✓ Got budget data")
         print()
         print("=" * 60)
         print("BUDGET DATA STRUCTURE")
         print("=" * 60)
-        print(json.dumps(budgets, indent=2, default=str))
-    except Exception as e:
-        print(f"✗ Error fetching budgets: {e}")
-        budgets = None
+        _write_json(budgets)
 
     print()
     print()
 
-    # Fetch categories
-    print("Fetching transaction categories...")
-    try:
-        categories = await client.get_transaction_categories()
+    if isinstance(categories, Exception):
+        print(f"✗ Error fetching categories: {categories}")
+        categories = None
+    else:
         print(f"✓ Got category data")
         print()
         print("=" * 60)
         print("CATEGORY DATA STRUCTURE")
         print("=" * 60)
-        print(json.dumps(categories, indent=2, default=str))
-    except Exception as e:
-        print(f"✗ Error fetching categories: {e}")
-        categories = None
+        _write_json(categories)
 
     # Save to files for offline analysis
     output_dir = Path("output")
@@ -89,26 +119,22 @@ async def explore_budget_data():
 
     if budgets:
         budget_file = output_dir / "raw_budget_data.json"
-        with open(budget_file, 'w') as f:
-            json.dump(budgets, f, indent=2, default=str)
+        with open(budget_file, 'wb') as f:
+            _write_json(budgets, f)
         print()
         print(f"✓ Budget data saved to: {budget_file}")
 
     if categories:
         category_file = output_dir / "raw_category_data.json"
-        with open(category_file, 'w') as f:
-            json.dump(categories, f, indent=2, default=str)
+        with open(category_file, 'wb') as f:
+            _write_json(categories, f)
         print(f"✓ Category data saved to: {category_file}")
 
-    # Also fetch a sample transaction to see category structure in transactions
+    # Sample transactions show the category structure within transactions
     print()
-    print("Fetching sample transactions to see category field...")
-    try:
-        transactions = await client.get_transactions(
-            start_date=start_of_month,
-            end_date=end_of_month,
-            limit=5
-        )
+    if isinstance(transactions, Exception):
+        print(f"✗ Error fetching transactions: {transactions}")
+    else:
         print(f"✓ Got {len(transactions)} sample transactions")
         print()
         print("=" * 60)
@@ -116,9 +142,7 @@ async def explore_budget_data():
         print("=" * 60)
         for i, txn in enumerate(transactions[:2]):
             print(f"\n--- Transaction {i+1} ---")
-            print(json.dumps(txn, indent=2, default=str))
-    except Exception as e:
-        print(f"✗ Error fetching transactions: {e}")
+            _write_json(txn)
 
 
 if __name__ == "__main__":
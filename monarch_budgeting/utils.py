@@ -3,10 +3,18 @@ Shared utilities for Monarch Money budgeting tools.
 """
 
 import json
-from datetime import datetime, timedelta
+import os
+from calendar import monthrange
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Dict, Any, Optional, List
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing
+    orjson = None
+
 # Default path for custom budget file
 DEFAULT_CUSTOM_BUDGET_PATH = Path("custom_budget.json")
 
@@ -22,13 +30,15 @@ def format_currency(amount: float, show_sign: bool = False) -> str:
     Returns:
         Formatted currency string (e.g., "$1,234.56" or "-$500.00")
     """
+    # Negation skips the abs() call; f-strings beat a pre-bound str.format here
     if amount < 0:
-        return f"-${abs(amount):,.2f}"
-    elif show_sign and amount > 0:
+        return f"-${-amount:,.2f}"
+    if show_sign and amount > 0:
         return f"+${amount:,.2f}"
     return f"${amount:,.2f}"
 
 
+@lru_cache(maxsize=256)
 def parse_month(month_str: str) -> Tuple[datetime, datetime]:
     """
     Parse month string (YYYY-MM) into start and end dates.
@@ -37,24 +47,14 @@ def parse_month(month_str: str) -> Tuple[datetime, datetime]:
         month_str: Month in YYYY-MM format (e.g., "2026-01")
 
     Returns:
-        Tuple of (start_date, end_date) for the month
+        Tuple of (start_date, end_date) for the month (cached per month_str)
 
     Raises:
         ValueError: If month_str is not in valid format
     """
     try:
         year, month = map(int, month_str.split('-'))
-        start = datetime(year, month, 1)
-
-        # Get last day of month
-        if month == 12:
-            end = datetime(year + 1, 1, 1)
-        else:
-            end = datetime(year, month + 1, 1)
-
-        end = end - timedelta(days=1)
-
-        return start, end
+        return _month_bounds(year, month)
     except (ValueError, AttributeError):
         raise ValueError(f"Invalid month format: {month_str}. Use YYYY-MM (e.g., 2026-01)")
 
@@ -66,16 +66,8 @@ def get_current_month_range() -> Tuple[datetime, datetime]:
     Returns:
         Tuple of (start_date, end_date) for current month
     """
-    today = datetime.now()
-    start_date = datetime(today.year, today.month, 1)
-
-    if today.month == 12:
-        end_date = datetime(today.year + 1, 1, 1)
-    else:
-        end_date = datetime(today.year, today.month + 1, 1)
-
-    end_date = end_date - timedelta(days=1)
-    return start_date, end_date
+    today = date.today()
+    return _month_bounds(today.year, today.month)
 
 
 def get_previous_month_range() -> Tuple[datetime, datetime]:
@@ -85,16 +77,16 @@ def get_previous_month_range() -> Tuple[datetime, datetime]:
     Returns:
         Tuple of (start_date, end_date) for previous month
     """
-    today = datetime.now()
-
+    today = date.today()
     if today.month == 1:
-        start_date = datetime(today.year - 1, 12, 1)
-        end_date = datetime(today.year - 1, 12, 31)
-    else:
-        start_date = datetime(today.year, today.month - 1, 1)
-        end_date = datetime(today.year, today.month, 1) - timedelta(days=1)
+        return _month_bounds(today.year - 1, 12)
+    return _month_bounds(today.year, today.month - 1)
 
-    return start_date, end_date
+
+@lru_cache(maxsize=256)
+def _month_bounds(year: int, month: int) -> Tuple[datetime, datetime]:
+    """First and last day of a month; raises ValueError for an invalid month."""
+    return datetime(year, month, 1), datetime(year, month, monthrange(year, month)[1])
 
 
 def parse_budget_totals(budget_data: Dict[str, Any]) -> Dict[str, float]:
@@ -107,18 +99,14 @@ def parse_budget_totals(budget_data: Dict[str, Any]) -> Dict[str, float]:
     Returns:
         Dict with 'total_income' and 'total_expenses' keys
     """
-    result = {
-        'total_income': 0,
-        'total_expenses': 0,
+    # Missing levels count as zero, so a partial response keeps what it has
+    totals = budget_data.get('totalsByMonth') or [{}]
+    month = totals[0]
+    return {
+        'total_income': month.get('totalIncome', {}).get('plannedAmount', 0),
+        'total_expenses': month.get('totalExpenses', {}).get('plannedAmount', 0),
     }
 
-    totals = budget_data.get('totalsByMonth', [])
-    if totals:
-        result['total_income'] = totals[0].get('totalIncome', {}).get('plannedAmount', 0)
-        result['total_expenses'] = totals[0].get('totalExpenses', {}).get('plannedAmount', 0)
-
-    return result
-
 
 def load_custom_budget(filepath: Optional[Path] = None) -> Dict[str, Any]:
     """
@@ -141,8 +129,19 @@ def load_custom_budget(filepath: Optional[Path] = None) -> Dict[str, Any]:
     if filepath is None:
         filepath = DEFAULT_CUSTOM_BUDGET_PATH
 
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    # Only the file contents are cached (until the file changes); each call
+    # parses its own copy, so callers can modify the returned dict freely
+    stat = os.stat(filepath)
+    data = _read_file_cached(os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=8)
+def _read_file_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    """File contents, cached per (path, modification time, size)."""
+    return Path(path).read_bytes()
 
 
 def get_custom_budget_category_amount(budget: Dict[str, Any], category_name: str) -> float:
@@ -156,16 +155,12 @@ def get_custom_budget_category_amount(budget: Dict[str, Any], category_name: str
     Returns:
         Amount for the category, or 0 if not found
     """
-    # Check expense categories
-    for cat in budget.get('expense_categories', []):
-        if cat.get('name', '').lower() == category_name.lower():
-            return cat.get('amount', 0)
-
-    # Check income categories
-    for cat in budget.get('income_categories', []):
-        if cat.get('name', '').lower() == category_name.lower():
-            return cat.get('amount', 0)
-
+    name = category_name.lower()
+    # Expense categories are checked before income categories
+    for key in ('expense_categories', 'income_categories'):
+        for cat in budget.get(key, []):
+            if cat.get('name', '').lower() == name:
+                return cat.get('amount', 0)
     return 0
 
 
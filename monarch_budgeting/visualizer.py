@@ -4,13 +4,60 @@ Visualization module for budgeting data.
 This module provides plotting functions for income, expenses, and cash flow analysis.
 """
 
+import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any
+import matplotlib
+
+# Charts are rendered straight to PNG, so default to the non-GUI Agg backend
+# rather than paying for an interactive one; MB_BACKEND overrides it (set it
+# empty to keep matplotlib's own choice)
+_BACKEND = os.environ.get('MB_BACKEND', 'Agg')
+if _BACKEND:
+    matplotlib.use(_BACKEND)
+
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.ticker import MaxNLocator
+import numpy as np
 import pandas as pd
-import seaborn as sns
+
+plt.ioff()
+
+
+def _fmt_currency(x: float, pos: Optional[int]) -> str:
+    return f'${x:,.0f}'
+
+
+def _fmt_signed_currency(x: float, pos: Optional[int]) -> str:
+    return f'${x:+,.0f}'
+
+
+# Tick formatters shared by every plot. Neither kind reads state from the
+# axis it is attached to, so one instance can serve any number of axes.
+_DATE_FMT_YM = mdates.DateFormatter('%Y-%m')
+_DATE_FMT_BY = mdates.DateFormatter('%b %Y')
+_CURRENCY_FMT = plt.FuncFormatter(_fmt_currency)
+_CURRENCY_SIGNED_FMT = plt.FuncFormatter(_fmt_signed_currency)
+
+
+@lru_cache(maxsize=32)
+def _card_palette(n: int) -> tuple:
+    """n evenly spaced husl colours, computed once per card count."""
+    # Only needed for the palette; imported here so the module loads without it
+    import seaborn as sns
+    return tuple(sns.color_palette("husl", n))
+
+
+# Shared styling of the end-of-line value labels in plot_cash_flow
+_LABEL_KW = {'xytext': (10, 0), 'textcoords': 'offset points',
+             'fontsize': 10, 'fontweight': 'bold'}
+_LABEL_BBOX = {'boxstyle': 'round,pad=0.3', 'facecolor': 'white', 'alpha': 0.8}
+
+# Above this many points per line, markers are dropped
+_LARGE_SERIES = 500
 
 
 def create_output_dir() -> Path:
@@ -24,20 +71,102 @@ def create_output_dir() -> Path:
 class BudgetVisualizer:
     """Create visualizations for budget and cash flow data."""
 
-    def __init__(self, figsize: tuple = (14, 7)):
+    def __init__(self, figsize: tuple = (14, 7), dpi: int = 150, publication: bool = False):
         """
         Initialize the visualizer.
 
         Args:
             figsize: Figure size as (width, height) in inches
+            dpi: Resolution of saved figures
+            publication: If True, save at 300 dpi with a tight bounding box
+                        (slower to render and encode, larger files)
         """
         self.figsize = figsize
+        self.dpi = dpi
+        self.publication = publication
+
+    @classmethod
+    def set_interactive(cls, backend: str = 'TkAgg') -> None:
+        """
+        Switch to a GUI backend so plots called without save_path are shown.
+
+        Args:
+            backend: Interactive matplotlib backend to use
+        """
+        plt.switch_backend(backend)
+        plt.ion()
+
+    def _axes(self, ax: Optional[plt.Axes]):
+        """
+        Axes for a plot method to draw into.
+
+        Returns (figure, axes, owns_fig). With ax=None a new figure of
+        self.figsize is created and owns_fig is True: the method then lays
+        it out, saves or shows it, and closes it. A caller passing its own
+        axes (e.g. one panel of render_all) keeps control of all three.
+        """
+        if ax is not None:
+            return ax.figure, ax, False
+        fig, ax = plt.subplots(figsize=self.figsize)
+        return fig, ax, True
+
+    @staticmethod
+    def _rotate_date_labels(ax: plt.Axes, owns_fig: bool) -> None:
+        """Slant the x tick labels of a date axis."""
+        if owns_fig:
+            ax.figure.autofmt_xdate(rotation=45)
+        else:
+            # autofmt_xdate adjusts the whole figure and hides the tick
+            # labels of upper subplots, so only touch this axes
+            plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+
+    @staticmethod
+    def _limit_ticks(ax: plt.Axes) -> None:
+        """Cap the tick count; every tick is a handful of artists redrawn per draw."""
+        # minticks=3 lets ~4-year spans fall back to yearly ticks; with the
+        # default of 5 no monthly interval fits under 8 ticks and the locator warns
+        ax.xaxis.set_major_locator(mdates.AutoDateLocator(minticks=3, maxticks=8))
+        ax.yaxis.set_major_locator(MaxNLocator(nbins=6))
+        ax.minorticks_off()
+
+    @staticmethod
+    def _adaptive_style(lines: List[plt.Line2D], n: int) -> None:
+        """
+        Drop the per-point markers of long series: at that density they are
+        unreadable, and each one is drawn as a separate path.
+        """
+        if n <= _LARGE_SERIES:
+            return
+        for line in lines:
+            line.set_marker('')
+
+    def _finish(self, fig: plt.Figure, save_path: Optional[str]) -> None:
+        """Lay out a figure, save it (or show it without save_path), then close it."""
+        fig.tight_layout()
+
+        if save_path:
+            if self.publication:
+                fig.savefig(save_path, dpi=300, bbox_inches='tight')
+            else:
+                # tight_layout already fits the contents, so skip the extra
+                # bbox_inches='tight' render; faster zlib level for PNGs
+                # (PDF/SVG writers reject pil_kwargs)
+                if Path(save_path).suffix.lower() in ('', '.png'):
+                    fig.savefig(save_path, dpi=self.dpi, pil_kwargs={'compress_level': 3})
+                else:
+                    fig.savefig(save_path, dpi=self.dpi)
+            print(f"Plot saved to: {save_path}")
+        else:
+            plt.show()
+
+        plt.close(fig)
 
     def plot_cash_flow(
         self,
         cash_flow_df: pd.DataFrame,
         title: str = "Cash Flow Analysis Over Time",
-        save_path: Optional[str] = None
+        save_path: Optional[str] = None,
+        ax: Optional[plt.Axes] = None
     ) -> None:
         """
         Plot income, expenses, CC expenses, and cash balance over time.
@@ -47,6 +176,7 @@ class BudgetVisualizer:
                          cc_expenses, cash_balance
             title: Plot title
             save_path: Optional path to save the plot (e.g., 'output.png')
+            ax: Optional axes to draw into (see _axes)
 
         The plot shows:
         1. Income (green line)
@@ -59,17 +189,20 @@ class BudgetVisualizer:
             return
 
         # Create figure and axis
-        fig, ax = plt.subplots(figsize=self.figsize)
-
-        # Plot all four lines
-        ax.plot(cash_flow_df['date'], cash_flow_df['income'],
-                'g-', linewidth=2.5, label='Income', marker='o', markersize=6)
-        ax.plot(cash_flow_df['date'], cash_flow_df['total_expenses'],
-                'r-', linewidth=2.5, label='Total Expenses', marker='s', markersize=6)
-        ax.plot(cash_flow_df['date'], cash_flow_df['cc_expenses'],
-                'orange', linewidth=2.5, label='CC Expenses', marker='^', markersize=6)
-        ax.plot(cash_flow_df['date'], cash_flow_df['cash_balance'],
-                'b-', linewidth=2.5, label='Cash Balance', marker='D', markersize=6)
+        fig, ax, owns_fig = self._axes(ax)
+
+        # Plot all four lines with one call (one column per line), then style each
+        dates = cash_flow_df['date'].to_numpy()
+        values = cash_flow_df[['income', 'total_expenses', 'cc_expenses', 'cash_balance']].to_numpy()
+        lines = ax.plot(dates, values, linewidth=2.5, markersize=6)
+        for line, color, marker, label in zip(
+            lines,
+            ('g', 'r', 'orange', 'b'),
+            ('o', 's', '^', 'D'),
+            ('Income', 'Total Expenses', 'CC Expenses', 'Cash Balance')
+        ):
+            line.set(color=color, marker=marker, label=label)
+        self._adaptive_style(lines, len(dates))
 
         # Add zero line for reference
         ax.axhline(y=0, color='k', linestyle='--', alpha=0.3, linewidth=1)
@@ -82,44 +215,25 @@ class BudgetVisualizer:
         ax.grid(True, alpha=0.3, linestyle=':', linewidth=0.8)
 
         # Format x-axis dates
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        fig.autofmt_xdate(rotation=45)
+        ax.xaxis.set_major_formatter(_DATE_FMT_YM)
+        self._limit_ticks(ax)
+        self._rotate_date_labels(ax, owns_fig)
 
         # Format y-axis with currency
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-
-        # Add value labels on the last point of each line
-        for col, label, color in [
-            ('income', 'Income', 'green'),
-            ('total_expenses', 'Total Exp', 'red'),
-            ('cc_expenses', 'CC Exp', 'orange'),
-            ('cash_balance', 'Cash Bal', 'blue')
-        ]:
-            if col in cash_flow_df.columns:
-                last_val = cash_flow_df[col].iloc[-1]
-                last_date = cash_flow_df['date'].iloc[-1]
-                ax.annotate(f'${last_val:,.0f}',
-                           xy=(last_date, last_val),
-                           xytext=(10, 0),
-                           textcoords='offset points',
-                           fontsize=10,
-                           color=color,
-                           fontweight='bold',
-                           bbox=dict(boxstyle='round,pad=0.3',
-                                   facecolor='white',
-                                   edgecolor=color,
-                                   alpha=0.8))
-
-        plt.tight_layout()
-
-        # Save or show
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Plot saved to: {save_path}")
-        else:
-            plt.show()
+        ax.yaxis.set_major_formatter(_CURRENCY_FMT)
+
+        # Add value labels on the last point of each line (the columns of
+        # values are in the order of these colours)
+        last_date = dates[-1]
+        for last_val, color in zip(values[-1], ('green', 'red', 'orange', 'blue')):
+            ax.annotate(f'${last_val:,.0f}',
+                       xy=(last_date, last_val),
+                       color=color,
+                       bbox={**_LABEL_BBOX, 'edgecolor': color},
+                       **_LABEL_KW)
 
-        plt.close()
+        if owns_fig:
+            self._finish(fig, save_path)
 
     def create_summary_table(self, cash_flow_df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -134,53 +248,53 @@ class BudgetVisualizer:
         if cash_flow_df.empty:
             return pd.DataFrame()
 
-        # Calculate derived metrics
-        non_cc_expenses = cash_flow_df['total_expenses'] - cash_flow_df['cc_expenses']
-        net_income = cash_flow_df['income'] - cash_flow_df['total_expenses']
-
-        # Create summary
-        summary = pd.DataFrame({
-            'Metric': [
-                'Total Income',
-                'Total Expenses',
-                'CC Expenses',
-                'Non-CC Expenses',
-                'Average Monthly Income',
-                'Average Monthly Expenses',
-                'Average Monthly CC Expenses',
-                'Average Cash Balance',
-                'Net Income (Total)',
-                'CC % of Total Expenses'
-            ],
-            'Amount': [
-                cash_flow_df['income'].sum(),
-                cash_flow_df['total_expenses'].sum(),
-                cash_flow_df['cc_expenses'].sum(),
-                non_cc_expenses.sum(),
-                cash_flow_df['income'].mean(),
-                cash_flow_df['total_expenses'].mean(),
-                cash_flow_df['cc_expenses'].mean(),
-                cash_flow_df['cash_balance'].mean(),
-                net_income.sum(),
-                (cash_flow_df['cc_expenses'].sum() / cash_flow_df['total_expenses'].sum() * 100)
-                if cash_flow_df['total_expenses'].sum() > 0 else 0
-            ]
-        })
-
-        # Format amounts (except percentage)
-        summary['Amount'] = summary.apply(
-            lambda row: f"{row['Amount']:.1f}%" if row['Metric'] == 'CC % of Total Expenses'
-                       else f"${row['Amount']:,.2f}",
-            axis=1
-        )
-
-        return summary
+        # One aggregation pass yields every sum and mean; the derived
+        # metrics are differences of sums, so no intermediate Series are built
+        columns = ['income', 'total_expenses', 'cc_expenses', 'cash_balance']
+        stats = cash_flow_df[columns].agg(['sum', 'mean'])
+        sums = stats.loc['sum']
+        means = stats.loc['mean']
+        non_cc_expenses = sums['total_expenses'] - sums['cc_expenses']
+        net_income = sums['income'] - sums['total_expenses']
+
+        metrics = [
+            'Total Income',
+            'Total Expenses',
+            'CC Expenses',
+            'Non-CC Expenses',
+            'Average Monthly Income',
+            'Average Monthly Expenses',
+            'Average Monthly CC Expenses',
+            'Average Cash Balance',
+            'Net Income (Total)',
+            'CC % of Total Expenses'
+        ]
+        amounts = [
+            sums['income'],
+            sums['total_expenses'],
+            sums['cc_expenses'],
+            non_cc_expenses,
+            means['income'],
+            means['total_expenses'],
+            means['cc_expenses'],
+            means['cash_balance'],
+            net_income,
+            (sums['cc_expenses'] / sums['total_expenses'] * 100)
+            if sums['total_expenses'] > 0 else 0
+        ]
+
+        # Format amounts as currency, except the final percentage row
+        formatted = [f"${amount:,.2f}" for amount in amounts[:-1]]
+        formatted.append(f"{amounts[-1]:.1f}%")
+
+        return pd.DataFrame({'Metric': metrics, 'Amount': formatted})
 
     def plot_monthly_cc_activity(
         self,
         monthly_data: pd.DataFrame,
         title: str = "Monthly Credit Card Activity",
-        save_path: Optional[str] = None
+        save_path: Optional[str] = None,
+        ax: Optional[plt.Axes] = None
     ) -> None:
         """
         Plot monthly credit card payments and purchases over time as line chart.
@@ -189,35 +303,35 @@ class BudgetVisualizer:
             monthly_data: DataFrame with columns: month, total_payments, total_purchases
             title: Plot title
             save_path: Optional path to save the plot
+            ax: Optional axes to draw into (see _axes)
         """
         if monthly_data.empty:
             print("No monthly data to plot")
             return
 
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax, owns_fig = self._axes(ax)
+
+        # Plain arrays, extracted once and shared by every call below
+        months = monthly_data['month'].to_numpy()
+        payments = monthly_data['total_payments'].to_numpy()
+        purchases = monthly_data['total_purchases'].to_numpy()
+        paid_down = payments >= purchases
 
         # Plot lines
-        ax.plot(monthly_data['month'], monthly_data['total_payments'],
-                'g-', linewidth=2.5, label='Payments', marker='o', markersize=8)
-        ax.plot(monthly_data['month'], monthly_data['total_purchases'],
-                'r-', linewidth=2.5, label='New Purchases', marker='s', markersize=8)
+        lines = ax.plot(months, payments,
+                        'g-', linewidth=2.5, label='Payments', marker='o', markersize=8)
+        lines += ax.plot(months, purchases,
+                         'r-', linewidth=2.5, label='New Purchases', marker='s', markersize=8)
+        self._adaptive_style(lines, len(months))
 
         # Add zero line
         ax.axhline(y=0, color='k', linestyle='--', alpha=0.3)
 
         # Fill between to show net
-        ax.fill_between(monthly_data['month'],
-                       monthly_data['total_payments'],
-                       monthly_data['total_purchases'],
-                       alpha=0.2,
-                       color='green',
-                       where=monthly_data['total_payments'] >= monthly_data['total_purchases'])
-        ax.fill_between(monthly_data['month'],
-                       monthly_data['total_payments'],
-                       monthly_data['total_purchases'],
-                       alpha=0.2,
-                       color='red',
-                       where=monthly_data['total_payments'] < monthly_data['total_purchases'])
+        ax.fill_between(months, payments, purchases,
+                       alpha=0.2, color='green', where=paid_down)
+        ax.fill_between(months, payments, purchases,
+                       alpha=0.2, color='red', where=~paid_down)
 
         # Formatting
         ax.set_xlabel('Month', fontsize=13, fontweight='bold')
@@ -225,35 +339,30 @@ class BudgetVisualizer:
         ax.set_title(title, fontsize=15, fontweight='bold', pad=20)
         ax.legend(loc='best', fontsize=11)
         ax.grid(True, alpha=0.3, linestyle=':')
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-        fig.autofmt_xdate(rotation=45)
+        ax.xaxis.set_major_formatter(_DATE_FMT_BY)
+        self._limit_ticks(ax)
+        ax.yaxis.set_major_formatter(_CURRENCY_FMT)
+        self._rotate_date_labels(ax, owns_fig)
 
         # Add value labels on last points
-        for col, color in [('total_payments', 'green'), ('total_purchases', 'red')]:
-            last_val = monthly_data[col].iloc[-1]
-            last_date = monthly_data['month'].iloc[-1]
+        for values, color in [(payments, 'green'), (purchases, 'red')]:
+            last_val = values[-1]
+            last_date = months[-1]
             ax.annotate(f'${last_val:,.0f}',
                        xy=(last_date, last_val),
                        xytext=(10, 0), textcoords='offset points',
                        fontsize=10, color=color, fontweight='bold')
 
-        plt.tight_layout()
-
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Plot saved to: {save_path}")
-        else:
-            plt.show()
-
-        plt.close()
+        if owns_fig:
+            self._finish(fig, save_path)
 
     def plot_monthly_by_card(
         self,
         monthly_by_card: pd.DataFrame,
         value_col: str = 'total_purchases',
         title: str = "Monthly Purchases by Card",
-        save_path: Optional[str] = None
+        save_path: Optional[str] = None,
+        ax: Optional[plt.Axes] = None
     ) -> None:
         """
         Plot monthly values by credit card as multi-line chart.
@@ -263,24 +372,31 @@ class BudgetVisualizer:
             value_col: Column name to plot
             title: Plot title
             save_path: Optional path to save the plot
+            ax: Optional axes to draw into (see _axes)
         """
         if monthly_by_card.empty:
             print("No data to plot")
             return
 
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax, owns_fig = self._axes(ax)
 
-        # Get unique accounts and create color palette
-        accounts = monthly_by_card['account_name'].unique()
-        colors = sns.color_palette("husl", len(accounts))
+        # One column per account (in order of first appearance), one row per month
+        accounts = monthly_by_card['account_name'].dropna().unique()
+        pivot = monthly_by_card.pivot_table(index='month', columns='account_name',
+                                            values=value_col, aggfunc='sum')
+        pivot = pivot.reindex(columns=accounts)
+        months = pivot.index.to_numpy()
+        colors = _card_palette(len(accounts))
 
         # Plot each account as a line
-        for account, color in zip(accounts, colors):
-            account_data = monthly_by_card[monthly_by_card['account_name'] == account]
+        for account, values, color in zip(accounts, pivot.to_numpy().T, colors):
+            # Skip months the card had no activity so its line stays unbroken
+            active = ~np.isnan(values)
             # Shorten account name for legend
             short_name = account.split('(')[0].strip()[:20]
-            ax.plot(account_data['month'], account_data[value_col],
-                   linewidth=2, label=short_name, marker='o', markersize=6, color=color)
+            lines = ax.plot(months[active], values[active],
+                           linewidth=2, label=short_name, marker='o', markersize=6, color=color)
+            self._adaptive_style(lines, int(active.sum()))
 
         # Formatting
         ax.set_xlabel('Month', fontsize=13, fontweight='bold')
@@ -288,25 +404,20 @@ class BudgetVisualizer:
         ax.set_title(title, fontsize=15, fontweight='bold', pad=20)
         ax.legend(loc='best', fontsize=9, framealpha=0.9)
         ax.grid(True, alpha=0.3, linestyle=':')
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-        fig.autofmt_xdate(rotation=45)
-
-        plt.tight_layout()
-
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Plot saved to: {save_path}")
-        else:
-            plt.show()
+        ax.xaxis.set_major_formatter(_DATE_FMT_BY)
+        self._limit_ticks(ax)
+        ax.yaxis.set_major_formatter(_CURRENCY_FMT)
+        self._rotate_date_labels(ax, owns_fig)
 
-        plt.close()
+        if owns_fig:
+            self._finish(fig, save_path)
 
     def plot_cumulative_net_debt(
         self,
         monthly_data: pd.DataFrame,
         title: str = "Cumulative Net Debt Change Over Time",
-        save_path: Optional[str] = None
+        save_path: Optional[str] = None,
+        ax: Optional[plt.Axes] = None
     ) -> None:
         """
         Plot cumulative net debt change over time.
@@ -315,34 +426,41 @@ class BudgetVisualizer:
             monthly_data: DataFrame with columns: month, net_change
             title: Plot title
             save_path: Optional path to save the plot
+            ax: Optional axes to draw into (see _axes)
         """
         if monthly_data.empty:
             print("No data to plot")
             return
 
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax, owns_fig = self._axes(ax)
 
-        # Calculate cumulative sum
-        df = monthly_data.copy()
-        df['cumulative'] = df['net_change'].cumsum()
+        # Work on plain arrays; the caller's frame is neither copied nor modified
+        months = monthly_data['month'].to_numpy()
+        net_change = monthly_data['net_change'].to_numpy(dtype=np.float64)
+        cumulative = net_change.cumsum()
+        # Computed once; its negation selects the negative stretches
+        positive = cumulative >= 0
 
         # Plot cumulative line
-        ax.plot(df['month'], df['cumulative'],
-               'b-', linewidth=3, marker='o', markersize=8, label='Cumulative Net Change')
+        lines = ax.plot(months, cumulative,
+                       'b-', linewidth=3, marker='o', markersize=8, label='Cumulative Net Change')
+        self._adaptive_style(lines, len(months))
 
         # Fill area under curve
-        ax.fill_between(df['month'], df['cumulative'], 0,
-                       where=df['cumulative'] >= 0, alpha=0.3, color='green')
-        ax.fill_between(df['month'], df['cumulative'], 0,
-                       where=df['cumulative'] < 0, alpha=0.3, color='red')
+        ax.fill_between(months, cumulative, 0,
+                       where=positive, alpha=0.3, color='green')
+        ax.fill_between(months, cumulative, 0,
+                       where=~positive, alpha=0.3, color='red')
 
         # Add monthly change as bars
         ax2 = ax.twinx()
-        colors = ['#2ecc71' if x >= 0 else '#e74c3c' for x in df['net_change']]
-        ax2.bar(df['month'], df['net_change'], width=20, alpha=0.4, color=colors, label='Monthly Change')
+        colors = np.where(net_change >= 0, '#2ecc71', '#e74c3c')
+        # Against a datetime64 array a bare width would be read in the array's
+        # own unit (microseconds), so give the 20 days explicitly
+        ax2.bar(months, net_change, width=np.timedelta64(20, 'D'), alpha=0.4, color=colors, label='Monthly Change')
         ax2.set_ylabel('Monthly Change ($)', fontsize=11, color='gray')
         ax2.tick_params(axis='y', labelcolor='gray')
-        ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:+,.0f}'))
+        ax2.yaxis.set_major_formatter(_CURRENCY_SIGNED_FMT)
 
         # Zero line
         ax.axhline(y=0, color='black', linestyle='-', linewidth=1)
@@ -352,13 +470,14 @@ class BudgetVisualizer:
         ax.set_ylabel('Cumulative Net Change ($)', fontsize=13, fontweight='bold')
         ax.set_title(title, fontsize=15, fontweight='bold', pad=20)
         ax.grid(True, alpha=0.3, linestyle=':')
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:+,.0f}'))
-        fig.autofmt_xdate(rotation=45)
+        ax.xaxis.set_major_formatter(_DATE_FMT_BY)
+        self._limit_ticks(ax)
+        ax.yaxis.set_major_formatter(_CURRENCY_SIGNED_FMT)
+        self._rotate_date_labels(ax, owns_fig)
 
         # Add final value annotation
-        final_val = df['cumulative'].iloc[-1]
-        final_date = df['month'].iloc[-1]
+        final_val = cumulative[-1]
+        final_date = months[-1]
         color = 'green' if final_val >= 0 else 'red'
         ax.annotate(f'${final_val:+,.0f}',
                    xy=(final_date, final_val),
@@ -366,12 +485,37 @@ class BudgetVisualizer:
                    fontsize=12, color=color, fontweight='bold',
                    bbox=dict(boxstyle='round', facecolor='white', edgecolor=color))
 
-        plt.tight_layout()
+        if owns_fig:
+            self._finish(fig, save_path)
 
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Plot saved to: {save_path}")
-        else:
-            plt.show()
+    def render_all(
+        self,
+        monthly_data: pd.DataFrame,
+        monthly_by_card: pd.DataFrame,
+        save_path: Optional[str] = None
+    ) -> None:
+        """
+        Plot the credit card charts as panels of one 2x2 figure.
+
+        Draws monthly activity, cumulative net debt change, and purchases
+        and payments by card, paying for figure setup and saving once
+        instead of once per chart.
+
+        Args:
+            monthly_data: DataFrame with columns: month, total_payments,
+                         total_purchases, net_change
+            monthly_by_card: DataFrame with columns: month, account_name,
+                            total_purchases, total_payments
+            save_path: Optional path to save the figure
+        """
+        width, height = self.figsize
+        fig, axes = plt.subplots(2, 2, figsize=(width * 2, height * 2))
+
+        self.plot_monthly_cc_activity(monthly_data, ax=axes[0, 0])
+        self.plot_cumulative_net_debt(monthly_data, ax=axes[0, 1])
+        self.plot_monthly_by_card(monthly_by_card, value_col='total_purchases',
+                                  title="Monthly Purchases by Card", ax=axes[1, 0])
+        self.plot_monthly_by_card(monthly_by_card, value_col='total_payments',
+                                  title="Monthly Payments by Card", ax=axes[1, 1])
 
-        plt.close()
+        self._finish(fig, save_path)
@@ -110,6 +110,15 @@ def test_analyzer_with_sample_data():
         categorized = analyzer.categorize_transactions()
         print(f"✓ Categorized transactions: {len(categorized['purchases'])} purchases, {len(categorized['payments'])} payments")
 
+        # Modifying one result must not leak into later calls
+        categorized['purchases']['amount'] = 0
+        categorized['payments'].drop(categorized['payments'].index, inplace=True)
+        fresh = analyzer.categorize_transactions()
+        if fresh['purchases']['amount'].sum() != -50.00 or len(fresh['payments']) != 1:
+            print("✗ Changes to categorized results leaked into later calls")
+            return False
+        print("✓ Categorized results are independent copies")
+
         # Test report generation
         report = analyzer.generate_report()
         print("✓ Generated text report successfully")
@@ -122,6 +131,581 @@ def test_analyzer_with_sample_data():
         return False
 
 
+def test_analyzer_without_credit_cards():
+    """Test analyzer report when no credit card accounts exist."""
+    print("\nTesting analyzer without credit card accounts...")
+
+    try:
+        from monarch_budgeting.analyzer import CreditCardAnalyzer
+
+        sample_accounts = [{
+            'id': 'checking-1',
+            'displayName': 'Checking',
+            'currentBalance': 500.00,
+            'type': {'name': 'depository', 'display': 'Cash'}
+        }]
+        sample_transactions = [{
+            'id': 'txn-1',
+            'amount': -25.00,
+            'date': '2025-01-01',
+            'account': {'id': 'checking-1'}
+        }]
+
+        analyzer = CreditCardAnalyzer(
+            transactions=sample_transactions,
+            accounts=sample_accounts
+        )
+
+        report = analyzer.generate_report()
+        if "No credit card accounts found." not in report:
+            print("✗ Report did not mention missing credit cards")
+            return False
+        print("✓ Generated report without credit cards")
+
+        categorized = analyzer.categorize_transactions()
+        if not categorized['purchases'].empty or not categorized['payments'].empty:
+            print("✗ Expected no credit card transactions")
+            return False
+        print("✓ No credit card transactions categorized")
+
+        return True
+    except Exception as e:
+        print(f"✗ Analyzer test without credit cards failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_analyzer_with_missing_balance():
+    """Test analyzer report when a card has no current balance."""
+    print("\nTesting analyzer with a missing card balance...")
+
+    try:
+        from monarch_budgeting.analyzer import CreditCardAnalyzer
+
+        sample_accounts = [
+            {
+                'id': 'cc-1',
+                'displayName': 'Card With Balance',
+                'currentBalance': -300.00,
+                'type': {'name': 'credit', 'display': 'Credit Card'}
+            },
+            {
+                'id': 'cc-2',
+                'displayName': 'Card Without Balance',
+                'currentBalance': None,
+                'type': {'name': 'credit', 'display': 'Credit Card'}
+            }
+        ]
+        sample_transactions = [{
+            'id': 'txn-1',
+            'amount': -25.00,
+            'date': '2025-01-01',
+            'account': {'id': 'cc-2'}
+        }]
+
+        analyzer = CreditCardAnalyzer(
+            transactions=sample_transactions,
+            accounts=sample_accounts
+        )
+
+        report = analyzer.generate_report()
+        if "Card Without Balance: $0.00" not in report:
+            print("✗ Missing balance was not reported as $0.00")
+            return False
+        if "Total Credit Card Debt: $-300.00" not in report:
+            print("✗ Total debt did not treat the missing balance as zero")
+            return False
+        print("✓ Generated report with a missing balance")
+
+        return True
+    except Exception as e:
+        print(f"✗ Analyzer test with missing balance failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_category_map_lookups():
+    """Test that CategoryMap lookups follow changes to the mapping."""
+    print("\nTesting category map lookups...")
+
+    try:
+        from monarch_budgeting.budget_data import Category, CategoryType, parse_categories
+
+        categories = parse_categories({'categories': [
+            {'id': 'cat-1', 'name': 'Groceries', 'group': {'type': 'expense'}},
+            {'id': 'cat-2', 'name': 'Paychecks', 'group': {'type': 'income'}}
+        ]})
+
+        def make(cat_id, name, cat_type=CategoryType.EXPENSE):
+            return Category(id=cat_id, name=name, group_id='', group_name='Other',
+                            category_type=cat_type)
+
+        def expense_ids():
+            return sorted(cat.id for cat in categories.get_by_type(CategoryType.EXPENSE))
+
+        # Build the cached indexes before changing the mapping
+        if categories.get_by_name('groceries') is None or expense_ids() != ['cat-1']:
+            print("✗ Initial lookups failed")
+            return False
+
+        categories['cat-3'] = make('cat-3', 'Dining Out')
+        if categories.get_by_name('dining out') is None or expense_ids() != ['cat-1', 'cat-3']:
+            print("✗ Lookups missed a category added with []=")
+            return False
+        print("✓ Lookups see __setitem__")
+
+        categories.pop('cat-1')
+        if categories.get_by_name('groceries') is not None or expense_ids() != ['cat-3']:
+            print("✗ Lookups still found a popped category")
+            return False
+        print("✓ Lookups see pop")
+
+        categories.update({'cat-4': make('cat-4', 'Gas')})
+        if categories.get_by_name('gas') is None or expense_ids() != ['cat-3', 'cat-4']:
+            print("✗ Lookups missed a category added with update")
+            return False
+        print("✓ Lookups see update")
+
+        categories |= {'cat-5': make('cat-5', 'Bonus', CategoryType.INCOME)}
+        income_ids = sorted(cat.id for cat in categories.get_by_type(CategoryType.INCOME))
+        if categories.get_by_name('bonus') is None or income_ids != ['cat-2', 'cat-5']:
+            print("✗ Lookups missed a category added with |=")
+            return False
+        print("✓ Lookups see |=")
+
+        return True
+    except Exception as e:
+        print(f"✗ Category map test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_batch_metrics():
+    """Test that batch metrics match the per-period calculation."""
+    print("\nTesting batch top-level metrics...")
+
+    try:
+        from dataclasses import asdict
+        from monarch_budgeting.budget_data import TopLevelMetrics
+
+        periods = [
+            (5000.0, 4000.0, 1500.0, 1200.0),
+            (5200.0, 3100.0, 0.0, 800.0),
+            (0.0, 250.0, 250.0, 0.0)
+        ]
+        batch = TopLevelMetrics.calculate_batch(*zip(*periods))
+
+        if len(batch) != len(periods):
+            print(f"✗ Expected {len(periods)} rows, got {len(batch)}")
+            return False
+        for row, values in zip(batch.to_dict('records'), periods):
+            if row != asdict(TopLevelMetrics.calculate(*values)):
+                print(f"✗ Batch row {row} differs from calculate{values}")
+                return False
+        print(f"✓ Batch metrics match calculate() for {len(periods)} periods")
+
+        return True
+    except Exception as e:
+        print(f"✗ Batch metrics test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_typed_test_data():
+    """Test that the typed and streamed dummy data match the dict records."""
+    print("\nTesting typed test data...")
+
+    try:
+        from dataclasses import asdict
+        from test_data import (
+            generate_dummy_accounts, generate_dummy_accounts_typed,
+            generate_dummy_transactions, generate_dummy_transactions_typed,
+            iter_dummy_transactions
+        )
+
+        transactions = generate_dummy_transactions(num_months=3)
+        typed_transactions = generate_dummy_transactions_typed(num_months=3)
+        if [asdict(txn) for txn in typed_transactions] != transactions:
+            print("✗ Typed transactions differ from the dict records")
+            return False
+        print(f"✓ {len(transactions)} typed transactions round-trip to the dict records")
+
+        streamed = list(iter_dummy_transactions(num_months=3))
+        if streamed != transactions:
+            print("✗ Streamed transactions differ from generate_dummy_transactions()")
+            return False
+        if any(txn is cached for txn, cached in zip(streamed, transactions)):
+            print("✗ Streamed transactions reuse the cached dicts")
+            return False
+        print(f"✓ {len(streamed)} streamed transactions match, built fresh")
+
+        accounts = generate_dummy_accounts()
+        typed_accounts = [
+            {
+                'id': acc.id,
+                'displayName': acc.display_name,
+                'currentBalance': acc.current_balance,
+                'displayBalance': acc.display_balance,
+                'isAsset': acc.is_asset,
+                'type': acc.type,
+                'subtype': acc.subtype
+            }
+            for acc in generate_dummy_accounts_typed()
+        ]
+        if typed_accounts != accounts:
+            print("✗ Typed accounts differ from the dict records")
+            return False
+        print(f"✓ {len(accounts)} typed accounts match the dict records")
+
+        return True
+    except Exception as e:
+        print(f"✗ Typed test data test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_client_connection_pool():
+    """Test that API requests borrow the client's pooled connector (no network)."""
+    print("\nTesting client connection pooling...")
+
+    try:
+        import asyncio
+        from monarchmoney import MonarchMoney
+        from monarch_budgeting.client import MonarchClient
+
+        async def run():
+            client = MonarchClient()
+
+            # Each request's transport opens its session on the shared connector
+            for _ in range(2):
+                transport = client.mm._get_graphql_client().transport
+                await transport.connect()
+                if transport.session.connector is not client._connector:
+                    print("✗ Transport did not borrow the pooled connector")
+                    return False
+                await transport.close()
+                if client._connector.closed:
+                    print("✗ Closing a transport closed the pooled connector")
+                    return False
+            print("✓ Transports borrow the pooled connector and leave it open")
+
+            # Only the client's own library instance is patched
+            if MonarchMoney()._get_graphql_client().transport.client_session_args:
+                print("✗ Pooling leaked into other MonarchMoney instances")
+                return False
+            print("✓ Other MonarchMoney instances are unaffected")
+
+            connector = client._connector
+            await client.close()
+            if not connector.closed:
+                print("✗ Closing the client left the connector open")
+                return False
+            print("✓ Closing the client closes the connector")
+            return True
+
+        return asyncio.run(run())
+    except Exception as e:
+        print(f"✗ Client connection pool test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_client_retry_and_breaker():
+    """Test API call retries and the circuit breaker with a stubbed API (no network)."""
+    print("\nTesting client retries and circuit breaker...")
+
+    try:
+        import asyncio
+        from gql.transport.exceptions import TransportServerError
+        from monarch_budgeting import client as client_module
+        from monarch_budgeting.client import MonarchClient
+
+        class FlakyAPI:
+            """Raises the given HTTP errors in turn, then returns 'ok'."""
+            def __init__(self, *codes):
+                self.codes = list(codes)
+                self.calls = 0
+
+            async def fetch(self):
+                self.calls += 1
+                if self.codes:
+                    code = self.codes.pop(0)
+                    raise TransportServerError(f"{code} error", code)
+                return 'ok'
+
+        async def run():
+            client = MonarchClient()
+
+            # A 503 is retried and the next attempt succeeds
+            api = FlakyAPI(503)
+            if await client._api_call_with_retry(api.fetch) != 'ok' or api.calls != 2:
+                print(f"✗ 503 was not retried (calls: {api.calls})")
+                return False
+            print("✓ 503 retried until success")
+
+            # A 400 is not transient, so it is raised without retrying
+            api = FlakyAPI(400)
+            try:
+                await client._api_call_with_retry(api.fetch)
+                print("✗ 400 did not raise")
+                return False
+            except TransportServerError:
+                pass
+            if api.calls != 1:
+                print(f"✗ 400 was retried (calls: {api.calls})")
+                return False
+            print("✓ 400 raised immediately")
+
+            # Calls that exhaust their retries open the breaker, after which
+            # calls fail fast without reaching the API
+            for _ in range(client_module._BREAKER_THRESHOLD):
+                try:
+                    await client._api_call_with_retry(FlakyAPI(*[500] * 10).fetch)
+                    print("✗ Persistent 500 did not raise")
+                    return False
+                except TransportServerError:
+                    pass
+            api = FlakyAPI()
+            try:
+                await client._api_call_with_retry(api.fetch)
+                print("✗ Breaker did not open")
+                return False
+            except RuntimeError:
+                pass
+            if api.calls != 0:
+                print("✗ Open breaker still called the API")
+                return False
+            print(f"✓ Breaker opened after {client_module._BREAKER_THRESHOLD} failed calls")
+
+            # Once the cooldown has passed, calls go through again
+            client._breaker_open_until = 0.0
+            if await client._api_call_with_retry(FlakyAPI().fetch) != 'ok':
+                print("✗ Breaker did not close after the cooldown")
+                return False
+            print("✓ Breaker closed after the cooldown")
+            return True
+
+        # Skip the backoff sleeps
+        retry_delay = client_module._retry_delay
+        client_module._retry_delay = lambda attempt: 0
+        try:
+            return asyncio.run(run())
+        finally:
+            client_module._retry_delay = retry_delay
+    except Exception as e:
+        print(f"✗ Client retry test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_client_reauth_singleflight():
+    """Test that concurrent 401s share one re-login (no network)."""
+    print("\nTesting client re-authentication...")
+
+    try:
+        import asyncio
+        from gql.transport.exceptions import TransportServerError
+        from monarch_budgeting.client import MonarchClient
+
+        class FakeMM:
+            """Library client stub whose session is either expired or valid."""
+            def __init__(self, expired):
+                self.expired = expired
+
+            async def get_accounts(self):
+                await asyncio.sleep(0.01)
+                if self.expired:
+                    raise TransportServerError("401 Unauthorized", 401)
+                return {'accounts': [], 'session': id(self)}
+
+        async def run():
+            client = MonarchClient()
+            client._email, client._password = 'user@example.com', 'secret'
+            logins = []
+
+            async def fake_login(*args, **kwargs):
+                logins.append(args)
+                await asyncio.sleep(0.01)
+
+            client._new_monarch = lambda: FakeMM(expired=False)
+            client._do_login = fake_login
+            client.mm = FakeMM(expired=True)
+
+            # Each call is bound to the stale client, as callers pass it
+            results = await asyncio.gather(*[
+                client._api_call_with_retry(client.mm.get_accounts) for _ in range(5)
+            ])
+            if len(logins) != 1:
+                print(f"✗ Expected one re-login, got {len(logins)}")
+                return False
+            print("✓ Concurrent 401s triggered one re-login")
+
+            if any(result['session'] != id(client.mm) for result in results):
+                print("✗ Retried calls did not use the new session")
+                return False
+            print("✓ Retried calls were rebound to the new session")
+            return True
+
+        return asyncio.run(run())
+    except Exception as e:
+        print(f"✗ Client re-authentication test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_client_transaction_paging():
+    """Test paging through transactions with a stubbed page fetch (no network)."""
+    print("\nTesting client transaction paging...")
+
+    try:
+        import asyncio
+        from monarch_budgeting.client import MonarchClient
+
+        def stub_pages(client, total, report_total=True, block_after_first=False):
+            """Serve `total` transactions; records each requested offset."""
+            offsets = []
+            cancelled = []
+
+            async def fetch(start_date, end_date, account_ids, limit, offset=0, minimal=False):
+                offsets.append(offset)
+                if block_after_first and offset > 0:
+                    try:
+                        await asyncio.sleep(60)
+                    except asyncio.CancelledError:
+                        cancelled.append(offset)
+                        raise
+                await asyncio.sleep(0)
+                result = {'results': [{'id': i} for i in range(offset, min(total, offset + limit))]}
+                if report_total:
+                    result['totalCount'] = total
+                return result
+
+            client._fetch_transactions = fetch
+            return offsets, cancelled
+
+        async def run():
+            client = MonarchClient()
+            client._authenticated = True
+
+            # A short last page ends the paging
+            offsets, _ = stub_pages(client, 250, report_total=False)
+            transactions = await client.get_all_transactions(page_size=100)
+            if [t['id'] for t in transactions] != list(range(250)) or offsets != [0, 100, 200]:
+                print(f"✗ Short last page handled wrongly (offsets: {offsets})")
+                return False
+            print("✓ Paging stops after a short last page")
+
+            # Reaching totalCount ends it without requesting an empty page
+            offsets, _ = stub_pages(client, 200)
+            transactions = await client.get_all_transactions(page_size=100)
+            if len(transactions) != 200 or offsets != [0, 100]:
+                print(f"✗ Paging did not stop at totalCount (offsets: {offsets})")
+                return False
+            print("✓ Paging stops at totalCount")
+
+            # Stopping early cancels the prefetched next page
+            offsets, cancelled = stub_pages(client, 1000, block_after_first=True)
+            pages = client.iter_transactions(page_size=100)
+            async for page in pages:
+                # Let the prefetch of the next page start, then stop
+                await asyncio.sleep(0)
+                break
+            await pages.aclose()
+            await asyncio.sleep(0)
+            if offsets != [0, 100] or cancelled != [100]:
+                print(f"✗ Prefetch was not cancelled (offsets: {offsets}, cancelled: {cancelled})")
+                return False
+            print("✓ Stopping early cancels the prefetch")
+            return True
+
+        return asyncio.run(run())
+    except Exception as e:
+        print(f"✗ Client paging test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_client_response_cache():
+    """Test response caching and request coalescing (no network)."""
+    print("\nTesting client response cache...")
+
+    try:
+        import asyncio
+        from monarch_budgeting.client import MonarchClient
+
+        async def run():
+            client = MonarchClient()
+            calls = []
+
+            async def fetch():
+                calls.append(1)
+                await asyncio.sleep(0.01)
+                return {'call': len(calls)}
+
+            # Concurrent callers share one request
+            first, second = await asyncio.gather(
+                client._cached('key', 60, fetch), client._cached('key', 60, fetch)
+            )
+            if len(calls) != 1 or first != second:
+                print(f"✗ Concurrent requests were not coalesced (calls: {len(calls)})")
+                return False
+            print("✓ Concurrent requests coalesced")
+
+            # Within the ttl the response is reused
+            await client._cached('key', 60, fetch)
+            if len(calls) != 1:
+                print("✗ Cached response was not reused")
+                return False
+            print("✓ Response reused within the ttl")
+
+            # Once the ttl has passed the request is made again
+            await asyncio.sleep(0.02)
+            if (await client._cached('key', 0.01, fetch))['call'] != 2:
+                print("✗ Expired response was not refetched")
+                return False
+            print("✓ Response refetched after the ttl")
+
+            # With no ttl only in-flight requests are shared
+            await client._cached('other', 0, fetch)
+            await client._cached('other', 0, fetch)
+            if len(calls) != 4:
+                print("✗ ttl=0 response was reused after it arrived")
+                return False
+            print("✓ ttl=0 only coalesces in-flight requests")
+
+            # Failures are not cached
+            async def failing():
+                calls.append(1)
+                raise ValueError("boom")
+
+            for _ in range(2):
+                try:
+                    await client._cached('failing', 60, failing)
+                except ValueError:
+                    pass
+            if len(calls) != 6:
+                print("✗ Failed request was cached")
+                return False
+            print("✓ Failed requests are retried")
+            return True
+
+        return asyncio.run(run())
+    except Exception as e:
+        print(f"✗ Client cache test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Running Basic Tests (No Authentication Required)")
@@ -133,6 +717,16 @@ if __name__ == "__main__":
     results.append(("Import Test", test_imports()))
     results.append(("Instantiation Test", test_class_instantiation()))
     results.append(("Analyzer Sample Data Test", test_analyzer_with_sample_data()))
+    results.append(("Analyzer No Credit Cards Test", test_analyzer_without_credit_cards()))
+    results.append(("Analyzer Missing Balance Test", test_analyzer_with_missing_balance()))
+    results.append(("Category Map Test", test_category_map_lookups()))
+    results.append(("Batch Metrics Test", test_batch_metrics()))
+    results.append(("Typed Test Data Test", test_typed_test_data()))
+    results.append(("Client Connection Pool Test", test_client_connection_pool()))
+    results.append(("Client Retry Test",test_client_retry_and_breaker()))
+    results.append(("Client Re-auth Test", test_client_reauth_singleflight()))
+    results.append(("Client Paging Test", test_client_transaction_paging()))
+    results.append(("Client Cache Test", test_client_response_cache()))
 
     print("\n" + "=" * 60)
     print("Test Results:")
@@ -4,224 +4,299 @@ Test data simulating Monarch Money API responses.
 This module provides realistic dummy data for testing without requiring authentication.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import List, Dict, Any, Iterator, Tuple
+
+import numpy as np
+import pandas as pd
+
+from monarch_budgeting.budget_data import _SLOTS
 
 
 def generate_dummy_accounts() -> List[Dict[str, Any]]:
     """
     Generate dummy account data simulating Monarch Money API response.
 
+    The account dicts are built once and shared between calls; copy one
+    before modifying it.
+
     Returns:
         List of account dictionaries
     """
-    return [
-        {
-            'id': 'checking-001',
-            'displayName': 'Chase Checking',
-            'currentBalance': 3500.00,
-            'displayBalance': 3500.00,
-            'isAsset': True,
-            'type': {'name': 'checking', 'display': 'Checking'},
-            'subtype': {'name': 'checking', 'display': 'Checking'}
-        },
-        {
-            'id': 'savings-001',
-            'displayName': 'Ally Savings',
-            'currentBalance': 15000.00,
-            'displayBalance': 15000.00,
-            'isAsset': True,
-            'type': {'name': 'savings', 'display': 'Savings'},
-            'subtype': {'name': 'savings', 'display': 'Savings'}
-        },
-        {
-            'id': 'cc-001',
-            'displayName': 'Chase Sapphire',
-            'currentBalance': -1245.67,
-            'displayBalance': -1245.67,
-            'isAsset': False,
-            'type': {'name': 'credit', 'display': 'Credit Card'},
-            'subtype': {'name': 'credit_card', 'display': 'Credit Card'}
-        },
-        {
-            'id': 'cc-002',
-            'displayName': 'Capital One Quicksilver',
-            'currentBalance': -850.32,
-            'displayBalance': -850.32,
-            'isAsset': False,
-            'type': {'name': 'credit', 'display': 'Credit Card'},
-            'subtype': {'name': 'credit_card', 'display': 'Credit Card'}
-        },
-        {
-            'id': 'cc-003',
-            'displayName': 'Discover It',
-            'currentBalance': 0.00,
-            'displayBalance': 0.00,
-            'isAsset': False,
-            'type': {'name': 'credit', 'display': 'Credit Card'},
-            'subtype': {'name': 'credit_card', 'display': 'Credit Card'}
-        }
-    ]
+    return list(_dummy_accounts())
+
+
+# Account type/subtype dicts, shared by every account of that kind
+_TYPE_CHECKING = {'name': 'checking', 'display': 'Checking'}
+_TYPE_SAVINGS = {'name': 'savings', 'display': 'Savings'}
+_TYPE_CREDIT = {'name': 'credit', 'display': 'Credit Card'}
+_SUBTYPE_CC = {'name': 'credit_card', 'display': 'Credit Card'}
+
+
+def _account(account_id: str, name: str, balance: float, is_asset: bool,
+             account_type: Dict[str, str], subtype: Dict[str, str]) -> Dict[str, Any]:
+    """Account dict in the API's shape; the display balance is the current balance."""
+    return {
+        'id': account_id,
+        'displayName': name,
+        'currentBalance': balance,
+        'displayBalance': balance,
+        'isAsset': is_asset,
+        'type': account_type,
+        'subtype': subtype
+    }
+
+
+@lru_cache(maxsize=1)
+def _dummy_accounts() -> Tuple[Dict[str, Any], ...]:
+    return (
+        _account('checking-001', 'Chase Checking', 3500.00, True, _TYPE_CHECKING, _TYPE_CHECKING),
+        _account('savings-001', 'Ally Savings', 15000.00, True, _TYPE_SAVINGS, _TYPE_SAVINGS),
+        _account('cc-001', 'Chase Sapphire', -1245.67, False, _TYPE_CREDIT, _SUBTYPE_CC),
+        _account('cc-002', 'Capital One Quicksilver', -850.32, False, _TYPE_CREDIT, _SUBTYPE_CC),
+        _account('cc-003', 'Discover It', 0.00, False, _TYPE_CREDIT, _SUBTYPE_CC)
+    )
+
+
+# Nested account/merchant/category dicts are shared by every transaction built
+# from these templates; nothing that reads the test data modifies them
+_CHECKING = {'id': 'checking-001', 'displayName': 'Chase Checking'}
+_CC1 = {'id': 'cc-001', 'displayName': 'Chase Sapphire'}
+_CC2 = {'id': 'cc-002', 'displayName': 'Capital One Quicksilver'}
+_GROCERIES = {'id': 'cat-groceries', 'name': 'Groceries'}
+_INCOME = {'id': 'cat-income', 'name': 'Income'}
+
+
+def _template(amount: float, merchant: str, category: Dict[str, str],
+              account: Dict[str, str], notes: str) -> Dict[str, Any]:
+    """Transaction dict with id and date left to fill in (keeps the key order)."""
+    return {
+        'id': None,
+        'amount': amount,  # Positive = income, negative = expense
+        'date': None,
+        'merchant': {'name': merchant},
+        'category': category,
+        'account': account,
+        'pending': False,
+        'notes': notes
+    }
+
+
+# (id prefix, id suffix, date suffix, template) for the transactions of every
+# month; the month offset goes between the id parts, the month before the date suffix
+_TXN_TEMPLATES = (
+    # Monthly income (paycheck)
+    ('txn-income-', '-1', '-01',
+     _template(5000.00, 'Employer Direct Deposit', _INCOME, _CHECKING, 'Monthly salary')),
+    # Rent (from checking - non-CC expense)
+    ('txn-rent-', '', '-05',
+     _template(-1500.00, 'Landlord LLC', {'id': 'cat-housing', 'name': 'Rent'},
+               _CHECKING, 'Monthly rent')),
+    # Utilities (from checking - non-CC expense)
+    ('txn-utilities-', '', '-08',
+     _template(-120.00, 'Electric Company', {'id': 'cat-utilities', 'name': 'Utilities'},
+               _CHECKING, 'Electric bill')),
+    # Groceries (from CC - CC expense)
+    ('txn-groceries-', '-1', '-10',
+     _template(-300.00, 'Whole Foods', _GROCERIES, _CC1, 'Weekly groceries')),
+    # Groceries (from CC - CC expense)
+    ('txn-groceries-', '-2', '-20',
+     _template(-250.00, 'Trader Joes', _GROCERIES, _CC1, 'Weekly groceries')),
+    # Dining (from CC - CC expense)
+    ('txn-dining-', '-1', '-12',
+     _template(-75.00, 'Restaurant ABC', {'id': 'cat-dining', 'name': 'Dining'},
+               _CC2, 'Dinner')),
+    # Shopping (from CC - CC expense)
+    ('txn-shopping-', '', '-15',
+     _template(-150.00, 'Amazon', {'id': 'cat-shopping', 'name': 'Shopping'},
+               _CC1, 'Online shopping')),
+    # Gas (from checking - non-CC expense)
+    ('txn-gas-', '', '-18',
+     _template(-60.00, 'Shell Gas Station', {'id': 'cat-auto', 'name': 'Auto & Transport'},
+               _CHECKING, 'Gas')),
+    # Credit Card Payment (from checking to CC - positive on checking)
+    ('txn-cc-payment-', '', '-25',
+     _template(-800.00, 'Credit Card Payment', {'id': 'cat-transfer', 'name': 'Transfer'},
+               _CHECKING, 'CC payment')),
+)
+
+# Additional income (bonus, occasional), current month only
+_BONUS_TEMPLATE = ('txn-bonus-', '', '-15',
+                   _template(1000.00, 'Employer Bonus', _INCOME, _CHECKING, 'Performance bonus'))
+
+# The current month has every monthly transaction plus the bonus
+_CURRENT_MONTH_TEMPLATES = _TXN_TEMPLATES + (_BONUS_TEMPLATE,)
 
 
 def generate_dummy_transactions(num_months: int = 6) -> List[Dict[str, Any]]:
     """
     Generate dummy transaction data simulating Monarch Money API response.
 
+    The transactions are built once per day and month count and shared
+    between calls; copy one before modifying it.
+
     Args:
         num_months: Number of months of data to generate
 
     Returns:
         List of transaction dictionaries
     """
-    transactions = []
-    current_date = datetime.now()
+    return list(_dummy_transactions(num_months, date.today()))
+
+
+def iter_dummy_transactions(num_months: int = 6) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the dummy transactions one at a time.
+
+    Same transactions, in the same order, as generate_dummy_transactions(),
+    but each is built as it is consumed and nothing is cached; for large
+    num_months that are iterated once (e.g. pd.DataFrame.from_records).
+
+    Args:
+        num_months: Number of months of data to generate
+
+    Yields:
+        Transaction dictionaries
+    """
+    return _iter_transactions(num_months, date.today())
+
+
+@lru_cache(maxsize=8)
+def _dummy_transactions(num_months: int, today: date) -> Tuple[Dict[str, Any], ...]:
+    # today is part of the cache key so the dates roll over with the calendar
+    return tuple(_iter_transactions(num_months, today))
+
+
+def _iter_transactions(num_months: int, today: date) -> Iterator[Dict[str, Any]]:
+    # 'YYYY-MM' of this month and each month before it, by integer arithmetic
+    month_index = today.year * 12 + today.month - 1
+    month_strs = (f'{i // 12:04d}-{i % 12 + 1:02d}'
+                  for i in range(month_index, month_index - num_months, -1))
 
-    # Account IDs
-    checking_id = 'checking-001'
-    cc1_id = 'cc-001'
-    cc2_id = 'cc-002'
+    # Current month first, then the plain monthly set for every earlier month
+    month_templates = chain((_CURRENT_MONTH_TEMPLATES,), repeat(_TXN_TEMPLATES))
 
     # Generate transactions for each month
-    for month_offset in range(num_months):
-        # Calculate month start date
-        month_date = current_date - timedelta(days=30 * month_offset)
-        month_str = month_date.strftime('%Y-%m')
-
-        # Monthly income (paycheck)
-        transactions.append({
-            'id': f'txn-income-{month_offset}-1',
-            'amount': 5000.00,  # Positive = income
-            'date': f'{month_str}-01',
-            'merchant': {'name': 'Employer Direct Deposit'},
-            'category': {'id': 'cat-income', 'name': 'Income'},
-            'account': {'id': checking_id, 'displayName': 'Chase Checking'},
-            'pending': False,
-            'notes': 'Monthly salary'
-        })
-
-        # Rent (from checking - non-CC expense)
-        transactions.append({
-            'id': f'txn-rent-{month_offset}',
-            'amount': -1500.00,  # Negative = expense
-            'date': f'{month_str}-05',
-            'merchant': {'name': 'Landlord LLC'},
-            'category': {'id': 'cat-housing', 'name': 'Rent'},
-            'account': {'id': checking_id, 'displayName': 'Chase Checking'},
-            'pending': False,
-            'notes': 'Monthly rent'
-        })
-
-        # Utilities (from checking - non-CC expense)
-        transactions.append({
-            'id': f'txn-utilities-{month_offset}',
-            'amount': -120.00,
-            'date': f'{month_str}-08',
-            'merchant': {'name': 'Electric Company'},
-            'category': {'id': 'cat-utilities', 'name': 'Utilities'},
-            'account': {'id': checking_id, 'displayName': 'Chase Checking'},
-            'pending': False,
-            'notes': 'Electric bill'
-        })
-
-        # Groceries (from CC - CC expense)
-        transactions.append({
-            'id': f'txn-groceries-{month_offset}-1',
-            'amount': -300.00,
-            'date': f'{month_str}-10',
-            'merchant': {'name': 'Whole Foods'},
-            'category': {'id': 'cat-groceries', 'name': 'Groceries'},
-            'account': {'id': cc1_id, 'displayName': 'Chase Sapphire'},
-            'pending': False,
-            'notes': 'Weekly groceries'
-        })
-
-        # Groceries (from CC - CC expense)
-        transactions.append({
-            'id': f'txn-groceries-{month_offset}-2',
-            'amount': -250.00,
-            'date': f'{month_str}-20',
-            'merchant': {'name': 'Trader Joes'},
-            'category': {'id': 'cat-groceries', 'name': 'Groceries'},
-            'account': {'id': cc1_id, 'displayName': 'Chase Sapphire'},
-            'pending': False,
-            'notes': 'Weekly groceries'
-        })
-
-        # Dining (from CC - CC expense)
-        transactions.append({
-            'id': f'txn-dining-{month_offset}-1',
-            'amount': -75.00,
-            'date': f'{month_str}-12',
-            'merchant': {'name': 'Restaurant ABC'},
-            'category': {'id': 'cat-dining', 'name': 'Dining'},
-            'account': {'id': cc2_id, 'displayName': 'Capital One Quicksilver'},
-            'pending': False,
-            'notes': 'Dinner'
-        })
-
-        # Shopping (from CC - CC expense)
-        transactions.append({
-            'id': f'txn-shopping-{month_offset}',
-            'amount': -150.00,
-            'date': f'{month_str}-15',
-            'merchant': {'name': 'Amazon'},
-            'category': {'id': 'cat-shopping', 'name': 'Shopping'},
-            'account': {'id': cc1_id, 'displayName': 'Chase Sapphire'},
-            'pending': False,
-            'notes': 'Online shopping'
-        })
-
-        # Gas (from checking - non-CC expense)
-        transactions.append({
-            'id': f'txn-gas-{month_offset}',
-            'amount': -60.00,
-            'date': f'{month_str}-18',
-            'merchant': {'name': 'Shell Gas Station'},
-            'category': {'id': 'cat-auto', 'name': 'Auto & Transport'},
-            'account': {'id': checking_id, 'displayName': 'Chase Checking'},
-            'pending': False,
-            'notes': 'Gas'
-        })
-
-        # Credit Card Payment (from checking to CC - positive on checking)
-        transactions.append({
-            'id': f'txn-cc-payment-{month_offset}',
-            'amount': -800.00,
-            'date': f'{month_str}-25',
-            'merchant': {'name': 'Credit Card Payment'},
-            'category': {'id': 'cat-transfer', 'name': 'Transfer'},
-            'account': {'id': checking_id, 'displayName': 'Chase Checking'},
-            'pending': False,
-            'notes': 'CC payment'
-        })
-
-        # Additional income (bonus, occasional)
-        if month_offset == 0:  # Current month
-            transactions.append({
-                'id': f'txn-bonus-{month_offset}',
-                'amount': 1000.00,
-                'date': f'{month_str}-15',
-                'merchant': {'name': 'Employer Bonus'},
-                'category': {'id': 'cat-income', 'name': 'Income'},
-                'account': {'id': checking_id, 'displayName': 'Chase Checking'},
-                'pending': False,
-                'notes': 'Performance bonus'
-            })
-
-    return transactions
-
-
-def get_test_data() -> Dict[str, Any]:
+    for month_offset, (month_str, templates) in enumerate(zip(month_strs, month_templates)):
+        offset_str = str(month_offset)
+        for id_prefix, id_suffix, date_suffix, template in templates:
+            txn = template.copy()
+            txn['id'] = id_prefix + offset_str + id_suffix
+            txn['date'] = month_str + date_suffix
+            yield txn
+
+
+def generate_dummy_transactions_df(num_months: int = 6) -> pd.DataFrame:
+    """
+    Generate the dummy transactions as a column-oriented DataFrame.
+
+    Same rows, in the same order, as generate_dummy_transactions(), flattened
+    for vectorized use (e.g. df.groupby('category_id')['amount'].sum()).
+
+    Args:
+        num_months: Number of months of data to generate
+
+    Returns:
+        DataFrame with columns: id, amount, date, merchant, category_id,
+        account_id (merchant and the ids as categoricals)
+    """
+    transactions = _dummy_transactions(num_months, date.today())
+    return pd.DataFrame({
+        'id': [t['id'] for t in transactions],
+        'amount': np.array([t['amount'] for t in transactions], dtype=np.float64),
+        'date': pd.to_datetime([t['date'] for t in transactions], format='%Y-%m-%d'),
+        'merchant': pd.Categorical([t['merchant']['name'] for t in transactions]),
+        'category_id': pd.Categorical([t['category']['id'] for t in transactions]),
+        'account_id': pd.Categorical([t['account']['id'] for t in transactions])
+    })
+
+
+@dataclass(frozen=True, **_SLOTS)
+class Account:
+    """Typed form of a dummy account dict."""
+    id: str
+    display_name: str
+    current_balance: float
+    display_balance: float
+    is_asset: bool
+    type: Dict[str, str]
+    subtype: Dict[str, str]
+
+
+@dataclass(frozen=True, **_SLOTS)
+class Transaction:
+    """Typed form of a dummy transaction dict (same field names)."""
+    id: str
+    amount: float
+    date: str
+    merchant: Dict[str, str]
+    category: Dict[str, str]
+    account: Dict[str, str]
+    pending: bool
+    notes: str
+
+
+def generate_dummy_accounts_typed() -> List[Account]:
+    """
+    Generate the dummy accounts as Account records.
+
+    Returns:
+        List of Account objects, in the order of generate_dummy_accounts()
+    """
+    return [
+        Account(
+            id=acc['id'],
+            display_name=acc['displayName'],
+            current_balance=acc['currentBalance'],
+            display_balance=acc['displayBalance'],
+            is_asset=acc['isAsset'],
+            type=acc['type'],
+            subtype=acc['subtype']
+        )
+        for acc in _dummy_accounts()
+    ]
+
+
+def generate_dummy_transactions_typed(num_months: int = 6) -> List[Transaction]:
+    """
+    Generate the dummy transactions as Transaction records.
+
+    Args:
+        num_months: Number of months of data to generate
+
+    Returns:
+        List of Transaction objects, in the order of generate_dummy_transactions()
+    """
+    return [Transaction(**txn) for txn in _dummy_transactions(num_months, date.today())]
+
+
+def get_test_data(format: str = 'records') -> Dict[str, Any]:
     """
     Get complete test dataset for analysis.
 
+    Args:
+        format: 'records' for transactions as a list of API-style dicts,
+                or 'dataframe' for generate_dummy_transactions_df()
+
     Returns:
         Dictionary with 'accounts' and 'transactions' keys
+
+    Raises:
+        ValueError: If format is not 'records' or 'dataframe'
     """
+    if format == 'records':
+        transactions = generate_dummy_transactions(num_months=6)
+    elif format == 'dataframe':
+        transactions = generate_dummy_transactions_df(num_months=6)
+    else:
+        raise ValueError(f"Unknown format: {format}. Use 'records' or 'dataframe'")
+
     return {
         'accounts': generate_dummy_accounts(),
-        'transactions': generate_dummy_transactions(num_months=6)
+        'transactions': transactions
     }
 
 